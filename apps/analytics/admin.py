@@ -0,0 +1,31 @@
+from django.contrib import admin
+
+from .models import DailyEventViews, DailyTraffic
+
+
+@admin.register(DailyTraffic)
+class DailyTrafficAdmin(admin.ModelAdmin):
+    list_display = ("day", "region", "page_views", "unique_visitors")
+    list_filter = ("region",)
+    date_hierarchy = "day"
+    exclude = ("visitors",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(DailyEventViews)
+class DailyEventViewsAdmin(admin.ModelAdmin):
+    list_display = ("day", "region", "event_id", "views")
+    list_filter = ("region",)
+    search_fields = ("event_id",)
+    date_hierarchy = "day"
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,158 @@
+"""
+In-process counter buffer with periodic batched upserts.
+
+Counting a hit is a dict update under a lock: no query, no cache round trip.
+Every ANALYTICS_FLUSH_SECONDS the middleware flushes what has accumulated:
+one INSERT ... ON CONFLICT DO UPDATE per model adds the deltas to the
+stored counters, then HyperLogLog sketches are merged into their rows under
+a row lock. A day's worth of hits on one event is one row, however many
+workers counted it.
+
+Models used with the buffer declare COUNTER_KEY, the fields of their unique
+constraint; every other field must have a default. Counts are per process
+and best effort: a worker that is killed loses at most one interval, and a
+flush that fails is merged back to be retried on the next one.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from .hll import HyperLogLog
+
+logger = logging.getLogger(__name__)
+
+UPSERT_BATCH_SIZE = 500
+
+
+class CounterBuffer:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: dict[tuple, dict[str, int]] = {}
+        self._sketches: dict[tuple, dict[str, HyperLogLog]] = {}
+        self._last_flush = time.monotonic()
+
+    def incr(self, model, key: dict, field: str, amount: int = 1) -> None:
+        entry = (model, tuple(key[name] for name in model.COUNTER_KEY))
+        with self._lock:
+            fields = self._counts.setdefault(entry, {})
+            fields[field] = fields.get(field, 0) + amount
+
+    def add_unique(self, model, key: dict, field: str, hashed: int) -> None:
+        entry = (model, tuple(key[name] for name in model.COUNTER_KEY))
+        with self._lock:
+            self._sketches.setdefault(entry, {}).setdefault(field, HyperLogLog()).add_hash(hashed)
+
+    def flush_due(self) -> bool:
+        return time.monotonic() - self._last_flush >= settings.ANALYTICS_FLUSH_SECONDS
+
+    def _take(self) -> tuple[dict, dict]:
+        with self._lock:
+            counts, sketches = self._counts, self._sketches
+            self._counts, self._sketches = {}, {}
+            self._last_flush = time.monotonic()
+        return counts, sketches
+
+    def _restore(self, counts: dict, sketches: dict) -> None:
+        with self._lock:
+            for entry, fields in counts.items():
+                current = self._counts.setdefault(entry, {})
+                for field, amount in fields.items():
+                    current[field] = current.get(field, 0) + amount
+            for entry, fields in sketches.items():
+                current = self._sketches.setdefault(entry, {})
+                for field, sketch in fields.items():
+                    current[field] = current[field].merge(sketch) if field in current else sketch
+
+    def flush(self) -> int:
+        """
+        Write everything buffered so far. Returns the number of rows touched.
+        """
+        counts, sketches = self._take()
+        if not counts and not sketches:
+            return 0
+
+        # Sketch rows need to exist before they can be locked and merged.
+        for entry in sketches:
+            counts.setdefault(entry, {})
+
+        by_model: dict[type, dict[tuple, dict[str, int]]] = {}
+        for (model, key), fields in counts.items():
+            by_model.setdefault(model, {})[key] = fields
+
+        try:
+            with transaction.atomic():
+                for model, rows in by_model.items():
+                    _upsert_increments(model, rows)
+                # A fixed lock order, so concurrent flushes from two workers cannot deadlock.
+                for (model, key), fields in sorted(sketches.items(), key=lambda item: (item[0][0]._meta.label, item[0][1])):
+                    _merge_sketches(model, key, fields)
+        except Exception:
+            logger.exception("analytics: flush failed; keeping counts for the next attempt")
+            self._restore(
+                {entry: fields for entry, fields in counts.items() if fields},
+                sketches,
+            )
+            return 0
+        return len(counts)
+
+    def flush_if_due(self) -> None:
+        if self.flush_due():
+            self.flush()
+
+
+def _upsert_increments(model, rows: dict[tuple, dict[str, int]]) -> None:
+    """
+    INSERT the rows, or add the deltas to the existing counters on conflict.
+    """
+    ops = connection.ops
+    table = ops.quote_name(model._meta.db_table)
+    fields = [f for f in model._meta.concrete_fields if not f.primary_key]
+    counter_names = sorted({name for deltas in rows.values() for name in deltas})
+
+    columns = ", ".join(ops.quote_name(f.column) for f in fields)
+    conflict = ", ".join(ops.quote_name(model._meta.get_field(name).column) for name in model.COUNTER_KEY)
+    if counter_names:
+        counter_columns = [ops.quote_name(model._meta.get_field(name).column) for name in counter_names]
+        updates = ", ".join(f"{column} = {table}.{column} + EXCLUDED.{column}" for column in counter_columns)
+        on_conflict = f"DO UPDATE SET {updates}"
+    else:
+        on_conflict = "DO NOTHING"
+
+    items = list(rows.items())
+    for start in range(0, len(items), UPSERT_BATCH_SIZE):
+        batch = items[start : start + UPSERT_BATCH_SIZE]
+        params = []
+        for key, deltas in batch:
+            values = dict(zip(model.COUNTER_KEY, key))
+            for f in fields:
+                if f.name in values:
+                    value = values[f.name]
+                elif f.name in deltas:
+                    value = deltas[f.name]
+                elif f.name in counter_names:
+                    value = 0
+                else:
+                    value = f.get_default()
+                params.append(f.get_db_prep_save(value, connection))
+        placeholders = ", ".join([f"({', '.join(['%s'] * len(fields))})"] * len(batch))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) VALUES {placeholders} ON CONFLICT ({conflict}) {on_conflict}",
+                params,
+            )
+
+
+def _merge_sketches(model, key: tuple, fields: dict[str, HyperLogLog]) -> None:
+    row = model.objects.select_for_update().get(**dict(zip(model.COUNTER_KEY, key)))
+    for name, sketch in fields.items():
+        setattr(row, name, HyperLogLog(bytes(getattr(row, name) or b"")).merge(sketch).to_bytes())
+    row.save(update_fields=list(fields))
+
+
+buffer = CounterBuffer()
@@ -0,0 +1,56 @@
+"""
+HyperLogLog: approximate distinct counts in a fixed 4 KB.
+
+With 2^12 registers the standard error is about 1.6%, whatever the number
+of visitors. Two sketches merge by taking the larger of each register, so
+daily sketches roll up into weekly or monthly uniques without keeping any
+visitor ids.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+
+PRECISION = 12
+REGISTERS = 1 << PRECISION
+_ALPHA = 0.7213 / (1 + 1.079 / REGISTERS)
+
+
+def hash64(value: str | bytes) -> int:
+    if isinstance(value, str):
+        value = value.encode()
+    return int.from_bytes(hashlib.blake2b(value, digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    def __init__(self, registers: bytes | None = None):
+        if registers and len(registers) == REGISTERS:
+            self.registers = bytearray(registers)
+        else:
+            self.registers = bytearray(REGISTERS)
+
+    def add_hash(self, hashed: int) -> None:
+        index = hashed >> (64 - PRECISION)
+        rest = hashed & ((1 << (64 - PRECISION)) - 1)
+        rank = (64 - PRECISION) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def add(self, value: str | bytes) -> None:
+        self.add_hash(hash64(value))
+
+    def merge(self, other: HyperLogLog) -> HyperLogLog:
+        self.registers = bytearray(max(a, b) for a, b in zip(self.registers, other.registers))
+        return self
+
+    def count(self) -> int:
+        estimate = _ALPHA * REGISTERS * REGISTERS / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * REGISTERS and zeros:
+            # Small cardinalities: linear counting is more accurate.
+            estimate = REGISTERS * math.log(REGISTERS / zeros)
+        return round(estimate)
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.registers)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+
+from core.edge_cache import is_shareable
+
+from .buffer import buffer
+from .tracking import counted_region, is_bot, record
+
+
+class PageViewMiddleware:
+    """
+    Counts successful public page views into the in-process buffer and
+    flushes it once ANALYTICS_FLUSH_SECONDS have passed.
+
+    Staff sessions and obvious bots are not counted, and neither are
+    shareable pages: their beacon (views.page_view) counts them. Must sit
+    after AuthenticationMiddleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        response = self.get_response(request)
+        region = self._region(request, response)
+        if region and not request.user.is_staff:
+            record(request, region)
+        if settings.ANALYTICS_ENABLED:
+            buffer.flush_if_due()
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        region = self._region(request, response)
+        if region and not (await request.auser()).is_staff:
+            record(request, region)
+        if settings.ANALYTICS_ENABLED and buffer.flush_due():
+            await sync_to_async(buffer.flush)()
+        return response
+
+    def _region(self, request, response) -> str | None:
+        if not settings.ANALYTICS_ENABLED or is_shareable(request) or is_bot(request.META.get("HTTP_USER_AGENT", "")):
+            return None
+        return counted_region(request, response)
@@ -0,0 +1,43 @@
+# Generated by Django 6.0 on 2026-10-19 00:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyEventViews',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('region', models.CharField(choices=[('oxford', 'Oxford'), ('westoxon', 'West Oxfordshire'), ('eastoxon', 'East Oxfordshire'), ('northoxon', 'North Oxfordshire'), ('southoxon', 'South Oxfordshire')], max_length=20)),
+                ('event_id', models.PositiveBigIntegerField()),
+                ('views', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['-day', '-views'],
+                'indexes': [models.Index(fields=['region', 'day'], name='analytics_d_region_a6f23d_idx')],
+                'constraints': [models.UniqueConstraint(fields=('day', 'region', 'event_id'), name='analytics_event_views_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyTraffic',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('region', models.CharField(choices=[('oxford', 'Oxford'), ('westoxon', 'West Oxfordshire'), ('eastoxon', 'East Oxfordshire'), ('northoxon', 'North Oxfordshire'), ('southoxon', 'South Oxfordshire')], max_length=20)),
+                ('page_views', models.PositiveBigIntegerField(default=0)),
+                ('visitors', models.BinaryField(default=bytes)),
+            ],
+            options={
+                'ordering': ['-day', 'region'],
+                'constraints': [models.UniqueConstraint(fields=('day', 'region'), name='analytics_traffic_day_region_uniq')],
+            },
+        ),
+    ]
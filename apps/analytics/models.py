@@ -0,0 +1,62 @@
+from django.db import models
+
+from apps.events.models import EventRegion
+
+from .hll import HyperLogLog
+
+
+class DailyTraffic(models.Model):
+    """
+    Public page views and unique visitors per region and local day.
+
+    ``visitors`` holds HyperLogLog registers; merge days to get weekly or
+    monthly uniques. Written only by the counter buffer's flush.
+    """
+
+    COUNTER_KEY = ("day", "region")
+
+    day = models.DateField()
+    region = models.CharField(max_length=20, choices=EventRegion.choices)
+    page_views = models.PositiveBigIntegerField(default=0)
+    visitors = models.BinaryField(default=bytes)
+
+    class Meta:
+        ordering = ["-day", "region"]
+        constraints = [
+            models.UniqueConstraint(fields=["day", "region"], name="analytics_traffic_day_region_uniq"),
+        ]
+
+    @property
+    def unique_visitors(self) -> int:
+        return HyperLogLog(bytes(self.visitors)).count()
+
+    def __str__(self) -> str:
+        return f"{self.day} {self.region}"
+
+
+class DailyEventViews(models.Model):
+    """
+    Detail page views per event and local day. ``event_id`` is the original
+    Event pk (archived events keep it), not a foreign key, so the counters
+    outlive the hot table.
+    """
+
+    COUNTER_KEY = ("day", "region", "event_id")
+
+    day = models.DateField()
+    region = models.CharField(max_length=20, choices=EventRegion.choices)
+    event_id = models.PositiveBigIntegerField()
+    views = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-day", "-views"]
+        constraints = [
+            models.UniqueConstraint(fields=["day", "region", "event_id"], name="analytics_event_views_uniq"),
+        ]
+        indexes = [
+            # "Most viewed this week" per region.
+            models.Index(fields=["region", "day"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.day} {self.region}:{self.event_id}"
@@ -0,0 +1,81 @@
+"""
+Read side of the counters. Everything here reads the daily tables only.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.db.models import Sum
+from django.utils import timezone
+
+from apps.events.dates import local_timezone
+from apps.events.models import Event, EventStatus
+
+from .hll import HyperLogLog
+from .models import DailyEventViews, DailyTraffic
+
+MOST_VIEWED_CACHE_SECONDS = 600
+
+
+def most_viewed_ids(region: str, days: int = 7, limit: int = 10, today: date | None = None) -> list[tuple[int, int]]:
+    """
+    [(event_id, views)] for the last ``days`` local days, most viewed first.
+    Cached for a few minutes: the counters only move once per flush anyway.
+    """
+    today = today or timezone.localdate(timezone=local_timezone())
+    cache_key = f"analytics:most_viewed:{region}:{today.isoformat()}:{days}:{limit}"
+    ranked = cache.get(cache_key)
+    if ranked is None:
+        ranked = list(
+            DailyEventViews.objects.filter(region=region, day__gt=today - timedelta(days=days))
+            .values("event_id")
+            .annotate(total=Sum("views"))
+            .order_by("-total", "event_id")
+            .values_list("event_id", "total")[:limit]
+        )
+        cache.set(cache_key, ranked, MOST_VIEWED_CACHE_SECONDS)
+    return ranked
+
+
+def most_viewed_events(region: str, days: int = 7, limit: int = 10) -> list[Event]:
+    """
+    The most viewed live events in a region this week, each with ``recent_views`` set.
+    """
+    # Over-fetch: some of the most viewed may since have been cancelled or hidden.
+    ranked = most_viewed_ids(region, days=days, limit=limit * 2)
+    events = (
+        Event.objects.select_related("venue")
+        .filter(region=region, status=EventStatus.APPROVED, is_public=True)
+        .in_bulk([event_id for event_id, _ in ranked])
+    )
+    result = []
+    for event_id, views in ranked:
+        event = events.get(event_id)
+        if event is not None:
+            event.recent_views = views
+            result.append(event)
+    return result[:limit]
+
+
+def unique_visitors(start: date, end: date, region: str | None = None) -> int:
+    """
+    Approximate distinct visitors between two local days (inclusive), by merging daily sketches.
+    """
+    rows = DailyTraffic.objects.filter(day__gte=start, day__lte=end)
+    if region:
+        rows = rows.filter(region=region)
+    merged = HyperLogLog()
+    for visitors in rows.values_list("visitors", flat=True):
+        merged.merge(HyperLogLog(bytes(visitors)))
+    return merged.count()
+
+
+def pages_per_visitor(start: date, end: date, region: str | None = None) -> float | None:
+    rows = DailyTraffic.objects.filter(day__gte=start, day__lte=end)
+    if region:
+        rows = rows.filter(region=region)
+    views = rows.aggregate(total=Sum("page_views"))["total"] or 0
+    visitors = unique_visitors(start, end, region)
+    return views / visitors if visitors else None
@@ -0,0 +1,22 @@
+from django import template
+from django.template.loader import render_to_string
+
+from core.edge_cache import is_shareable
+
+from ..tracking import page_region
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def page_view_beacon(context):
+    """
+    On a counted, shareable page, the beacon that counts each view of it.
+    Other pages are counted by PageViewMiddleware as they are served.
+    """
+    request = context.get("request")
+    region = page_region(request) if request is not None and is_shareable(request) else None
+    if region is None:
+        return ""
+    event_id = getattr(request, "analytics_event_id", None)
+    return render_to_string("analytics/_beacon.html", {"region": region, "event_id": event_id})
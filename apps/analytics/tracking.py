@@ -0,0 +1,81 @@
+"""
+What counts as a page view, and who counts as the same visitor.
+
+Visitors are identified without cookies: a keyed hash of client IP, user
+agent and the current month. The raw values never leave the request, the
+hash cannot be reversed without SECRET_KEY, and it changes every month: the
+daily sketches merge into monthly uniques, but nothing links a visitor
+across months.
+
+Shareable pages (core.edge_cache.is_shareable: no session cookie) may be
+served from the shared cache or a pre-rendered file without reaching
+Django, so they carry a beacon (the page_view_beacon tag) and are counted
+when it fires. PageViewMiddleware counts the rest, signed-in visitors, as
+it serves them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import date
+
+from django.conf import settings
+from django.utils import timezone
+
+from apps.events.dates import local_timezone
+from apps.events.views import NAMESPACE_TO_REGION
+from core.client_identity import get_client_ip
+
+from .buffer import buffer
+from .models import DailyEventViews, DailyTraffic
+
+# Full public pages; partials ("load more") and feeds are not page views.
+COUNTED_URL_NAMES = {
+    "upcoming_events",
+    "past_events",
+    "category_events",
+    "calendar",
+    "calendar_month",
+    "calendar_day",
+    "near_events",
+    "venue_list",
+    "venue_detail",
+    "event_detail",
+}
+BOT_MARKERS = ("bot", "crawl", "spider", "slurp", "preview", "monitor")
+
+
+def is_bot(user_agent: str) -> bool:
+    lowered = user_agent.lower()
+    return not lowered or any(marker in lowered for marker in BOT_MARKERS)
+
+
+def visitor_hash(request, day: date) -> int:
+    raw = f"{day:%Y-%m}|{get_client_ip(request)}|{request.META.get('HTTP_USER_AGENT', '')}"
+    digest = hashlib.blake2b(raw.encode(), digest_size=8, key=settings.SECRET_KEY.encode()[:64]).digest()
+    return int.from_bytes(digest, "big")
+
+
+def page_region(request) -> str | None:
+    """
+    The region a GET of this page counts against, or None if it is not counted.
+    """
+    match = getattr(request, "resolver_match", None)
+    if request.method != "GET" or match is None or match.url_name not in COUNTED_URL_NAMES:
+        return None
+    return NAMESPACE_TO_REGION.get(match.namespace or "")
+
+
+def counted_region(request, response) -> str | None:
+    return page_region(request) if response.status_code == 200 else None
+
+
+def record(request, region: str) -> None:
+    day = timezone.localdate(timezone=local_timezone())
+    key = {"day": day, "region": region}
+    buffer.incr(DailyTraffic, key, "page_views")
+    buffer.add_unique(DailyTraffic, key, "visitors", visitor_hash(request, day))
+
+    event_id = getattr(request, "analytics_event_id", None)
+    if event_id is not None:
+        buffer.incr(DailyEventViews, {**key, "event_id": event_id}, "views")
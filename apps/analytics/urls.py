@@ -0,0 +1,9 @@
+from django.urls import path
+
+from . import views
+
+app_name = "analytics"
+
+urlpatterns = [
+    path("analytics/view/", views.page_view, name="page_view"),
+]
@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.http import HttpResponse
+from django.views.decorators.cache import never_cache
+
+from apps.events.models import EventRegion
+from core.edge_cache import is_shareable
+
+from .tracking import is_bot, record
+
+
+@never_cache
+def page_view(request):
+    """
+    Beacon from a shareable page (see tracking): count one view of it. Sent
+    by the browser, so a page served from a shared copy is still counted.
+    """
+    region = request.GET.get("region")
+    if not settings.ANALYTICS_ENABLED or region not in EventRegion.values:
+        return HttpResponse(status=204)
+    if is_bot(request.META.get("HTTP_USER_AGENT", "")) or (not is_shareable(request) and request.user.is_staff):
+        return HttpResponse(status=204)
+
+    event_id = request.GET.get("event", "")
+    if event_id.isdigit():
+        request.analytics_event_id = int(event_id)
+    record(request, region)
+    return HttpResponse(status=204)
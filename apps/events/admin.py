@@ -1,6 +1,14 @@
-from django.contrib import admin
+import io
 
-from .models import Event, Venue
+from django import forms
+from django.contrib import admin, messages
+
+from apps.moderation.audit import log_series_action
+from apps.moderation.models import ModerationAction
+from core.admin_tools import AutocompleteListFilter, LargeTableAdminMixin
+
+from .imports import ImportFormatError, import_events
+from .models import ArchivedEvent, Event, EventImport, EventImportRow, EventSeries, Venue
 
 
 @admin.register(Venue)
@@ -13,10 +21,146 @@ class VenueAdmin(admin.ModelAdmin):
 
 
 @admin.register(Event)
-class EventAdmin(admin.ModelAdmin):
+class EventAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = ("title", "region", "venue", "start_at", "status", "is_public", "is_featured")
-    list_filter = ("region", "status", "is_public", "is_featured", "category", "venue")
+    list_filter = (
+        "region",
+        "status",
+        "is_public",
+        "is_featured",
+        "category",
+        # Fixed date ranges; date_hierarchy would aggregate distinct dates over the table.
+        ("start_at", admin.DateFieldListFilter),
+        ("venue", AutocompleteListFilter),
+        ("reviewed_by", AutocompleteListFilter),
+    )
+    list_select_related = ("venue",)
     search_fields = ("title", "venue__name", "description")
     prepopulated_fields = {"slug": ("title",)}
-    date_hierarchy = "start_at"
-    autocomplete_fields = ("venue",)
\ No newline at end of file
+    autocomplete_fields = ("venue",)
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # Staff may list a genuine repeat on purpose, so warn rather than block.
+        duplicates = list(Event.live_duplicates([obj.fingerprint], exclude_pk=obj.pk).values_list("pk", flat=True)[:5])
+        if duplicates:
+            self.message_user(
+                request,
+                f"Possible duplicate of event(s) {', '.join(map(str, duplicates))}: same title, venue and start time.",
+                level=messages.WARNING,
+            )
+
+
+@admin.register(EventSeries)
+class EventSeriesAdmin(admin.ModelAdmin):
+    list_display = ("title", "region", "venue", "frequency", "first_start_at", "status", "materialised_until")
+    list_filter = ("region", "status", "frequency")
+    search_fields = ("title", "venue__name")
+    prepopulated_fields = {"slug": ("title",)}
+    autocomplete_fields = ("venue",)
+    readonly_fields = ("materialised_until",)
+    actions = ("approve_series",)
+
+    @admin.action(description="Approve selected series and their pending occurrences")
+    def approve_series(self, request, queryset):
+        occurrences = 0
+        for series in queryset:
+            event_ids = series.approve(request.user)
+            log_series_action(series=series, event_ids=event_ids, action=ModerationAction.APPROVE, actor=request.user)
+            occurrences += len(event_ids)
+        self.message_user(request, f"Approved {queryset.count()} series ({occurrences} occurrence(s)).")
+
+
+@admin.register(ArchivedEvent)
+class ArchivedEventAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ("title", "region", "venue", "start_at", "status", "archived_at")
+    list_filter = (
+        "region",
+        "status",
+        "category",
+        ("start_at", admin.DateFieldListFilter),
+        ("venue", AutocompleteListFilter),
+    )
+    list_select_related = ("venue",)
+    search_fields = ("title", "slug")
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+class EventImportForm(forms.ModelForm):
+    upload = forms.FileField(help_text="CSV with a header row, or a JSON list of objects.")
+
+    class Meta:
+        model = EventImport
+        fields = ("region",)
+
+    def clean_upload(self):
+        upload = self.cleaned_data["upload"]
+        if not upload.name.lower().endswith((".csv", ".json")):
+            raise forms.ValidationError("Upload a .csv or .json file.")
+        return upload
+
+
+class EventImportRowInline(admin.TabularInline):
+    model = EventImportRow
+    fields = ("line", "title", "venue_slug", "start_at", "error", "event")
+    readonly_fields = fields
+    can_delete = False
+    extra = 0
+    max_num = 0
+    show_change_link = False
+
+    def get_queryset(self, request):
+        # Only the rows that need fixing; a 5,000-row programme stays readable.
+        return super().get_queryset(request).exclude(error="")
+
+
+@admin.register(EventImport)
+class EventImportAdmin(admin.ModelAdmin):
+    list_display = ("__str__", "region", "uploaded_by", "created_at", "total_rows", "imported_rows", "failed_rows")
+    list_filter = ("region",)
+    readonly_fields = ("filename", "uploaded_by", "total_rows", "imported_rows", "failed_rows", "merged_at")
+    inlines = (EventImportRowInline,)
+
+    def get_form(self, request, obj=None, **kwargs):
+        if obj is None:
+            kwargs["form"] = EventImportForm
+        return super().get_form(request, obj, **kwargs)
+
+    def get_fields(self, request, obj=None):
+        if obj is None:
+            return ("region", "upload")
+        return ("region", *self.readonly_fields)
+
+    def get_readonly_fields(self, request, obj=None):
+        return ("region", *self.readonly_fields) if obj else ()
+
+    def get_inlines(self, request, obj):
+        return self.inlines if obj else ()
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def save_model(self, request, obj, form, change):
+        upload = form.cleaned_data["upload"]
+        obj.uploaded_by = request.user
+        obj.filename = upload.name[:255]
+        super().save_model(request, obj, form, change)
+
+        fmt = "json" if upload.name.lower().endswith(".json") else "csv"
+        try:
+            import_events(obj, io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline=""), fmt)
+        except (ImportFormatError, UnicodeDecodeError) as exc:
+            self.message_user(request, f"Import failed: {exc}", level=messages.ERROR)
+            return
+
+        level = messages.WARNING if obj.failed_rows else messages.SUCCESS
+        self.message_user(
+            request,
+            f"Imported {obj.imported_rows} of {obj.total_rows} row(s) as pending events; {obj.failed_rows} failed.",
+            level=level,
+        )
@@ -5,4 +5,7 @@ class EventsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.events"
     label = "events"
-    verbose_name = "Events"
\ No newline at end of file
+    verbose_name = "Events"
+
+    def ready(self):
+        from . import signals  # noqa: F401
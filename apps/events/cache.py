@@ -0,0 +1,61 @@
+"""
+Per-region cache generations.
+
+Anything derived from a region's public listings (facet counts, calendars,
+fragments) is cached under a key that embeds the region's current
+generation. Publishing, editing or moderating an event bumps the
+generation, which orphans every old key at once: no key scanning, no
+explicit deletes. Orphans simply age out of the cache.
+
+Generations only invalidate across workers because CACHES is shared (Redis
+or the database cache table); with a per-process cache a bump in one worker
+would leave the others serving their copies until the entries time out.
+"""
+
+from __future__ import annotations
+
+from django.core.cache import cache
+
+from .models import EventRegion
+
+GENERATION_KEY = "events:generation:{region}"
+
+
+def _generation_key(region: str) -> str:
+    return GENERATION_KEY.format(region=region)
+
+
+def region_generation(region: str) -> int:
+    return cache.get_or_set(_generation_key(region), 1, timeout=None)
+
+
+def region_generations(regions) -> dict[str, int]:
+    """
+    Several regions' generations in one cache round trip (plus one per region never cached).
+    """
+    keys = {_generation_key(region): region for region in regions}
+    found = cache.get_many(keys)
+    generations = {keys[key]: value for key, value in found.items()}
+    for key in keys.keys() - found.keys():
+        generations[keys[key]] = cache.get_or_set(key, 1, timeout=None)
+    return generations
+
+
+async def aregion_generation(region: str) -> int:
+    return await cache.aget_or_set(_generation_key(region), 1, timeout=None)
+
+
+def bump_region_generation(*regions: str) -> None:
+    for region in regions or EventRegion.values:
+        key = _generation_key(region)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Never cached (or evicted): any value other than the old one works,
+            # but start above the default so stale "1" keys are never reused.
+            cache.set(key, 2, timeout=None)
+
+
+def region_cache_key(region: str, generation: int, *parts) -> str:
+    suffix = ":".join(str(p) for p in parts)
+    return f"events:{region}:g{generation}:{suffix}"
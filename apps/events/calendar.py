@@ -0,0 +1,91 @@
+"""
+Month calendar aggregates for a region.
+
+A month grid only needs, per local day, how many events there are and the
+first few titles. One windowed query over Event.start_at returns exactly
+that (at most TOP_TITLES_PER_DAY rows per day, each carrying the day's
+total), so a busy month never loads every event. Days are Europe/London
+days, not UTC ones: a 23:30 BST gig belongs on the day it happens.
+"""
+
+from __future__ import annotations
+
+import calendar as pycalendar
+from datetime import date
+
+from django.core.cache import cache
+from django.db.models import Count, F, Window
+from django.db.models.functions import RowNumber, TruncDate
+
+from .cache import aregion_generation, region_cache_key
+from .dates import local_day_start, local_timezone
+
+TOP_TITLES_PER_DAY = 3
+CALENDAR_CACHE_SECONDS = 600
+
+
+def month_bounds(year: int, month: int):
+    first = date(year, month, 1)
+    following = date(year + (month == 12), month % 12 + 1, 1)
+    return local_day_start(first), local_day_start(following)
+
+
+def _day_rows(qs, year: int, month: int):
+    start, end = month_bounds(year, month)
+    local_day = TruncDate("start_at", tzinfo=local_timezone())
+
+    return (
+        qs.filter(start_at__gte=start, start_at__lt=end)
+        .annotate(
+            day=local_day,
+            day_rank=Window(RowNumber(), partition_by=[local_day], order_by=[F("start_at").asc(), F("pk").asc()]),
+            day_count=Window(Count("pk"), partition_by=[local_day]),
+        )
+        .filter(day_rank__lte=TOP_TITLES_PER_DAY)
+        .values("day", "day_count", "title", "slug", "start_at")
+        .order_by("day", "day_rank")
+    )
+
+
+def _summarise(rows) -> dict:
+    days: dict[date, dict] = {}
+    for row in rows:
+        day = days.setdefault(row["day"], {"count": row["day_count"], "events": []})
+        day["events"].append({"title": row["title"], "slug": row["slug"], "start_at": row["start_at"]})
+    return days
+
+
+async def amonth_summary(region: str, qs, year: int, month: int) -> dict:
+    """
+    {local date: {"count": n, "events": [top N {title, slug, start_at}]}}, cached per generation.
+    """
+    key = region_cache_key(region, await aregion_generation(region), "calendar", f"{year:04d}-{month:02d}")
+    summary = await cache.aget(key)
+    if summary is None:
+        summary = _summarise([row async for row in _day_rows(qs, year, month)])
+        await cache.aset(key, summary, CALENDAR_CACHE_SECONDS)
+    return summary
+
+
+def month_grid(year: int, month: int, summary: dict) -> list[list[dict]]:
+    """
+    Weeks (Monday first) of day cells for the template.
+    """
+    weeks = []
+    for week in pycalendar.Calendar(firstweekday=0).monthdatescalendar(year, month):
+        cells = []
+        for day in week:
+            info = summary.get(day, {}) if day.month == month else {}
+            count = info.get("count", 0)
+            events = info.get("events", [])
+            cells.append(
+                {
+                    "date": day,
+                    "in_month": day.month == month,
+                    "count": count,
+                    "events": events,
+                    "more": count - len(events),
+                }
+            )
+        weeks.append(cells)
+    return weeks
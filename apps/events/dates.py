@@ -0,0 +1,29 @@
+"""
+Local-time helpers.
+
+The project stores and renders in UTC (settings.TIME_ZONE), but "which day is
+this event on" is a question about Oxfordshire wall-clock time, so anything
+that groups or filters by date uses EVENTS_LOCAL_TIME_ZONE instead.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+
+
+def local_timezone() -> ZoneInfo:
+    return ZoneInfo(settings.EVENTS_LOCAL_TIME_ZONE)
+
+
+def local_day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=local_timezone())
+
+
+def local_day_end(day: date) -> datetime:
+    """
+    Exclusive upper bound: local midnight at the start of the next day.
+    """
+    return local_day_start(day + timedelta(days=1))
@@ -0,0 +1,63 @@
+"""
+Facet counts for the public listing filters.
+
+All three facets (category, town, week) come from one GROUP BY over the
+region's upcoming events and are rolled up in Python, so the sidebar costs
+one query per region generation rather than one COUNT per option.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db.models import Count
+from django.db.models.functions import TruncWeek
+
+from .cache import aregion_generation, region_cache_key
+from .dates import local_timezone
+from .models import EventCategory
+
+# Upcoming counts drift as events start, so even an unchanged generation expires.
+FACET_CACHE_SECONDS = 300
+
+
+def _facet_rows(qs):
+    return (
+        qs.annotate(week=TruncWeek("start_at", tzinfo=local_timezone()))
+        .values("category", "venue__town", "week")
+        .annotate(n=Count("pk"))
+        .order_by()
+    )
+
+
+def _rollup(rows) -> dict:
+    categories: Counter = Counter()
+    towns: Counter = Counter()
+    weeks: Counter = Counter()
+
+    for row in rows:
+        categories[row["category"]] += row["n"]
+        if row["venue__town"]:
+            towns[row["venue__town"]] += row["n"]
+        weeks[row["week"].date()] += row["n"]
+
+    labels = dict(EventCategory.choices)
+    return {
+        "categories": [(value, labels.get(value, value), n) for value, n in sorted(categories.items())],
+        "towns": sorted(towns.items()),
+        "weeks": [(start, start + timedelta(days=6), n) for start, n in sorted(weeks.items())],
+    }
+
+
+async def aupcoming_facets(region: str, qs) -> dict:
+    """
+    Facets for a region's unfiltered upcoming listing, cached per generation.
+    """
+    key = region_cache_key(region, await aregion_generation(region), "facets")
+    facets = await cache.aget(key)
+    if facets is None:
+        facets = _rollup([row async for row in _facet_rows(qs)])
+        await cache.aset(key, facets, FACET_CACHE_SECONDS)
+    return facets
@@ -0,0 +1,41 @@
+"""
+Content fingerprints for duplicate detection.
+
+Two listings are "the same event" when they are in the same region, at the
+same venue, start in the same minute and have the same title once case,
+accents, punctuation and spacing are ignored. Event.fingerprint stores a
+hash of exactly that, so every duplicate check (public submission, admin,
+legacy import, moderation queue) is one lookup on an indexed column instead
+of a title/start_at scan.
+
+Only live events (pending or approved) count as duplicates: a rejected or
+cancelled listing should not block a corrected resubmission. The index on
+the column is partial to match.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+from datetime import datetime, timezone as dt_timezone
+
+FINGERPRINT_LENGTH = 32
+LIVE_STATUSES = ("pending", "approved")
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalise_title(title: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", title or "")
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(_NON_WORD.sub(" ", stripped.casefold()).split())
+
+
+def event_fingerprint(region: str, title: str, venue_id: int | None, start_at: datetime | None) -> str:
+    if venue_id is None or start_at is None:
+        return ""
+    start_minute = start_at.astimezone(dt_timezone.utc).strftime("%Y-%m-%dT%H:%M")
+    raw = "|".join((region, normalise_title(title), str(venue_id), start_minute))
+    return hashlib.blake2b(raw.encode(), digest_size=FINGERPRINT_LENGTH // 2).hexdigest()
+
@@ -1,7 +1,9 @@
 from django import forms
 from django.utils import timezone
 
-from .models import Event, Venue
+from .dates import local_day_end, local_day_start
+from .fingerprints import event_fingerprint
+from .models import Event, EventCategory, Venue
 
 
 class VenueForm(forms.ModelForm):
@@ -64,4 +66,75 @@ class EventForm(forms.ModelForm):
             cleaned["cancelled_at"] = None
             cleaned["cancellation_note"] = ""
 
-        return cleaned
\ No newline at end of file
+        venue = cleaned.get("venue")
+        if start_at and venue and cleaned.get("title") and cleaned.get("region"):
+            fingerprint = event_fingerprint(cleaned["region"], cleaned["title"], venue.pk, start_at)
+            duplicate = Event.live_duplicates([fingerprint], exclude_pk=self.instance.pk).first()
+            if duplicate:
+                raise forms.ValidationError(
+                    "“%(title)s” is already listed at this venue at that time.",
+                    code="duplicate",
+                    params={"title": duplicate.title},
+                )
+
+        return cleaned
+
+
+class EventFilterForm(forms.Form):
+    """
+    Public listing filters (GET). Invalid fields are dropped rather than
+    failing the whole page, so a bad bookmark still shows events.
+    """
+
+    town = forms.CharField(required=False, max_length=120)
+    category = forms.ChoiceField(required=False, choices=[("", "Any category"), *EventCategory.choices])
+    date_from = forms.DateField(required=False, widget=forms.DateInput(attrs={"type": "date"}))
+    date_to = forms.DateField(required=False, widget=forms.DateInput(attrs={"type": "date"}))
+    featured = forms.BooleanField(required=False)
+
+    def clean(self):
+        cleaned = super().clean()
+
+        date_from = cleaned.get("date_from")
+        date_to = cleaned.get("date_to")
+
+        if date_from and date_to and date_to < date_from:
+            self.add_error("date_to", "End date must be on or after the start date.")
+
+        return cleaned
+
+    def active_filters(self) -> dict:
+        """
+        Valid, non-empty filters as query-string values (for "Load more" links).
+        A partly invalid form keeps its valid fields (see the class docstring).
+        """
+        if not self.is_bound:
+            return {}
+        # Runs validation; invalid fields are left out of cleaned_data.
+        self.is_valid()
+        active = {}
+        for name, value in self.cleaned_data.items():
+            if value in (None, "", False):
+                continue
+            active[name] = "1" if value is True else str(value)
+        return active
+
+    def filter_queryset(self, qs):
+        if not self.is_bound:
+            return qs
+        # Runs validation; invalid fields are left out of cleaned_data.
+        self.is_valid()
+        data = self.cleaned_data
+
+        if data.get("town"):
+            qs = qs.filter(venue__town=data["town"])
+        if data.get("category"):
+            qs = qs.filter(category=data["category"])
+        if data.get("date_from"):
+            qs = qs.filter(start_at__gte=local_day_start(data["date_from"]))
+        if data.get("date_to"):
+            qs = qs.filter(start_at__lt=local_day_end(data["date_to"]))
+        if data.get("featured"):
+            qs = qs.filter(is_featured=True)
+
+        return qs
@@ -0,0 +1,132 @@
+"""
+Offline geo helpers for "near me" search (no PostGIS).
+
+Venues store a geohash alongside latitude/longitude. A radius query first
+prefilters on the geohash cells covering the search circle (an indexed
+prefix match) and then refines the handful of candidates with the
+haversine distance in Python.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+
+EARTH_RADIUS_MILES = 3958.8
+
+GEOHASH_PRECISION = 9
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Approximate cell size (height, width) in miles for each geohash length.
+_CELL_MILES = {
+    1: (3100.0, 3100.0),
+    2: (390.0, 780.0),
+    3: (97.0, 97.0),
+    4: (12.1, 24.3),
+    5: (3.0, 3.0),
+    6: (0.38, 0.76),
+}
+
+
+def geohash_encode(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    bits, bit_count, even = 0, 0, True
+    chars = []
+
+    while len(chars) < precision:
+        rng, value = (lng_range, lng) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits, bit_count = 0, 0
+
+    return "".join(chars)
+
+
+def geohash_decode(geohash: str) -> tuple[float, float, float, float]:
+    """
+    Returns (lat, lng, lat_error, lng_error) for the centre of the cell.
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    even = True
+
+    for char in geohash:
+        value = _BASE32.index(char)
+        for shift in range(4, -1, -1):
+            rng = lng_range if even else lat_range
+            mid = (rng[0] + rng[1]) / 2
+            if value >> shift & 1:
+                rng[0] = mid
+            else:
+                rng[1] = mid
+            even = not even
+
+    return (
+        (lat_range[0] + lat_range[1]) / 2,
+        (lng_range[0] + lng_range[1]) / 2,
+        (lat_range[1] - lat_range[0]) / 2,
+        (lng_range[1] - lng_range[0]) / 2,
+    )
+
+
+def neighbours(geohash: str) -> set[str]:
+    """
+    The cell and its eight neighbours (same precision).
+    """
+    lat, lng, lat_err, lng_err = geohash_decode(geohash)
+    cells = set()
+    for dlat in (-1, 0, 1):
+        for dlng in (-1, 0, 1):
+            n_lat = max(min(lat + dlat * 2 * lat_err, 89.999999), -89.999999)
+            n_lng = (lng + dlng * 2 * lng_err + 180) % 360 - 180
+            cells.add(geohash_encode(n_lat, n_lng, len(geohash)))
+    return cells
+
+
+def covering_cells(lat: float, lng: float, radius_miles: float) -> set[str]:
+    """
+    Geohash prefixes whose union covers the circle: the longest precision
+    whose cells are at least as big as the radius, plus its neighbours.
+    """
+    # Cells narrow towards the poles: scale the width by cos(latitude).
+    shrink = math.cos(math.radians(lat))
+    precision = 1
+    for length, (height, width) in sorted(_CELL_MILES.items()):
+        if min(height, width * shrink) >= radius_miles:
+            precision = length
+    return neighbours(geohash_encode(lat, lng, precision))
+
+
+def haversine_miles(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = math.radians(lat2 - lat1)
+    dlambda = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a))
+
+
+_POSTCODE_RE = re.compile(r"[^A-Z0-9]")
+
+
+def normalise_postcode(postcode: str) -> str:
+    """
+    "ox1 4au" -> "OX1 4AU"; outward-code only input ("ox1") is kept as is.
+    """
+    compact = _POSTCODE_RE.sub("", (postcode or "").upper())
+    if len(compact) > 4:
+        return f"{compact[:-3]} {compact[-3:]}"
+    return compact
+
+
+def outward_code(postcode: str) -> str:
+    return normalise_postcode(postcode).split(" ")[0]
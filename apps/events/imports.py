@@ -0,0 +1,348 @@
+"""
+Bulk event imports: stage, validate in SQL, merge.
+
+An upload (CSV with a header row, or a JSON list of objects, using the
+COLUMNS below) is parsed in chunks and streamed into EventImportRow with
+COPY FROM STDIN on PostgreSQL (bulk_create elsewhere). Only what has to
+happen in Python happens per row: parsing dates and booleans, resolving
+venue slugs (one query per chunk) and computing fingerprints.
+
+The EventForm.clean rules then run as a handful of UPDATE statements over
+the whole batch: unknown venue or category, end not after start, duplicates
+of live events or of an earlier row, and the cancellation defaults. Valid
+rows go into Event with one INSERT ... SELECT ... ON CONFLICT (slug) DO
+NOTHING, whose RETURNING id, slug links each staging row to its event on
+PostgreSQL; rows that lost the slug race are marked too, so every line
+either links to its new event or carries an error.
+
+Imported events are pending and go through the moderation queue like any
+other submission.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+
+from django.db import connection, transaction
+from django.db.models import Exists, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Concat, Left
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.text import slugify
+
+from .cache import bump_region_generation
+from .dates import local_timezone
+from .fingerprints import LIVE_STATUSES, event_fingerprint
+from .models import Event, EventCategory, EventImport, EventImportRow, EventStatus, Venue
+
+COLUMNS = (
+    "title",
+    "slug",
+    "venue",
+    "category",
+    "start_at",
+    "end_at",
+    "description",
+    "is_cancelled",
+    "cancelled_at",
+    "cancellation_note",
+)
+CHUNK_SIZE = 1000
+MAX_ERROR_LENGTH = 255
+
+TRUE_VALUES = {"1", "true", "yes", "y", "t"}
+FALSE_VALUES = {"", "0", "false", "no", "n", "f"}
+
+STAGING_COLUMNS = (
+    "batch_id",
+    "line",
+    "title",
+    "slug",
+    "venue_slug",
+    "venue_id",
+    "category",
+    "start_at",
+    "end_at",
+    "is_cancelled",
+    "cancelled_at",
+    "cancellation_note",
+    "description",
+    "fingerprint",
+    "error",
+)
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+def read_records(stream, fmt: str) -> Iterator[tuple[int, dict]]:
+    """
+    Yield (line number, record) from a text stream. CSV line numbers count the header.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        missing = {"title", "venue", "start_at"} - set(reader.fieldnames or ())
+        if missing:
+            raise ImportFormatError(f"CSV header is missing: {', '.join(sorted(missing))}.")
+        for record in reader:
+            yield reader.line_num, record
+    elif fmt == "json":
+        try:
+            records = json.load(stream)
+        except ValueError as exc:
+            raise ImportFormatError(f"Invalid JSON: {exc}") from exc
+        if not isinstance(records, list):
+            raise ImportFormatError("JSON upload must be a list of objects.")
+        for index, record in enumerate(records, start=1):
+            yield index, record if isinstance(record, dict) else {}
+    else:
+        raise ImportFormatError(f"Unknown format {fmt!r}; use csv or json.")
+
+
+def _text(record: dict, key: str) -> str:
+    value = record.get(key)
+    return "" if value is None else str(value).strip()
+
+
+def _datetime(value: str, field: str) -> datetime | None:
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        raise ValueError(f"{field}: not a date and time ({value[:40]}).")
+    if timezone.is_naive(parsed):
+        # Programmes are written in local wall-clock time.
+        parsed = timezone.make_aware(parsed, local_timezone())
+    return parsed
+
+
+def _boolean(value: str, field: str) -> bool:
+    lowered = value.lower()
+    if lowered in TRUE_VALUES:
+        return True
+    if lowered in FALSE_VALUES:
+        return False
+    raise ValueError(f"{field}: expected yes or no ({value[:20]}).")
+
+
+def _stage_row(batch: EventImport, line: int, record: dict) -> EventImportRow:
+    row = EventImportRow(
+        batch=batch,
+        line=line,
+        title=_text(record, "title")[:255],
+        slug=_text(record, "slug")[:255],
+        venue_slug=_text(record, "venue")[:255],
+        category=_text(record, "category")[:30],
+        cancellation_note=_text(record, "cancellation_note")[:500],
+        description=_text(record, "description"),
+    )
+    try:
+        if len(_text(record, "title")) > 255:
+            raise ValueError("title: longer than 255 characters.")
+        row.start_at = _datetime(_text(record, "start_at"), "start_at")
+        row.end_at = _datetime(_text(record, "end_at"), "end_at")
+        row.cancelled_at = _datetime(_text(record, "cancelled_at"), "cancelled_at")
+        row.is_cancelled = _boolean(_text(record, "is_cancelled"), "is_cancelled")
+    except ValueError as exc:
+        row.error = str(exc)[:MAX_ERROR_LENGTH]
+        return row
+
+    if not row.title:
+        row.error = "title: required."
+    elif not row.venue_slug:
+        row.error = "venue: required."
+    elif row.start_at is None:
+        row.error = "start_at: required."
+    return row
+
+
+def _prepare_chunk(batch: EventImport, chunk: list[tuple[int, dict]], venues: dict[str, int]) -> list[EventImportRow]:
+    rows = [_stage_row(batch, line, record) for line, record in chunk]
+
+    unseen = {row.venue_slug for row in rows if row.venue_slug and row.venue_slug not in venues}
+    if unseen:
+        venues.update(Venue.objects.filter(slug__in=unseen).values_list("slug", "pk"))
+
+    for row in rows:
+        row.venue_id = venues.get(row.venue_slug)
+        if not row.slug and row.title and row.start_at:
+            # Repeated shows share a title, so key generated slugs on the local date too.
+            day = row.start_at.astimezone(local_timezone()).date().isoformat()
+            row.slug = f"{slugify(row.title)[:240] or 'event'}-{day}"
+        row.slug = slugify(row.slug)[:255]
+        row.fingerprint = event_fingerprint(batch.region, row.title, row.venue_id, row.start_at)
+    return rows
+
+
+def _copy_value(value) -> str:
+    if value is None:
+        return r"\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _copy_rows(rows: list[EventImportRow]) -> None:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_copy_value(getattr(row, column)) for column in STAGING_COLUMNS])
+    buffer.seek(0)
+
+    table = connection.ops.quote_name(EventImportRow._meta.db_table)
+    columns = ", ".join(connection.ops.quote_name(column) for column in STAGING_COLUMNS)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
+
+
+def stage(batch: EventImport, records: Iterable[tuple[int, dict]], chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Load records into the staging table. Returns the number of rows staged.
+    """
+    use_copy = connection.vendor == "postgresql"
+    venues: dict[str, int] = {}
+    total = 0
+    chunk: list[tuple[int, dict]] = []
+
+    def flush():
+        rows = _prepare_chunk(batch, chunk, venues)
+        if use_copy:
+            _copy_rows(rows)
+        else:
+            EventImportRow.objects.bulk_create(rows)
+        chunk.clear()
+        return len(rows)
+
+    for item in records:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            total += flush()
+    if chunk:
+        total += flush()
+
+    EventImport.objects.filter(pk=batch.pk).update(total_rows=total)
+    batch.total_rows = total
+    return total
+
+
+def _fail(rows, message) -> None:
+    if not isinstance(message, str):
+        message = Left(message, MAX_ERROR_LENGTH)
+    rows.filter(error="").update(error=message)
+
+
+def validate(batch: EventImport, now: datetime | None = None) -> None:
+    """
+    Apply the EventForm rules to the whole batch, one statement per rule.
+    """
+    now = now or timezone.now()
+    rows = EventImportRow.objects.filter(batch=batch)
+    pending = rows.filter(error="")
+
+    _fail(pending.filter(venue__isnull=True), Concat(Value("venue: no venue with slug "), F("venue_slug"), Value(".")))
+    pending.filter(category="").update(category=EventCategory.OTHER)
+    _fail(pending.exclude(category__in=EventCategory.values), Concat(Value("category: unknown "), F("category"), Value(".")))
+    _fail(pending.filter(end_at__isnull=False, end_at__lte=F("start_at")), "end_at: End time must be after the start time.")
+
+    # Cancellation defaults, as EventForm.clean sets them.
+    pending.filter(is_cancelled=True, cancelled_at__isnull=True).update(cancelled_at=now)
+    pending.filter(is_cancelled=False).update(cancelled_at=None, cancellation_note="")
+
+    live = Event.objects.filter(fingerprint=OuterRef("fingerprint"), status__in=LIVE_STATUSES)
+    _fail(pending.filter(Exists(live)), "Already listed at this venue at that time.")
+
+    earlier = rows.filter(error="", line__lt=OuterRef("line"))
+    _fail(
+        pending.filter(Exists(earlier.filter(fingerprint=OuterRef("fingerprint")))),
+        "Repeats an earlier row (same title, venue and start time).",
+    )
+    _fail(pending.filter(Exists(earlier.filter(slug=OuterRef("slug")))), "slug: used by an earlier row.")
+
+
+def merge(batch: EventImport, now: datetime | None = None) -> int:
+    """
+    Insert the batch's valid rows into Event in one statement. Returns the number imported.
+    """
+    now = now or timezone.now()
+    ops = connection.ops
+    event_table = ops.quote_name(Event._meta.db_table)
+    row_table = ops.quote_name(EventImportRow._meta.db_table)
+    stamp = ops.adapt_datetimefield_value(now)
+
+    insert = f"""
+        INSERT INTO {event_table} (
+            region, title, slug, venue_id, category, start_at, end_at,
+            is_cancelled, cancelled_at, cancellation_note, description,
+            status, submitted_by_id, review_note, is_featured, is_public,
+            fingerprint, created_at, updated_at
+        )
+        SELECT
+            %s, title, slug, venue_id, category, start_at, end_at,
+            is_cancelled, cancelled_at, cancellation_note, description,
+            %s, %s, '', %s, %s,
+            fingerprint, %s, %s
+        FROM {row_table}
+        WHERE batch_id = %s AND error = ''
+        ORDER BY line
+        ON CONFLICT (slug) DO NOTHING
+    """
+    params = [batch.region, EventStatus.PENDING, batch.uploaded_by_id, False, True, stamp, stamp, batch.pk]
+
+    rows = EventImportRow.objects.filter(batch=batch)
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            # Link each staging row to the id its own INSERT returned. Valid
+            # slugs are unique within a batch, and a row whose slug was
+            # already taken returns nothing from ON CONFLICT DO NOTHING.
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    WITH created AS ({insert} RETURNING id, slug)
+                    UPDATE {row_table} SET event_id = created.id
+                    FROM created
+                    WHERE {row_table}.batch_id = %s AND {row_table}.error = '' AND {row_table}.slug = created.slug
+                    """,
+                    [*params, batch.pk],
+                )
+        else:
+            with connection.cursor() as cursor:
+                cursor.execute(insert, params)
+            # No data-modifying CTEs here: find this statement's events by the
+            # stamp and uploader it wrote.
+            created = Event.objects.filter(slug=OuterRef("slug"), created_at=now, submitted_by_id=batch.uploaded_by_id)
+            rows.filter(error="").update(event=Subquery(created.values("pk")[:1]))
+        # Rows whose slug was already taken were skipped by ON CONFLICT: they
+        # are the valid rows with no event linked.
+        _fail(rows.filter(event__isnull=True), "slug: already in use by another event.")
+
+        imported = rows.filter(event__isnull=False).count()
+        failed = rows.filter(~Q(error="")).count()
+        EventImport.objects.filter(pk=batch.pk).update(imported_rows=imported, failed_rows=failed, merged_at=now)
+
+    batch.imported_rows, batch.failed_rows, batch.merged_at = imported, failed, now
+    if imported:
+        # Raw INSERT skips post_save, so invalidate listings here.
+        bump_region_generation(batch.region)
+    return imported
+
+
+def import_events(batch: EventImport, stream, fmt: str) -> EventImport:
+    """
+    Stage, validate and merge one upload into ``batch``.
+    """
+    stage(batch, read_records(stream, fmt))
+    now = timezone.now()
+    validate(batch, now=now)
+    merge(batch, now=now)
+    return batch
+
+
+def row_errors(batch: EventImport):
+    return EventImportRow.objects.filter(batch=batch).exclude(error="").values_list("line", "error")
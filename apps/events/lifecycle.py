@@ -0,0 +1,103 @@
+"""
+Lifecycle housekeeping for the hot Event table, run by ``manage.py event_lifecycle``.
+
+- Pending submissions whose start time has already passed can never be usefully
+  approved, so they are rejected with a logged EXPIRE action.
+- Events that started more than EVENTS_ARCHIVE_AFTER_DAYS ago move into
+  ArchivedEvent, so the upcoming-listing indexes only cover recent rows.
+
+Both steps work in primary-key batches, each in its own short transaction, so
+a large backlog never holds long locks or builds one huge statement.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.moderation.models import EventModerationLog, ModerationAction
+
+from .models import ArchivedEvent, Event, EventStatus
+
+DEFAULT_BATCH_SIZE = 500
+EXPIRE_NOTE = "Expired: start time passed before review."
+
+
+def archive_cutoff(now: datetime | None = None, days: int | None = None) -> datetime:
+    if days is None:
+        days = settings.EVENTS_ARCHIVE_AFTER_DAYS
+    return (now or timezone.now()) - timedelta(days=days)
+
+
+def expire_stale_pending(now: datetime | None = None, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """
+    Reject pending events that have already started. Returns how many were expired.
+    """
+    now = now or timezone.now()
+    stale = Event.objects.filter(status=EventStatus.PENDING, start_at__lt=now)
+    expired = 0
+
+    while True:
+        with transaction.atomic():
+            # Lock the batch so a moderator's decision cannot land between the
+            # SELECT and the UPDATE; rows a moderator holds are left for them.
+            batch = list(
+                stale.select_for_update(skip_locked=True).order_by("pk").values_list("pk", "region")[:batch_size]
+            )
+            if not batch:
+                break
+
+            Event.objects.filter(pk__in=[pk for pk, _ in batch], status=EventStatus.PENDING).update(
+                status=EventStatus.REJECTED,
+                reviewed_by=None,
+                reviewed_at=now,
+                review_note=EXPIRE_NOTE,
+                updated_at=now,
+            )
+            EventModerationLog.objects.bulk_create(
+                EventModerationLog(
+                    region=region,
+                    event_id=pk,
+                    action=ModerationAction.EXPIRE,
+                    note=EXPIRE_NOTE,
+                    acted_at=now,
+                )
+                for pk, region in batch
+            )
+        expired += len(batch)
+
+    return expired
+
+
+def archive_past_events(cutoff: datetime | None = None, batch_size: int = DEFAULT_BATCH_SIZE) -> dict[str, int]:
+    """
+    Move events that started before ``cutoff`` into ArchivedEvent.
+
+    Returns a per-region count of archived events.
+    """
+    cutoff = cutoff or archive_cutoff()
+    old = Event.objects.filter(start_at__lt=cutoff)
+    archived: dict[str, int] = {}
+
+    while True:
+        with transaction.atomic():
+            batch = list(old.order_by("pk")[:batch_size])
+            if not batch:
+                break
+
+            now = timezone.now()
+            # ignore_conflicts: overlapping runs may pick up the same rows.
+            ArchivedEvent.objects.bulk_create(
+                (ArchivedEvent.from_event(event, now) for event in batch),
+                ignore_conflicts=True,
+            )
+            # Model delete (not a raw DELETE) so the post_delete signal bumps listing caches.
+            Event.objects.filter(pk__in=[event.pk for event in batch]).delete()
+
+        for event in batch:
+            archived[event.region] = archived.get(event.region, 0) + 1
+
+    return archived
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.events.lifecycle import DEFAULT_BATCH_SIZE, archive_cutoff, archive_past_events, expire_stale_pending
+
+
+class Command(BaseCommand):
+    help = "Expire stale pending events and move old events into the archive table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--archive-after-days",
+            type=int,
+            default=settings.EVENTS_ARCHIVE_AFTER_DAYS,
+            help=f"Archive events that started more than this many days ago (default {settings.EVENTS_ARCHIVE_AFTER_DAYS}).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Rows per transaction (default {DEFAULT_BATCH_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        expired = expire_stale_pending(batch_size=batch_size)
+        archived = archive_past_events(archive_cutoff(days=options["archive_after_days"]), batch_size=batch_size)
+
+        for region, count in sorted(archived.items()):
+            self.stdout.write(f"{region}: {count} archived")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Summary: expired={expired}, archived={sum(archived.values())}")
+        )
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.events.imports import ImportFormatError, import_events, row_errors
+from apps.events.models import EventImport, EventRegion
+
+
+class Command(BaseCommand):
+    help = "Bulk-import a CSV or JSON programme of events as pending submissions, reporting per-row errors."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV (with header row) or JSON file.")
+        parser.add_argument("--region", choices=EventRegion.values, default=EventRegion.OXFORD)
+        parser.add_argument("--format", choices=("csv", "json"), help="Defaults to the file extension.")
+        parser.add_argument("--user", help="Username to record as the submitter.")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        fmt = options["format"] or path.suffix.lstrip(".").lower()
+
+        uploaded_by = None
+        if options["user"]:
+            try:
+                uploaded_by = get_user_model().objects.get_by_natural_key(options["user"])
+            except get_user_model().DoesNotExist as exc:
+                raise CommandError(f"No user {options['user']!r}.") from exc
+
+        batch = EventImport.objects.create(region=options["region"], filename=path.name, uploaded_by=uploaded_by)
+        try:
+            with path.open(encoding="utf-8-sig", newline="") as stream:
+                import_events(batch, stream, fmt)
+        except (OSError, ImportFormatError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        for line, error in row_errors(batch):
+            self.stdout.write(f"line {line}: {error}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Summary: import={batch.pk}, rows={batch.total_rows}, "
+                f"imported={batch.imported_rows}, failed={batch.failed_rows}"
+            )
+        )
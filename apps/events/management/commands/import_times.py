@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+# What a gunicorn worker imports before it can serve: settings, every app, the ASGI app and URLconf.
+BOOT_SNIPPET = "import core.asgi; from django.urls import get_resolver; get_resolver().url_patterns"
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """
+    ``python -X importtime`` lines -> [(module, self_us, cumulative_us)].
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = (part.strip() for part in line[len("import time:"):].split("|"))
+        rows.append((module, int(self_us), int(cumulative_us)))
+    return rows
+
+
+class Command(BaseCommand):
+    help = "Break down where worker boot time goes, by imported package (python -X importtime)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=20, help="How many packages/modules to list (default 20).")
+
+    def handle(self, *args, **options):
+        top = options["top"]
+
+        # A fresh interpreter: this process has already imported everything.
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", BOOT_SNIPPET],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "core.settings")},
+        )
+        if result.returncode:
+            raise CommandError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "boot failed")
+
+        rows = parse_importtime(result.stderr)
+        if not rows:
+            raise CommandError("No importtime output.")
+
+        by_package: dict[str, int] = defaultdict(int)
+        for module, self_us, _ in rows:
+            by_package[module.split(".")[0]] += self_us
+        total = sum(by_package.values())
+
+        self.stdout.write(f"By top-level package (self time, total {total / 1000:.0f} ms):")
+        for package, us in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+            self.stdout.write(f"  {us / 1000:8.1f} ms  {100 * us / total:5.1f}%  {package}")
+
+        self.stdout.write("Slowest modules (cumulative):")
+        for module, _, cumulative in sorted(rows, key=lambda row: -row[2])[:top]:
+            self.stdout.write(f"  {cumulative / 1000:8.1f} ms  {module}")
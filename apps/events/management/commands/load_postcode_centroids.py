@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.events.geo import geohash_encode, normalise_postcode, outward_code
+from apps.events.models import PostcodeCentroid, Venue
+
+# Outward-code centroids for Oxfordshire and its edges. Drop in a full
+# postcode extract (same columns) for per-postcode precision.
+DEFAULT_DATASET = Path(__file__).resolve().parents[2] / "data" / "postcode_centroids.csv"
+
+BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = "Load postcode centroids from a CSV (postcode,latitude,longitude) and geocode venues from them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", nargs="?", default=str(DEFAULT_DATASET), help="CSV file to load.")
+        parser.add_argument(
+            "--regeocode",
+            action="store_true",
+            help="Recompute coordinates for venues that already have them.",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"No such file: {path}")
+
+        loaded = self._load(path)
+        geocoded, missing = self._geocode_venues(options["regeocode"])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Summary: centroids loaded={loaded}, venues geocoded={geocoded}, venues unmatched={missing}")
+        )
+
+    def _load(self, path: Path) -> int:
+        loaded = 0
+        batch: list[PostcodeCentroid] = []
+
+        with path.open(newline="") as fh, transaction.atomic():
+            for row in csv.DictReader(fh):
+                postcode = normalise_postcode(row["postcode"])
+                if not postcode:
+                    continue
+                batch.append(
+                    PostcodeCentroid(postcode=postcode, latitude=float(row["latitude"]), longitude=float(row["longitude"]))
+                )
+                if len(batch) >= BATCH_SIZE:
+                    loaded += self._upsert(batch)
+                    batch = []
+            if batch:
+                loaded += self._upsert(batch)
+
+        return loaded
+
+    def _upsert(self, batch: list[PostcodeCentroid]) -> int:
+        PostcodeCentroid.objects.bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=["postcode"],
+            update_fields=["latitude", "longitude"],
+        )
+        return len(batch)
+
+    def _geocode_venues(self, regeocode: bool) -> tuple[int, int]:
+        venues = Venue.objects.exclude(postcode="")
+        if not regeocode:
+            venues = venues.filter(latitude__isnull=True)
+        venues = list(venues.only("pk", "postcode"))
+
+        # One lookup for every full and outward code we need.
+        wanted = {normalise_postcode(v.postcode) for v in venues} | {outward_code(v.postcode) for v in venues}
+        centroids = PostcodeCentroid.objects.in_bulk(wanted, field_name="postcode")
+
+        updated = []
+        for venue in venues:
+            centroid = centroids.get(normalise_postcode(venue.postcode)) or centroids.get(outward_code(venue.postcode))
+            if not centroid:
+                continue
+            venue.latitude, venue.longitude = centroid.latitude, centroid.longitude
+            venue.geohash = geohash_encode(venue.latitude, venue.longitude)
+            updated.append(venue)
+
+        Venue.objects.bulk_update(updated, ["latitude", "longitude", "geohash"], batch_size=1000)
+        return len(updated), len(venues) - len(updated)
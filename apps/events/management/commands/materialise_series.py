@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.events.series import DEFAULT_WINDOW_WEEKS, materialise_all
+
+
+class Command(BaseCommand):
+    help = "Create upcoming occurrences for recurring event series inside a rolling window."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--weeks",
+            type=int,
+            default=DEFAULT_WINDOW_WEEKS,
+            help=f"Size of the rolling window in weeks (default {DEFAULT_WINDOW_WEEKS}).",
+        )
+
+    def handle(self, *args, **options):
+        weeks = options["weeks"]
+        created = materialise_all(weeks=weeks)
+
+        for region, count in sorted(created.items()):
+            self.stdout.write(f"{region}: {count} occurrence(s)")
+
+        total = sum(created.values())
+        self.stdout.write(self.style.SUCCESS(f"Summary: occurrences created={total}, window={weeks} week(s)"))
@@ -9,8 +9,16 @@ from django.db import connection, transaction
 from django.utils import timezone
 from django.utils.text import slugify
 
+from apps.events.fingerprints import event_fingerprint
 from apps.events.models import Event, EventRegion, EventStatus, Venue
 
+LOOKUP_BATCH_SIZE = 500
+
+
+def _batches(values: list, size: int = LOOKUP_BATCH_SIZE):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
 
 @dataclass(frozen=True)
 class LegacyRegionConfig:
@@ -76,8 +84,19 @@ class Command(BaseCommand):
                     if created:
                         migrated_venues += 1
 
+                fingerprints = {
+                    row["id"]: event_fingerprint(
+                        cfg.region, row.get("title") or "", venue_id_map.get(row["venue_id"]), row.get("start_at")
+                    )
+                    for row in legacy_events
+                }
+                existing_slugs, existing_fingerprints = self._existing_events(
+                    cfg.region, legacy_events, fingerprints.values()
+                )
+
                 for row in legacy_events:
-                    if self._event_exists(cfg.region, row):
+                    fingerprint = fingerprints[row["id"]]
+                    if row.get("slug") in existing_slugs or fingerprint in existing_fingerprints:
                         skipped_events += 1
                         continue
 
@@ -116,6 +135,8 @@ class Command(BaseCommand):
                         created_at=row.get("created_at") or timezone.now(),
                         updated_at=row.get("updated_at") or timezone.now(),
                     )
+                    # Catch duplicates within the legacy table itself.
+                    existing_fingerprints.add(fingerprint)
                     migrated_events += 1
 
             summary = (
@@ -199,16 +220,28 @@ class Command(BaseCommand):
         )
         return venue.id, True
 
-    def _event_exists(self, region: str, row: dict[str, Any]) -> bool:
-        legacy_slug = row.get("slug") or ""
-        if legacy_slug and Event.objects.filter(region=region, slug=legacy_slug).exists():
-            return True
-
-        return Event.objects.filter(
-            region=region,
-            title=row.get("title") or "",
-            start_at=row.get("start_at"),
-        ).exists()
+    def _existing_events(self, region: str, rows: list[dict[str, Any]], fingerprints) -> tuple[set[str], set[str]]:
+        """
+        Legacy slugs and content fingerprints already present, in a few batched
+        IN queries rather than two lookups per legacy row.
+        """
+        slugs = [row["slug"] for row in rows if row.get("slug")]
+        fingerprints = [fp for fp in fingerprints if fp]
+
+        existing_slugs: set[str] = set()
+        for batch in _batches(slugs):
+            existing_slugs.update(Event.objects.filter(region=region, slug__in=batch).values_list("slug", flat=True))
+
+        # Every status, not just live ones: a legacy row that was imported and
+        # later rejected, cancelled or expired must not be imported again. Uses
+        # events_event_region_fp_idx, not the live-only partial index.
+        existing_fingerprints: set[str] = set()
+        for batch in _batches(fingerprints):
+            existing_fingerprints.update(
+                Event.objects.filter(region=region, fingerprint__in=batch).values_list("fingerprint", flat=True)
+            )
+
+        return existing_slugs, existing_fingerprints
 
     def _safe_category(self, value: str | None) -> str:
         allowed = {choice[0] for choice in Event._meta.get_field("category").choices}
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.events.prerender import file_for, listing_paths, prerender, prune, site_paths, take_pending
+
+
+class Command(BaseCommand):
+    help = "Render the public region pages to static HTML under PRERENDER_ROOT."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Also remove files for pages no longer pre-rendered (e.g. archived events).",
+        )
+        parser.add_argument(
+            "--pending",
+            action="store_true",
+            help="Render only the pages queued by saves since the last run (PRERENDER_ON_SAVE).",
+        )
+        parser.add_argument(
+            "--listings",
+            action="store_true",
+            help="Render only the pages that change with the time: landing, listings, categories and venues.",
+        )
+
+    def handle(self, *args, **options):
+        partial = options["pending"] or options["listings"]
+        if partial and options["prune"]:
+            raise CommandError("--prune needs the full page list; run it without --pending or --listings.")
+
+        if partial:
+            paths = take_pending() if options["pending"] else []
+            if options["listings"]:
+                paths += listing_paths()
+        else:
+            paths = site_paths()
+
+        written, removed = prerender(paths)
+        if options["prune"]:
+            removed += prune({file_for(path) for path in paths})
+
+        self.stdout.write(self.style.SUCCESS(f"Summary: rendered={written}, removed={removed}"))
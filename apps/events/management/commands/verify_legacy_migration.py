@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils.dateparse import parse_datetime
+
+from apps.events.management.commands.migrate_legacy_events import LEGACY_REGIONS, LegacyRegionConfig
+from apps.events.models import ArchivedEvent, Event, EventStatus
+
+# Order-independent digest of a set of rows: the sum of a 60-bit slice of each
+# row's md5. Equal (count, digest) per bucket means the same multiset of rows.
+ROW_TEXT = "concat_ws('|', slug, title, floor(extract(epoch FROM start_at))::bigint, status)"
+ROW_DIGEST = f"('x' || left(md5({ROW_TEXT}), 15))::bit(60)::bigint"
+BUCKET = "to_char(date_trunc('month', start_at), 'YYYY-MM')"
+
+
+class Command(BaseCommand):
+    help = (
+        "Verify migrate_legacy_events: compare per-month row counts and content checksums of each "
+        "legacy region table against the unified tables in SQL, and list rows only for mismatched months."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--created-before",
+            help="Ignore unified events created at or after this ISO datetime (i.e. submitted after the migration).",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Rows to show per side for each mismatched month (default 20).",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("verify_legacy_migration needs PostgreSQL (md5, date_trunc, EXCEPT ALL).")
+
+        created_before = None
+        if options["created_before"]:
+            created_before = parse_datetime(options["created_before"])
+            if created_before is None:
+                raise CommandError("--created-before must be an ISO datetime.")
+
+        table_names = set(connection.introspection.table_names())
+        mismatched_regions = 0
+
+        for cfg in LEGACY_REGIONS:
+            if cfg.event_table not in table_names:
+                self.stdout.write(f"Skipping {cfg.label}: missing legacy table.")
+                continue
+
+            legacy = self._legacy_rows(cfg)
+            unified = self._unified_rows(cfg.region, created_before)
+
+            legacy_buckets = self._buckets(legacy)
+            unified_buckets = self._buckets(unified)
+            months = sorted(set(legacy_buckets) | set(unified_buckets))
+            bad = [m for m in months if legacy_buckets.get(m) != unified_buckets.get(m)]
+
+            legacy_total = sum(count for count, _ in legacy_buckets.values())
+            unified_total = sum(count for count, _ in unified_buckets.values())
+            summary = (
+                f"{cfg.label}: legacy={legacy_total}, unified={unified_total}, "
+                f"months={len(months)}, mismatched={len(bad)}"
+            )
+            if not bad:
+                self.stdout.write(self.style.SUCCESS(summary))
+                continue
+
+            mismatched_regions += 1
+            self.stdout.write(self.style.ERROR(summary))
+            for month in bad:
+                legacy_count = legacy_buckets.get(month, (0, None))[0]
+                unified_count = unified_buckets.get(month, (0, None))[0]
+                self.stdout.write(f"  {month or 'no start_at'}: legacy={legacy_count}, unified={unified_count}")
+                for label, left, right in (("only in legacy", legacy, unified), ("only in unified", unified, legacy)):
+                    for row in self._difference(left, right, month, options["limit"]):
+                        self.stdout.write(f"    {label}: " + " | ".join(self._format(value) for value in row))
+
+        if mismatched_regions:
+            raise CommandError(f"{mismatched_regions} region(s) do not match.")
+        self.stdout.write(self.style.SUCCESS("All regions match."))
+
+    def _legacy_rows(self, cfg: LegacyRegionConfig) -> tuple[str, list]:
+        """
+        Legacy rows with the same defaults migrate_legacy_events applies, so
+        that a faithfully migrated row hashes identically on both sides. Rows
+        whose slug was generated or suffixed on import show up in the
+        drill-down, which is where they deserve a look anyway.
+        """
+        statuses = [value for value, _ in EventStatus.choices]
+        placeholders = ", ".join(["%s"] * len(statuses))
+        sql = f"""
+            SELECT
+                TRIM(COALESCE(slug, '')) AS slug,
+                COALESCE(NULLIF(title, ''), 'Untitled event') AS title,
+                start_at,
+                CASE WHEN status IN ({placeholders}) THEN status ELSE %s END AS status
+            FROM {connection.ops.quote_name(cfg.event_table)}
+        """
+        return sql, [*statuses, EventStatus.PENDING]
+
+    def _unified_rows(self, region: str, created_before: datetime | None) -> tuple[str, list]:
+        parts, params = [], []
+        for model in (Event, ArchivedEvent):
+            where, where_params = "region = %s", [region]
+            if created_before:
+                where += " AND created_at < %s"
+                where_params.append(created_before)
+            parts.append(f"SELECT slug, title, start_at, status FROM {connection.ops.quote_name(model._meta.db_table)} WHERE {where}")
+            params += where_params
+        return " UNION ALL ".join(parts), params
+
+    def _buckets(self, rows: tuple[str, list]) -> dict[str | None, tuple[int, int]]:
+        sql, params = rows
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT {BUCKET} AS bucket, count(*), COALESCE(sum({ROW_DIGEST}), 0) FROM ({sql}) t GROUP BY 1",
+                params,
+            )
+            return {bucket: (count, digest) for bucket, count, digest in cursor.fetchall()}
+
+    def _difference(self, left: tuple[str, list], right: tuple[str, list], month: str | None, limit: int) -> list[tuple]:
+        bucket_filter = f"{BUCKET} IS NOT DISTINCT FROM %s"
+        sql = f"""
+            (SELECT slug, title, start_at, status FROM ({left[0]}) l WHERE {bucket_filter})
+            EXCEPT ALL
+            (SELECT slug, title, start_at, status FROM ({right[0]}) r WHERE {bucket_filter})
+            ORDER BY start_at, slug
+            LIMIT %s
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [*left[1], month, *right[1], month, limit])
+            return cursor.fetchall()
+
+    def _format(self, value) -> str:
+        return value.isoformat() if isinstance(value, datetime) else str(value)
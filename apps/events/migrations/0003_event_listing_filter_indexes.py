@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-19 00:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_rename_events_event_region_fa39dd_idx_events_even_region_e04c0b_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['region', 'status', 'category', 'start_at'], name='events_even_region_10b3f3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['region', 'status', 'is_featured', 'start_at'], name='events_even_region_a6fe92_idx'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 6.0 on 2026-10-19 00:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_event_listing_filter_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventSeries',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('region', models.CharField(choices=[('oxford', 'Oxford'), ('westoxon', 'West Oxfordshire'), ('eastoxon', 'East Oxfordshire'), ('northoxon', 'North Oxfordshire'), ('southoxon', 'South Oxfordshire')], default='oxford', max_length=20)),
+                ('title', models.CharField(max_length=255)),
+                ('slug', models.SlugField(blank=True, max_length=255, unique=True)),
+                ('category', models.CharField(choices=[('music', 'Music'), ('comedy', 'Comedy'), ('open_mic', 'Open mic'), ('theatre', 'Theatre'), ('community', 'Community'), ('other', 'Other')], default='other', max_length=30)),
+                ('description', models.TextField(blank=True)),
+                ('frequency', models.CharField(choices=[('weekly', 'Weekly'), ('fortnightly', 'Every two weeks'), ('monthly_weekday', 'Monthly (same weekday, e.g. first Tuesday)')], default='weekly', max_length=20)),
+                ('first_start_at', models.DateTimeField()),
+                ('duration', models.DurationField(blank=True, null=True)),
+                ('ends_on', models.DateField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending approval'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('cancelled', 'Cancelled')], default='pending', max_length=20)),
+                ('reviewed_at', models.DateTimeField(blank=True, null=True)),
+                ('review_note', models.TextField(blank=True)),
+                ('is_public', models.BooleanField(default=True)),
+                ('materialised_until', models.DateTimeField(blank=True, null=True)),
+                ('reviewed_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reviewed_series', to=settings.AUTH_USER_MODEL)),
+                ('submitted_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='submitted_series', to=settings.AUTH_USER_MODEL)),
+                ('venue', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='series', to='events.venue')),
+            ],
+            options={
+                'verbose_name_plural': 'event series',
+                'ordering': ['title'],
+            },
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='series',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='occurrences', to='events.eventseries'),
+        ),
+        migrations.AddConstraint(
+            model_name='event',
+            constraint=models.UniqueConstraint(fields=('series', 'start_at'), name='events_event_series_start_uniq'),
+        ),
+        migrations.AddIndex(
+            model_name='eventseries',
+            index=models.Index(fields=['status', 'materialised_until'], name='events_even_status_8f787d_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-19 00:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_venue_geolocation'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['start_at', 'id'], name='events_even_start_a_86208f_idx'),
+        ),
+    ]
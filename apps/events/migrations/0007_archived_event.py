@@ -0,0 +1,41 @@
+# Generated by Django 6.0 on 2026-10-19 00:20
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_event_admin_order_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_id', models.PositiveBigIntegerField(unique=True)),
+                ('region', models.CharField(choices=[('oxford', 'Oxford'), ('westoxon', 'West Oxfordshire'), ('eastoxon', 'East Oxfordshire'), ('northoxon', 'North Oxfordshire'), ('southoxon', 'South Oxfordshire')], max_length=20)),
+                ('title', models.CharField(max_length=255)),
+                ('slug', models.SlugField(max_length=255)),
+                ('category', models.CharField(choices=[('music', 'Music'), ('comedy', 'Comedy'), ('open_mic', 'Open mic'), ('theatre', 'Theatre'), ('community', 'Community'), ('other', 'Other')], default='other', max_length=30)),
+                ('start_at', models.DateTimeField()),
+                ('end_at', models.DateTimeField(blank=True, null=True)),
+                ('is_cancelled', models.BooleanField(default=False)),
+                ('cancellation_note', models.CharField(blank=True, max_length=500)),
+                ('description', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending approval'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('cancelled', 'Cancelled')], max_length=20)),
+                ('is_featured', models.BooleanField(default=False)),
+                ('is_public', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('venue', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='archived_events', to='events.venue')),
+            ],
+            options={
+                'ordering': ['-start_at'],
+                'indexes': [models.Index(fields=['region', 'status', 'start_at'], name='events_arch_region_c4efe9_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 6.0 on 2026-10-19 00:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+from apps.events.fingerprints import event_fingerprint
+
+
+def backfill_fingerprints(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    batch = []
+    for event in Event.objects.only("pk", "region", "title", "venue_id", "start_at").iterator(chunk_size=2000):
+        event.fingerprint = event_fingerprint(event.region, event.title, event.venue_id, event.start_at)
+        batch.append(event)
+        if len(batch) >= 2000:
+            Event.objects.bulk_update(batch, ["fingerprint"])
+            batch = []
+    if batch:
+        Event.objects.bulk_update(batch, ["fingerprint"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_archived_event'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=32),
+        ),
+        migrations.RunPython(backfill_fingerprints, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('status__in', ('pending', 'approved'))), fields=['fingerprint'], name='events_event_live_fp_idx'),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 6.0 on 2026-10-19 00:37
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_event_fingerprint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventImport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('region', models.CharField(choices=[('oxford', 'Oxford'), ('westoxon', 'West Oxfordshire'), ('eastoxon', 'East Oxfordshire'), ('northoxon', 'North Oxfordshire'), ('southoxon', 'South Oxfordshire')], default='oxford', max_length=20)),
+                ('filename', models.CharField(blank=True, max_length=255)),
+                ('total_rows', models.PositiveIntegerField(default=0)),
+                ('imported_rows', models.PositiveIntegerField(default=0)),
+                ('failed_rows', models.PositiveIntegerField(default=0)),
+                ('merged_at', models.DateTimeField(blank=True, null=True)),
+                ('uploaded_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='event_imports', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='EventImportRow',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('line', models.PositiveIntegerField()),
+                ('title', models.CharField(blank=True, max_length=255)),
+                ('slug', models.CharField(blank=True, max_length=255)),
+                ('venue_slug', models.CharField(blank=True, max_length=255)),
+                ('category', models.CharField(blank=True, max_length=30)),
+                ('start_at', models.DateTimeField(blank=True, null=True)),
+                ('end_at', models.DateTimeField(blank=True, null=True)),
+                ('is_cancelled', models.BooleanField(default=False)),
+                ('cancelled_at', models.DateTimeField(blank=True, null=True)),
+                ('cancellation_note', models.CharField(blank=True, max_length=500)),
+                ('description', models.TextField(blank=True)),
+                ('fingerprint', models.CharField(blank=True, max_length=32)),
+                ('error', models.CharField(blank=True, max_length=255)),
+                ('batch', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rows', to='events.eventimport')),
+                ('event', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='events.event')),
+                ('venue', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='events.venue')),
+            ],
+            options={
+                'ordering': ['batch', 'line'],
+                'indexes': [models.Index(fields=['batch', 'line'], name='events_even_batch_i_6e9d55_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-19 17:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_pending_prerender'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['region', 'fingerprint'], name='events_event_region_fp_idx'),
+        ),
+    ]
@@ -3,6 +3,9 @@ from django.db import models
 from django.utils import timezone
 from django.utils.text import slugify
 
+from .fingerprints import FINGERPRINT_LENGTH, LIVE_STATUSES, event_fingerprint
+from .geo import geohash_encode, normalise_postcode, outward_code
+
 
 class TimeStampedModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
@@ -20,6 +23,42 @@ class EventRegion(models.TextChoices):
     SOUTH_OXON = "southoxon", "South Oxfordshire"
 
 
+class PostcodeCentroid(models.Model):
+    """
+    Offline postcode -> centroid lookup, loaded by load_postcode_centroids.
+    Rows may be full postcodes ("OX1 4AU") or outward codes ("OX1").
+    """
+
+    postcode = models.CharField(max_length=8, unique=True)
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+
+    class Meta:
+        ordering = ["postcode"]
+
+    @classmethod
+    def lookup(cls, postcode: str):
+        """
+        Best match for a postcode: the full postcode if known, else its outward code.
+        """
+        full = normalise_postcode(postcode)
+        if not full:
+            return None
+        matches = {c.postcode: c for c in cls.objects.filter(postcode__in={full, outward_code(full)})}
+        return matches.get(full) or matches.get(outward_code(full))
+
+    @classmethod
+    async def alookup(cls, postcode: str):
+        full = normalise_postcode(postcode)
+        if not full:
+            return None
+        matches = {c.postcode: c async for c in cls.objects.filter(postcode__in={full, outward_code(full)})}
+        return matches.get(full) or matches.get(outward_code(full))
+
+    def __str__(self) -> str:
+        return self.postcode
+
+
 class Venue(TimeStampedModel):
     name = models.CharField(max_length=255)
     slug = models.SlugField(max_length=255, unique=True, blank=True)
@@ -35,6 +74,11 @@ class Venue(TimeStampedModel):
 
     is_active = models.BooleanField(default=True)
 
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    # Full-precision geohash of (latitude, longitude); radius search prefix-matches it.
+    geohash = models.CharField(max_length=12, blank=True, db_index=True)
+
     class Meta:
         ordering = ["name"]
         indexes = [
@@ -51,6 +95,22 @@ class Venue(TimeStampedModel):
                 slug = f"{base}-{i}"
                 i += 1
             self.slug = slug
+
+        update_fields = kwargs.get("update_fields")
+        if self.pk and (update_fields is None or "postcode" in update_fields):
+            stored = Venue.objects.filter(pk=self.pk).values_list("postcode", "latitude", "longitude").first()
+            # A new postcode means new coordinates, unless they were edited alongside it.
+            if stored and stored[0] != self.postcode and stored[1:] == (self.latitude, self.longitude):
+                self.latitude = self.longitude = None
+                if update_fields is not None:
+                    kwargs["update_fields"] = {*update_fields, "latitude", "longitude", "geohash"}
+
+        if self.latitude is None and self.postcode:
+            centroid = PostcodeCentroid.lookup(self.postcode)
+            if centroid:
+                self.latitude, self.longitude = centroid.latitude, centroid.longitude
+        self.geohash = geohash_encode(self.latitude, self.longitude) if self.latitude is not None else ""
+
         super().save(*args, **kwargs)
 
     def __str__(self) -> str:
@@ -73,6 +133,113 @@ class EventStatus(models.TextChoices):
     CANCELLED = "cancelled", "Cancelled"
 
 
+class RecurrenceFrequency(models.TextChoices):
+    WEEKLY = "weekly", "Weekly"
+    FORTNIGHTLY = "fortnightly", "Every two weeks"
+    MONTHLY_WEEKDAY = "monthly_weekday", "Monthly (same weekday, e.g. first Tuesday)"
+
+
+class EventSeries(TimeStampedModel):
+    """
+    A recurring event (e.g. a weekly open mic), moderated once.
+
+    Occurrences are ordinary Event rows created ahead of time by the
+    materialise_series command, only inside a rolling window.
+    """
+
+    region = models.CharField(max_length=20, choices=EventRegion.choices, default=EventRegion.OXFORD)
+    title = models.CharField(max_length=255)
+    slug = models.SlugField(max_length=255, unique=True, blank=True)
+
+    venue = models.ForeignKey(Venue, on_delete=models.PROTECT, related_name="series")
+    category = models.CharField(max_length=30, choices=EventCategory.choices, default=EventCategory.OTHER)
+    description = models.TextField(blank=True)
+
+    frequency = models.CharField(max_length=20, choices=RecurrenceFrequency.choices, default=RecurrenceFrequency.WEEKLY)
+    first_start_at = models.DateTimeField()
+    duration = models.DurationField(null=True, blank=True)
+    ends_on = models.DateField(null=True, blank=True)
+
+    status = models.CharField(max_length=20, choices=EventStatus.choices, default=EventStatus.PENDING)
+    submitted_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="submitted_series",
+    )
+    reviewed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="reviewed_series",
+    )
+    reviewed_at = models.DateTimeField(null=True, blank=True)
+    review_note = models.TextField(blank=True)
+
+    is_public = models.BooleanField(default=True)
+
+    # Occurrences exist up to (and including) this start time.
+    materialised_until = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["title"]
+        verbose_name_plural = "event series"
+        indexes = [
+            models.Index(fields=["status", "materialised_until"]),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self.slug:
+            base = slugify(self.title)[:220] or "series"
+            slug = base
+            i = 2
+            while EventSeries.objects.filter(slug=slug).exclude(pk=self.pk).exists():
+                slug = f"{base}-{i}"
+                i += 1
+            self.slug = slug
+        super().save(*args, **kwargs)
+
+    def _review_all(self, status: str, reviewer, note: str):
+        """
+        Review the series and every still-pending occurrence in one UPDATE.
+        """
+        from core.edge_cache import event_key, region_key
+        from core.purge import purge_after_commit
+
+        from .cache import bump_region_generation
+        from .prerender import event_paths, schedule_prerender
+
+        now = timezone.now()
+        self.status = status
+        self.reviewed_by = reviewer
+        self.reviewed_at = now
+        self.review_note = note
+        self.save(update_fields=["status", "reviewed_by", "reviewed_at", "review_note", "updated_at"])
+
+        pending = self.occurrences.filter(status=EventStatus.PENDING)
+        event_ids = list(pending.values_list("pk", flat=True))
+        pending.update(status=status, reviewed_by=reviewer, reviewed_at=now, review_note=note, updated_at=now)
+
+        # QuerySet.update() skips post_save, so invalidate listings here.
+        bump_region_generation(self.region)
+        schedule_prerender(
+            lambda: [path for event in Event.objects.filter(pk__in=event_ids) for path in event_paths(event)]
+        )
+        purge_after_commit([region_key(self.region), *map(event_key, event_ids)])
+        return event_ids
+
+    def approve(self, reviewer, note: str = "") -> list[int]:
+        return self._review_all(EventStatus.APPROVED, reviewer, note)
+
+    def reject(self, reviewer, note: str) -> list[int]:
+        return self._review_all(EventStatus.REJECTED, reviewer, note)
+
+    def __str__(self) -> str:
+        return self.title
+
+
 class Event(TimeStampedModel):
     region = models.CharField(max_length=20, choices=EventRegion.choices, default=EventRegion.OXFORD)
     title = models.CharField(max_length=255)
@@ -110,13 +277,41 @@ class Event(TimeStampedModel):
     is_featured = models.BooleanField(default=False)
     is_public = models.BooleanField(default=True)
 
+    series = models.ForeignKey(
+        EventSeries,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="occurrences",
+    )
+
+    # Hash of region + normalised title + venue + start minute; see fingerprints.py.
+    fingerprint = models.CharField(max_length=FINGERPRINT_LENGTH, blank=True, editable=False)
+
     class Meta:
         ordering = ["-start_at"]
+        constraints = [
+            # Lets materialisation re-run safely with bulk_create(ignore_conflicts=True).
+            models.UniqueConstraint(fields=["series", "start_at"], name="events_event_series_start_uniq"),
+        ]
         indexes = [
             models.Index(fields=["region", "status", "start_at"]),
             models.Index(fields=["region", "category", "start_at"]),
             models.Index(fields=["venue", "start_at"]),
             models.Index(fields=["slug"]),
+            # Public listing filters (category / featured) within a region's approved events.
+            models.Index(fields=["region", "status", "category", "start_at"]),
+            models.Index(fields=["region", "status", "is_featured", "start_at"]),
+            # Admin changelist order (-start_at, -pk) without a sort over the whole table.
+            models.Index(fields=["start_at", "id"]),
+            # Form, admin and import duplicate checks only ask about live events.
+            models.Index(
+                fields=["fingerprint"],
+                name="events_event_live_fp_idx",
+                condition=models.Q(status__in=LIVE_STATUSES),
+            ),
+            # migrate_legacy_events re-runs match fingerprints in every status.
+            models.Index(fields=["region", "fingerprint"], name="events_event_region_fp_idx"),
         ]
 
     def save(self, *args, **kwargs):
@@ -128,8 +323,25 @@ class Event(TimeStampedModel):
                 slug = f"{base}-{i}"
                 i += 1
             self.slug = slug
+        self.fingerprint = self.compute_fingerprint()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"region", "title", "venue", "start_at"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "fingerprint"}
         super().save(*args, **kwargs)
 
+    def compute_fingerprint(self) -> str:
+        return event_fingerprint(self.region, self.title, self.venue_id, self.start_at)
+
+    @classmethod
+    def live_duplicates(cls, fingerprints, *, exclude_pk=None):
+        """
+        Live events sharing any of ``fingerprints``, in one indexed IN query.
+        """
+        qs = cls.objects.filter(fingerprint__in={fp for fp in fingerprints if fp}, status__in=LIVE_STATUSES)
+        if exclude_pk is not None:
+            qs = qs.exclude(pk=exclude_pk)
+        return qs
+
     @property
     def is_upcoming(self) -> bool:
         return self.start_at >= timezone.now()
@@ -149,4 +361,149 @@ class Event(TimeStampedModel):
         self.save(update_fields=["status", "reviewed_by", "reviewed_at", "review_note", "updated_at"])
 
     def __str__(self) -> str:
-        return self.title
\ No newline at end of file
+        return self.title
+
+
+class ArchivedEvent(models.Model):
+    """
+    Cold storage for events older than the archive horizon (see lifecycle.py).
+
+    Keeps what the past listings and detail page render, plus the original
+    Event pk so moderation log rows (region, event_id) still resolve. Slugs
+    are not unique here: once an event leaves the hot table its slug is free
+    for reuse there.
+    """
+
+    event_id = models.PositiveBigIntegerField(unique=True)
+    region = models.CharField(max_length=20, choices=EventRegion.choices)
+    title = models.CharField(max_length=255)
+    slug = models.SlugField(max_length=255, db_index=True)
+
+    venue = models.ForeignKey(Venue, on_delete=models.PROTECT, related_name="archived_events")
+    category = models.CharField(max_length=30, choices=EventCategory.choices, default=EventCategory.OTHER)
+
+    start_at = models.DateTimeField()
+    end_at = models.DateTimeField(null=True, blank=True)
+    is_cancelled = models.BooleanField(default=False)
+    cancellation_note = models.CharField(max_length=500, blank=True)
+
+    description = models.TextField(blank=True)
+
+    status = models.CharField(max_length=20, choices=EventStatus.choices)
+    is_featured = models.BooleanField(default=False)
+    is_public = models.BooleanField(default=True)
+
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["-start_at"]
+        indexes = [
+            models.Index(fields=["region", "status", "start_at"]),
+        ]
+
+    @classmethod
+    def from_event(cls, event: Event, archived_at=None) -> "ArchivedEvent":
+        return cls(
+            event_id=event.pk,
+            region=event.region,
+            title=event.title,
+            slug=event.slug,
+            venue_id=event.venue_id,
+            category=event.category,
+            start_at=event.start_at,
+            end_at=event.end_at,
+            is_cancelled=event.is_cancelled,
+            cancellation_note=event.cancellation_note,
+            description=event.description,
+            status=event.status,
+            is_featured=event.is_featured,
+            is_public=event.is_public,
+            created_at=event.created_at,
+            archived_at=archived_at or timezone.now(),
+        )
+
+    def __str__(self) -> str:
+        return self.title
+
+
+class EventImport(TimeStampedModel):
+    """
+    One bulk upload (a venue's or festival's programme). Its rows are staged
+    in EventImportRow, validated and merged into Event by imports.py; rows
+    that fail keep their error for the uploader to fix and resend.
+    """
+
+    region = models.CharField(max_length=20, choices=EventRegion.choices, default=EventRegion.OXFORD)
+    filename = models.CharField(max_length=255, blank=True)
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="event_imports",
+    )
+    total_rows = models.PositiveIntegerField(default=0)
+    imported_rows = models.PositiveIntegerField(default=0)
+    failed_rows = models.PositiveIntegerField(default=0)
+    merged_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:
+        return self.filename or f"Import {self.pk}"
+
+
+class EventImportRow(models.Model):
+    """
+    Staging row for EventImport. Loaded with COPY on PostgreSQL, so it has no
+    constraints beyond the batch key: everything else is checked in SQL.
+    """
+
+    batch = models.ForeignKey(EventImport, on_delete=models.CASCADE, related_name="rows")
+    line = models.PositiveIntegerField()
+
+    title = models.CharField(max_length=255, blank=True)
+    slug = models.CharField(max_length=255, blank=True)
+    venue_slug = models.CharField(max_length=255, blank=True)
+    venue = models.ForeignKey(Venue, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    category = models.CharField(max_length=30, blank=True)
+
+    start_at = models.DateTimeField(null=True, blank=True)
+    end_at = models.DateTimeField(null=True, blank=True)
+    is_cancelled = models.BooleanField(default=False)
+    cancelled_at = models.DateTimeField(null=True, blank=True)
+    cancellation_note = models.CharField(max_length=500, blank=True)
+
+    description = models.TextField(blank=True)
+    fingerprint = models.CharField(max_length=FINGERPRINT_LENGTH, blank=True)
+
+    error = models.CharField(max_length=255, blank=True)
+    event = models.ForeignKey(Event, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+
+    class Meta:
+        ordering = ["batch", "line"]
+        indexes = [
+            models.Index(fields=["batch", "line"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.batch_id}:{self.line}"
+
+
+class PendingPrerender(models.Model):
+    """
+    A page to re-render, queued after commit by prerender.schedule_prerender
+    and drained by ``prerender_site --pending``. One row per path, however
+    many saves touched it in between.
+    """
+
+    path = models.CharField(max_length=500, unique=True)
+    queued_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["queued_at"]
+
+    def __str__(self) -> str:
+        return self.path
@@ -0,0 +1,44 @@
+"""
+Radius search over venues: indexed geohash-prefix prefilter, haversine refine.
+"""
+
+from __future__ import annotations
+
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+
+from .geo import covering_cells, haversine_miles
+from .models import Venue
+
+MAX_RADIUS_MILES = 50
+
+
+def _cell_filter(lat: float, lng: float, miles: float) -> Q:
+    return reduce(or_, (Q(geohash__startswith=cell) for cell in sorted(covering_cells(lat, lng, miles))))
+
+
+def candidate_venues(lat: float, lng: float, miles: float, qs=None):
+    qs = Venue.objects.all() if qs is None else qs
+    return qs.filter(_cell_filter(lat, lng, miles)).only("pk", "latitude", "longitude")
+
+
+def _within(venues, lat: float, lng: float, miles: float) -> dict[int, float]:
+    distances = {}
+    for venue in venues:
+        distance = haversine_miles(lat, lng, venue.latitude, venue.longitude)
+        if distance <= miles:
+            distances[venue.pk] = distance
+    return distances
+
+
+def venue_distances(lat: float, lng: float, miles: float, qs=None) -> dict[int, float]:
+    """
+    {venue_id: distance in miles} for venues within ``miles`` of the point.
+    """
+    return _within(candidate_venues(lat, lng, miles, qs), lat, lng, miles)
+
+
+async def avenue_distances(lat: float, lng: float, miles: float, qs=None) -> dict[int, float]:
+    return _within([v async for v in candidate_venues(lat, lng, miles, qs)], lat, lng, miles)
@@ -0,0 +1,74 @@
+"""
+"Next up" across every region, for the landing page.
+
+The next NEXT_UP_PER_REGION events of each region and the next
+NEXT_UP_FEATURED featured events county-wide come from one query: two
+ROW_NUMBER() windows (per region, and per is_featured) over the upcoming
+public events, keeping a row if it ranks within either limit.
+
+The result is cached under a key embedding every region's generation, so a
+change to any region's listings orphans it and the next request rebuilds it.
+"""
+
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from .cache import region_generations
+from .models import Event, EventRegion, EventStatus
+
+NEXT_UP_PER_REGION = 4
+NEXT_UP_FEATURED = 6
+# Upcoming lists drift as events start, so even unchanged generations expire.
+NEXT_UP_CACHE_SECONDS = 300
+
+
+def _next_up_qs(now):
+    return (
+        Event.objects.select_related("venue")
+        .filter(
+            status=EventStatus.APPROVED,
+            is_public=True,
+            venue__is_active=True,
+            start_at__gte=now,
+        )
+        .annotate(
+            region_rank=Window(RowNumber(), partition_by=F("region"), order_by=[F("start_at").asc(), F("pk").asc()]),
+            featured_rank=Window(
+                RowNumber(), partition_by=F("is_featured"), order_by=[F("start_at").asc(), F("pk").asc()]
+            ),
+        )
+        .filter(Q(region_rank__lte=NEXT_UP_PER_REGION) | Q(is_featured=True, featured_rank__lte=NEXT_UP_FEATURED))
+        .order_by("start_at", "pk")
+    )
+
+
+def _next_up_key() -> str:
+    generations = region_generations(EventRegion.values)
+    generations = "-".join(str(generations[region]) for region in EventRegion.values)
+    return f"events:next_up:g{generations}"
+
+
+def next_up() -> dict:
+    """
+    ``{"regions": [(region, label, events), ...], "featured": [events]}``, cached.
+    """
+    key = _next_up_key()
+    result = cache.get(key)
+    if result is None:
+        by_region: dict[str, list] = {region: [] for region in EventRegion.values}
+        featured = []
+        for event in _next_up_qs(timezone.now()):
+            if event.region_rank <= NEXT_UP_PER_REGION:
+                by_region[event.region].append(event)
+            if event.is_featured and event.featured_rank <= NEXT_UP_FEATURED:
+                featured.append(event)
+        result = {
+            "regions": [(region, label, by_region[region]) for region, label in EventRegion.choices],
+            "featured": featured,
+        }
+        cache.set(key, result, NEXT_UP_CACHE_SECONDS)
+    return result
@@ -0,0 +1,223 @@
+"""
+Static pre-rendering of the public region pages.
+
+``manage.py prerender_site`` renders the landing page and, for every region,
+the upcoming/past listings, category pages, venue list, venue pages and
+event detail pages to ``PRERENDER_ROOT/<path>/index.html``. A front proxy
+serves those files for anonymous GETs without a query string and passes
+everything else (cursors, filters, HTMX partials, signed-in users) to Django.
+
+With PRERENDER_ON_SAVE, saving an Event or Venue (which is what every
+moderation decision does) queues the pages that show it in PendingPrerender
+once the transaction commits; ``prerender_site --pending``, run every minute
+or so, renders them outside the request. A page that no longer renders (a
+rejected or hidden event, say) has its file removed, so the proxy falls back
+to Django.
+
+Listings, category and venue pages also change with the clock, as events
+start and drop off "upcoming". ``prerender_site --listings`` re-renders just
+those (listing_paths) and is meant to run every few minutes; the full run
+covers event pages nightly.
+
+Pages are rendered by calling the view directly as an anonymous user, so
+throttling and analytics middleware never see pre-rendering. Being
+shareable (core.edge_cache), the files carry sponsor slot placeholders and a
+page-view beacon rather than a sponsor chosen at render time, so every
+visitor of a file still gets a rotated sponsor and is counted.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db import transaction
+from django.http import Http404
+from django.test import RequestFactory
+from django.urls import Resolver404, resolve, reverse
+
+from .models import Event, EventCategory, EventRegion, EventStatus, PendingPrerender, Venue
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.html"
+
+
+async def _anonymous():
+    return AnonymousUser()
+
+
+def _public_events():
+    return Event.objects.filter(status=EventStatus.APPROVED, is_public=True, venue__is_active=True)
+
+
+def region_listing_paths(region: str) -> list[str]:
+    # The events URLconf is included once per region, with the region as its namespace.
+    return [
+        reverse(f"{region}:upcoming_events"),
+        reverse(f"{region}:past_events"),
+        reverse(f"{region}:venue_list"),
+    ]
+
+
+def event_paths(event, previous_region: str | None = None) -> list[str]:
+    """
+    Every pre-rendered page that shows ``event`` (in either region, if it moved).
+    """
+    paths = [reverse("landing:home")]
+    for region in dict.fromkeys(filter(None, [event.region, previous_region])):
+        paths += region_listing_paths(region)
+        paths += [
+            reverse(f"{region}:category_events", kwargs={"category": event.category}),
+            reverse(f"{region}:venue_detail", kwargs={"pk": event.venue_id}),
+            reverse(f"{region}:event_detail", kwargs={"slug": event.slug}),
+        ]
+    return paths
+
+
+def _category_paths(region: str) -> list[str]:
+    return [reverse(f"{region}:category_events", kwargs={"category": c}) for c in EventCategory.values]
+
+
+def venue_paths(venue_id: int) -> list[str]:
+    """
+    Every pre-rendered page that shows the venue: its name is on every card.
+    """
+    paths = [reverse("landing:home")]
+    for region in EventRegion.values:
+        paths += region_listing_paths(region) + _category_paths(region)
+        paths.append(reverse(f"{region}:venue_detail", kwargs={"pk": venue_id}))
+    for region, slug in Event.objects.filter(venue_id=venue_id).values_list("region", "slug"):
+        paths.append(reverse(f"{region}:event_detail", kwargs={"slug": slug}))
+    return paths
+
+
+def listing_paths() -> list[str]:
+    """
+    Every pre-rendered page whose content depends on the time: the landing
+    page, listings, category pages and venue pages (their upcoming events).
+    """
+    paths = [reverse("landing:home")]
+    for region in EventRegion.values:
+        paths += region_listing_paths(region) + _category_paths(region)
+
+        venue_ids = (
+            Venue.objects.filter(is_active=True, events__region=region).distinct().order_by("pk").values_list("pk", flat=True)
+        )
+        paths += [reverse(f"{region}:venue_detail", kwargs={"pk": pk}) for pk in venue_ids]
+    return paths
+
+
+def site_paths() -> list[str]:
+    paths = listing_paths()
+    for region in EventRegion.values:
+        slugs = _public_events().filter(region=region).order_by("pk").values_list("slug", flat=True)
+        paths += [reverse(f"{region}:event_detail", kwargs={"slug": slug}) for slug in slugs.iterator()]
+    return paths
+
+
+def file_for(path: str, root: Path | None = None) -> Path:
+    root = Path(root or settings.PRERENDER_ROOT)
+    return root / path.strip("/") / INDEX_FILE
+
+
+def render_path(path: str) -> bytes | None:
+    """
+    The page at ``path`` as an anonymous GET would see it, or None if it does not render.
+    """
+    try:
+        match = resolve(path)
+    except Resolver404:
+        return None
+
+    request = RequestFactory().get(path)
+    request.user = AnonymousUser()
+    request.auser = _anonymous
+    request.resolver_match = match
+
+    view = async_to_sync(match.func) if iscoroutinefunction(match.func) else match.func
+    try:
+        response = view(request, *match.args, **match.kwargs)
+    except Http404:
+        return None
+    if hasattr(response, "render"):
+        response.render()
+    return response.content if response.status_code == 200 else None
+
+
+def _write(target: Path, content: bytes) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename, so the proxy never serves a half-written page.
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".prerender-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def prerender(paths, root: Path | None = None) -> tuple[int, int]:
+    """
+    Render each path to its file, removing files for pages that no longer
+    render. Returns (written, removed).
+    """
+    written = removed = 0
+    for path in dict.fromkeys(paths):
+        target = file_for(path, root)
+        content = render_path(path)
+        if content is not None:
+            _write(target, content)
+            written += 1
+        elif target.exists():
+            target.unlink()
+            removed += 1
+    return written, removed
+
+
+def prune(keep: set[Path], root: Path | None = None) -> int:
+    """
+    Remove pre-rendered files not in ``keep`` (pages that are gone, or archived).
+    """
+    root = Path(root or settings.PRERENDER_ROOT)
+    removed = 0
+    for target in root.rglob(INDEX_FILE):
+        if target not in keep:
+            target.unlink()
+            removed += 1
+    return removed
+
+
+def _queue_after_commit(get_paths) -> None:
+    try:
+        PendingPrerender.objects.bulk_create(
+            [PendingPrerender(path=path) for path in dict.fromkeys(get_paths())], ignore_conflicts=True
+        )
+    except Exception:
+        # The pages stay stale until the next full run; the save itself succeeded.
+        logger.exception("prerender: failed to queue changed pages")
+
+
+def schedule_prerender(get_paths) -> None:
+    """
+    Queue the pages ``get_paths()`` lists for re-rendering once the current transaction commits.
+    """
+    if settings.PRERENDER_ON_SAVE:
+        transaction.on_commit(lambda: _queue_after_commit(get_paths))
+
+
+def take_pending() -> list[str]:
+    """
+    Dequeue every queued path. A page queued again while it renders gets a
+    new row, so the next run picks it up.
+    """
+    with transaction.atomic():
+        queued = list(PendingPrerender.objects.select_for_update(skip_locked=True).values_list("pk", "path"))
+        PendingPrerender.objects.filter(pk__in=[pk for pk, _ in queued]).delete()
+    return [path for _, path in queued]
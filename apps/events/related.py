@@ -0,0 +1,85 @@
+"""
+The "more like this" panel on event detail pages.
+
+Three panels (same venue, same night in the same town, same category) come
+from one query: each candidate row is labelled with the first panel it
+belongs to and numbered within that panel by a ROW_NUMBER() window, so the
+database returns at most RELATED_PER_PANEL rows per panel. The OR'd
+conditions are served by the (venue, start_at) and
+(region, category, start_at) indexes.
+
+The result is cached per event under the region's generation, so it is
+recomputed only after the region's listings change (or the cache expires).
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db.models import Case, F, IntegerField, Q, Value, When, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from .cache import aregion_generation, region_cache_key
+from .dates import local_day_end, local_day_start, local_timezone
+from .models import Event, EventStatus
+
+RELATED_PER_PANEL = 4
+RELATED_HORIZON_DAYS = 90
+# Upcoming panels drift as events start, so even an unchanged generation expires.
+RELATED_CACHE_SECONDS = 600
+
+VENUE, NIGHT, CATEGORY = 1, 2, 3
+PANEL_NAMES = {VENUE: "venue", NIGHT: "night", CATEGORY: "category"}
+
+
+def _related_qs(event, region: str, now):
+    night = event.start_at.astimezone(local_timezone()).date()
+    same_night = Q(start_at__gte=local_day_start(night), start_at__lt=local_day_end(night))
+    if event.venue.town:
+        same_night &= Q(venue__town=event.venue.town)
+
+    panel = Case(
+        When(venue_id=event.venue_id, then=Value(VENUE)),
+        When(same_night, then=Value(NIGHT)),
+        default=Value(CATEGORY),
+        output_field=IntegerField(),
+    )
+
+    return (
+        Event.objects.select_related("venue")
+        .filter(
+            region=region,
+            status=EventStatus.APPROVED,
+            is_public=True,
+            is_cancelled=False,
+            venue__is_active=True,
+            start_at__gte=now,
+            start_at__lt=now + timedelta(days=RELATED_HORIZON_DAYS),
+        )
+        .filter(Q(venue_id=event.venue_id) | Q(category=event.category) | same_night)
+        # Archived events link back to the Event they were archived from.
+        .exclude(pk=getattr(event, "event_id", event.pk))
+        .annotate(
+            panel=panel,
+            panel_rank=Window(RowNumber(), partition_by=F("panel"), order_by=[F("start_at").asc(), F("pk").asc()]),
+        )
+        .filter(panel_rank__lte=RELATED_PER_PANEL)
+        .order_by("panel", "start_at", "pk")
+    )
+
+
+async def arelated_events(event, region: str) -> dict[str, list]:
+    """
+    Upcoming events related to ``event``, keyed by panel name, cached per generation.
+    """
+    event_pk = getattr(event, "event_id", event.pk)
+    key = region_cache_key(region, await aregion_generation(region), "related", event_pk)
+    related = await cache.aget(key)
+    if related is None:
+        related = {name: [] for name in PANEL_NAMES.values()}
+        async for other in _related_qs(event, region, timezone.now()):
+            related[PANEL_NAMES[other.panel]].append(other)
+        await cache.aset(key, related, RELATED_CACHE_SECONDS)
+    return related
@@ -0,0 +1,172 @@
+"""
+Rolling-window materialisation of EventSeries occurrences.
+
+Occurrences are computed in local wall-clock time (so a weekly 20:00 open
+mic stays at 20:00 across the clocks changing) and written with one
+bulk_create per series. Slugs are derived from the series slug and the
+local date; the few that are already taken get the next free ``-2``, ``-3``
+suffix, as Event.save does, with one query per round rather than per row.
+"""
+
+from __future__ import annotations
+
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .cache import bump_region_generation
+from .dates import local_timezone
+from .models import Event, EventSeries, EventStatus, RecurrenceFrequency
+
+DEFAULT_WINDOW_WEEKS = 12
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date | None:
+    first = date(year, month, 1)
+    offset = (weekday - first.weekday()) % 7
+    day = 1 + offset + (n - 1) * 7
+    if day > monthrange(year, month)[1]:
+        return None
+    return date(year, month, day)
+
+
+def occurrence_starts(series: EventSeries, until: datetime):
+    """
+    Yield aware start datetimes from first_start_at up to ``until`` (inclusive).
+    """
+    tz = local_timezone()
+    first_local = series.first_start_at.astimezone(tz)
+    wall_time = first_local.timetz().replace(tzinfo=None)
+    last_day = until.astimezone(tz).date()
+    if series.ends_on:
+        last_day = min(last_day, series.ends_on)
+
+    def at(day: date) -> datetime:
+        return datetime.combine(day, wall_time, tzinfo=tz)
+
+    if series.frequency == RecurrenceFrequency.MONTHLY_WEEKDAY:
+        weekday = first_local.weekday()
+        nth = (first_local.day - 1) // 7 + 1
+        year, month = first_local.year, first_local.month
+        while date(year, month, 1) <= last_day:
+            day = _nth_weekday(year, month, weekday, nth)
+            if day and first_local.date() <= day <= last_day:
+                yield at(day)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return
+
+    step = timedelta(weeks=2 if series.frequency == RecurrenceFrequency.FORTNIGHTLY else 1)
+    day = first_local.date()
+    while day <= last_day:
+        yield at(day)
+        day += step
+
+
+def build_occurrences(series: EventSeries, starts) -> list[Event]:
+    occurrences = [
+        Event(
+            region=series.region,
+            title=series.title,
+            slug=f"{series.slug}-{start.date().isoformat()}"[:255],
+            venue_id=series.venue_id,
+            category=series.category,
+            start_at=start,
+            end_at=start + series.duration if series.duration else None,
+            description=series.description,
+            status=series.status,
+            submitted_by_id=series.submitted_by_id,
+            reviewed_by_id=series.reviewed_by_id,
+            reviewed_at=series.reviewed_at,
+            review_note=series.review_note,
+            is_public=series.is_public,
+            series=series,
+        )
+        for start in starts
+    ]
+    # bulk_create skips save(), which is where fingerprints are normally set.
+    for event in occurrences:
+        event.fingerprint = event.compute_fingerprint()
+    return occurrences
+
+
+def _free_slugs(occurrences: list[Event]) -> None:
+    """
+    Suffix the slugs of occurrences that collide with an existing event.
+    """
+    bases = {id(event): event.slug[:240] for event in occurrences}
+    clashing = occurrences
+    suffix = 1
+    while clashing:
+        taken = set(Event.objects.filter(slug__in=[event.slug for event in clashing]).values_list("slug", flat=True))
+        clashing = [event for event in clashing if event.slug in taken]
+        suffix += 1
+        for event in clashing:
+            event.slug = f"{bases[id(event)]}-{suffix}"
+
+
+def materialise_series(series: EventSeries, *, until: datetime, now: datetime | None = None) -> int:
+    """
+    Create the occurrences of one series between its watermark (or now) and
+    ``until``. Returns the number of Event rows actually inserted.
+    """
+    now = now or timezone.now()
+    after = max(series.materialised_until or now, now)
+    if series.materialised_until is None:
+        # First run: include an occurrence starting exactly now.
+        after -= timedelta(microseconds=1)
+
+    starts = [start for start in occurrence_starts(series, until) if start > after]
+
+    if not starts:
+        EventSeries.objects.filter(pk=series.pk).update(materialised_until=until)
+        return 0
+
+    occurrences = series.occurrences.filter(start_at__in=starts)
+    with transaction.atomic():
+        existing = set(occurrences.values_list("start_at", flat=True))
+        new = build_occurrences(series, [start for start in starts if start not in existing])
+        _free_slugs(new)
+        # A slug taken by a concurrent writer since _free_slugs is still skipped here.
+        Event.objects.bulk_create(new, ignore_conflicts=True)
+
+        present = set(occurrences.values_list("start_at", flat=True))
+        missing = [start for start in starts if start not in present]
+        # Stop the watermark before anything skipped, so the next run retries it.
+        watermark = min(missing) - timedelta(microseconds=1) if missing else until
+        EventSeries.objects.filter(pk=series.pk).update(materialised_until=watermark)
+
+    return len(present) - len(existing)
+
+
+def series_due(until: datetime):
+    """
+    Live series whose window has not yet been materialised up to ``until``.
+    """
+    return (
+        EventSeries.objects.exclude(status__in=[EventStatus.REJECTED, EventStatus.CANCELLED])
+        .filter(Q(materialised_until__isnull=True) | Q(materialised_until__lt=until))
+        .order_by("pk")
+    )
+
+
+def materialise_all(*, weeks: int = DEFAULT_WINDOW_WEEKS, now: datetime | None = None) -> dict[str, int]:
+    """
+    Materialise every due series up to ``now + weeks``. Returns created counts per region.
+    """
+    now = now or timezone.now()
+    until = now + timedelta(weeks=weeks)
+
+    created: dict[str, int] = {}
+    for series in series_due(until).iterator(chunk_size=200):
+        count = materialise_series(series, until=until, now=now)
+        if count:
+            created[series.region] = created.get(series.region, 0) + count
+
+    # bulk_create skips post_save, so invalidate listings once per touched region.
+    if created:
+        bump_region_generation(*created)
+
+    return created
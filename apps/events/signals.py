@@ -0,0 +1,43 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core.edge_cache import event_key, region_key, venue_key
+from core.purge import purge_after_commit
+
+from .cache import bump_region_generation
+from .models import Event, EventRegion, Venue
+from .prerender import event_paths, schedule_prerender, venue_paths
+
+
+@receiver(pre_save, sender=Event)
+def remember_previous_region(sender, instance, update_fields=None, **kwargs):
+    """
+    If an edit moves an event between regions, both regions' caches are stale.
+    """
+    instance._previous_region = None
+    if instance.pk and (update_fields is None or "region" in update_fields):
+        instance._previous_region = (
+            Event.objects.filter(pk=instance.pk).values_list("region", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_event_region(sender, instance, **kwargs):
+    regions = {instance.region}
+    previous = getattr(instance, "_previous_region", None)
+    if previous:
+        regions.add(previous)
+    bump_region_generation(*regions)
+    schedule_prerender(lambda: event_paths(instance, previous))
+    purge_after_commit([*map(region_key, regions), venue_key(instance.venue_id), event_key(instance.pk)])
+
+
+@receiver(post_save, sender=Venue)
+@receiver(post_delete, sender=Venue)
+def invalidate_venue_regions(sender, instance, **kwargs):
+    # A venue can host events in any region; its name shows on every card.
+    bump_region_generation()
+    venue_id = instance.pk  # Cleared on the instance once a delete completes.
+    schedule_prerender(lambda: venue_paths(venue_id))
+    purge_after_commit([venue_key(venue_id), *map(region_key, EventRegion.values)])
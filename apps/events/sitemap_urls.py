@@ -0,0 +1,9 @@
+from django.urls import path
+
+from . import sitemaps
+
+urlpatterns = [
+    path("sitemap.xml", sitemaps.sitemap_index, name="sitemap_index"),
+    path("sitemaps/<str:region>/<int:year>-<int:month>.xml", sitemaps.sitemap_month, name="sitemap_month"),
+    path("sitemaps/<str:region>/venues.xml", sitemaps.sitemap_venues, name="sitemap_venues"),
+]
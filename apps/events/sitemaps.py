@@ -0,0 +1,169 @@
+"""
+XML sitemaps for crawlers.
+
+/sitemap.xml is an index of one file per region per local month of events
+(plus one per region for venues), so crawlers fetch a handful of small files
+instead of walking every listing page. Each file is built from narrow
+values() queries streamed with aiterator(), carries lastmod from the rows'
+updated_at, and is cached under the region's generation: the first fetch
+after an event or venue changes rebuilds it, every other fetch is a cache hit.
+"""
+
+from __future__ import annotations
+
+from datetime import timezone as dt_timezone
+from xml.sax.saxutils import escape
+
+from django.core.cache import cache
+from django.db.models import Max
+from django.db.models.functions import TruncMonth
+from django.http import Http404, HttpResponse
+from django.urls import reverse
+from django.views.decorators.cache import cache_control
+
+from .cache import aregion_generation, region_cache_key
+from .calendar import month_bounds
+from .dates import local_timezone
+from .models import EventRegion, Venue
+from .views import NAMESPACE_TO_REGION, _archive_qs, _public_qs
+
+SITEMAP_CACHE_SECONDS = 60 * 60 * 24
+CHUNK_SIZE = 2000
+
+REGION_TO_NAMESPACE = {region: namespace for namespace, region in NAMESPACE_TO_REGION.items()}
+
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+def _lastmod(value) -> str:
+    return value.astimezone(dt_timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _entry(tag: str, loc: str, lastmod) -> str:
+    parts = f"<loc>{escape(loc)}</loc>"
+    if lastmod:
+        parts += f"<lastmod>{_lastmod(lastmod)}</lastmod>"
+    return f"<{tag}>{parts}</{tag}>\n"
+
+
+def _url_template(name: str, kwarg: str, placeholder) -> tuple[str, str]:
+    """
+    Reverse once with a placeholder and splice each row's value in: reverse()
+    per URL is the slowest part of building a large sitemap.
+    """
+    path = reverse(name, kwargs={kwarg: placeholder})
+    head, _, tail = path.partition(str(placeholder))
+    return head, tail
+
+
+async def _region_months(region: str) -> dict[tuple[int, int], object]:
+    """
+    (year, month) -> latest change, for every local month with a public event.
+    """
+    month = TruncMonth("start_at", tzinfo=local_timezone())
+    months: dict[tuple[int, int], object] = {}
+
+    for qs, changed in ((_public_qs(region), "updated_at"), (_archive_qs(region), "archived_at")):
+        rows = qs.annotate(month=month).values("month").annotate(lastmod=Max(changed)).order_by()
+        async for row in rows:
+            key = (row["month"].year, row["month"].month)
+            months[key] = max(months.get(key, row["lastmod"]), row["lastmod"])
+    return months
+
+
+def _region_venues(region: str):
+    return Venue.objects.filter(is_active=True, events__region=region).distinct()
+
+
+async def _index_body(base: str) -> str:
+    chunks = [XML_HEADER, f'<sitemapindex xmlns="{SITEMAP_NS}">\n']
+    for region in EventRegion.values:
+        months = await _region_months(region)
+        for (year, month), lastmod in sorted(months.items()):
+            loc = base + reverse("sitemap_month", kwargs={"region": region, "year": year, "month": month})
+            chunks.append(_entry("sitemap", loc, lastmod))
+
+        venues_changed = (await _region_venues(region).aaggregate(lastmod=Max("updated_at")))["lastmod"]
+        if venues_changed:
+            chunks.append(_entry("sitemap", base + reverse("sitemap_venues", kwargs={"region": region}), venues_changed))
+    chunks.append("</sitemapindex>\n")
+    return "".join(chunks)
+
+
+async def _month_body(base: str, region: str, year: int, month: int) -> str:
+    start, end = month_bounds(year, month)
+    head, tail = _url_template(f"{REGION_TO_NAMESPACE[region]}:event_detail", "slug", "sitemap-slug")
+
+    chunks = [XML_HEADER, f'<urlset xmlns="{SITEMAP_NS}">\n']
+    for qs, changed in ((_public_qs(region), "updated_at"), (_archive_qs(region), "archived_at")):
+        rows = (
+            qs.filter(start_at__gte=start, start_at__lt=end)
+            .order_by("start_at", "pk")
+            .values("slug", changed)
+        )
+        async for row in rows.aiterator(chunk_size=CHUNK_SIZE):
+            chunks.append(_entry("url", f"{base}{head}{row['slug']}{tail}", row[changed]))
+    chunks.append("</urlset>\n")
+    return "".join(chunks)
+
+
+async def _venues_body(base: str, region: str) -> str:
+    head, tail = _url_template(f"{REGION_TO_NAMESPACE[region]}:venue_detail", "pk", 987654321)
+
+    chunks = [XML_HEADER, f'<urlset xmlns="{SITEMAP_NS}">\n']
+    rows = _region_venues(region).order_by("pk").values("pk", "updated_at")
+    async for row in rows.aiterator(chunk_size=CHUNK_SIZE):
+        chunks.append(_entry("url", f"{base}{head}{row['pk']}{tail}", row["updated_at"]))
+    chunks.append("</urlset>\n")
+    return "".join(chunks)
+
+
+async def _cached_xml(key: str, build) -> HttpResponse:
+    body = await cache.aget(key)
+    if body is None:
+        body = await build()
+        await cache.aset(key, body, SITEMAP_CACHE_SECONDS)
+    return HttpResponse(body, content_type="application/xml")
+
+
+def _base_url(request) -> str:
+    return f"{request.scheme}://{request.get_host()}"
+
+
+def _region_or_404(region: str) -> str:
+    if region not in REGION_TO_NAMESPACE:
+        raise Http404("Unknown event region")
+    return region
+
+
+@cache_control(public=True, max_age=3600)
+async def sitemap_index(request):
+    base = _base_url(request)
+    generations = [str(await aregion_generation(region)) for region in EventRegion.values]
+    key = f"events:sitemap-index:{request.get_host()}:g{'-'.join(generations)}"
+    return await _cached_xml(key, lambda: _index_body(base))
+
+
+@cache_control(public=True, max_age=3600)
+async def sitemap_month(request, region: str, year: int, month: int):
+    region = _region_or_404(region)
+    try:
+        month_bounds(year, month)
+    except (ValueError, OverflowError):
+        raise Http404("Unknown month")
+
+    base = _base_url(request)
+    generation = await aregion_generation(region)
+    key = region_cache_key(region, generation, "sitemap", request.get_host(), f"{year}-{month:02d}")
+    return await _cached_xml(key, lambda: _month_body(base, region, year, month))
+
+
+@cache_control(public=True, max_age=3600)
+async def sitemap_venues(request, region: str):
+    region = _region_or_404(region)
+
+    base = _base_url(request)
+    generation = await aregion_generation(region)
+    key = region_cache_key(region, generation, "sitemap", request.get_host(), "venues")
+    return await _cached_xml(key, lambda: _venues_body(base, region))
@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.events.models import Event, EventCategory, EventRegion, EventStatus, Venue
+from core.admin_tools import EstimatedCountPaginator, estimated_row_count
+
+
+class EventAdminTestCase(TestCase):
+    def setUp(self):
+        self.admin_user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(self.admin_user)
+
+        self.bull = Venue.objects.create(name="The Bull", is_active=True)
+        self.crown = Venue.objects.create(name="The Crown", is_active=True)
+        start = timezone.now() + timedelta(days=2)
+        for venue, title in ((self.bull, "Bull Gig"), (self.crown, "Crown Gig")):
+            Event.objects.create(
+                region=EventRegion.OXFORD,
+                title=title,
+                venue=venue,
+                category=EventCategory.MUSIC,
+                start_at=start,
+                status=EventStatus.APPROVED,
+            )
+
+    def test_changelist_venue_filter_uses_autocomplete(self):
+        url = reverse("admin:events_event_changelist")
+        response = self.client.get(url, {"venue__id__exact": self.bull.pk, "status__exact": "approved"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Bull Gig")
+        self.assertNotContains(response, "Crown Gig")
+        # Selected venue is rendered; other venues are left to the autocomplete endpoint.
+        self.assertContains(response, "admin-autocomplete")
+        self.assertContains(response, 'name="status__exact" value="approved"')
+        self.assertNotContains(response, "The Crown")
+
+    def test_changelist_filters_dates_without_aggregating_them(self):
+        url = reverse("admin:events_event_changelist")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Past 7 days")
+        self.assertFalse(any("DISTINCT" in q["sql"] and "start_at" in q["sql"] for q in queries.captured_queries))
+
+    def test_paginator_falls_back_to_exact_count_without_estimate(self):
+        qs = Event.objects.all()
+        self.assertIsNone(estimated_row_count(qs))  # sqlite in tests
+        self.assertEqual(EstimatedCountPaginator(qs, 10).count, 2)
@@ -0,0 +1,134 @@
+import html
+import re
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.analytics.buffer import buffer
+from apps.analytics.hll import HyperLogLog
+from apps.analytics.models import DailyEventViews, DailyTraffic
+from apps.analytics.reports import most_viewed_events, unique_visitors
+from apps.events.dates import local_timezone
+from apps.events.models import Event, EventRegion, EventStatus, Venue
+
+
+User = get_user_model()
+
+BROWSER = "Mozilla/5.0 (X11; Linux x86_64) Firefox/140.0"
+
+BEACON = re.compile(r'class="page-view-beacon".*?hx-get="([^"]+)"', re.S)
+
+
+class HyperLogLogTests(SimpleTestCase):
+    def test_estimate_and_merge(self):
+        left, right = HyperLogLog(), HyperLogLog()
+        for i in range(20_000):
+            (left if i % 2 else right).add(f"visitor-{i}")
+            left.add(f"visitor-{i % 100}")  # repeats do not count twice
+
+        merged = HyperLogLog(left.to_bytes()).merge(right)
+
+        self.assertAlmostEqual(merged.count(), 20_000, delta=20_000 * 0.05)
+        self.assertEqual(HyperLogLog().count(), 0)
+
+
+class PageViewCountingTests(TestCase):
+    def setUp(self):
+        buffer._take()
+        self.addCleanup(buffer._take)
+        venue = Venue.objects.create(name="The Cellar")
+        self.events = [
+            Event.objects.create(
+                region=EventRegion.OXFORD,
+                title=f"Gig {i}",
+                venue=venue,
+                start_at=timezone.now() + timedelta(days=i + 1),
+                status=EventStatus.APPROVED,
+            )
+            for i in range(3)
+        ]
+
+    def _view(self, event, ip="203.0.113.5", agent=BROWSER):
+        """
+        View an event page as a browser would, following its beacon if any.
+        """
+        url = reverse("oxford:event_detail", kwargs={"slug": event.slug})
+        response = self.client.get(url, HTTP_USER_AGENT=agent, REMOTE_ADDR=ip)
+        beacon = BEACON.search(response.content.decode())
+        if beacon:
+            self.client.get(html.unescape(beacon.group(1)), HTTP_USER_AGENT=agent, REMOTE_ADDR=ip)
+        return response
+
+    def test_views_are_buffered_then_upserted(self):
+        self._view(self.events[0])
+        self._view(self.events[0], ip="198.51.100.7")
+        self.assertFalse(DailyEventViews.objects.exists())
+
+        buffer.flush()
+        self._view(self.events[0])
+        self._view(self.events[1])
+        buffer.flush()
+
+        views = dict(DailyEventViews.objects.values_list("event_id", "views"))
+        self.assertEqual(views, {self.events[0].pk: 3, self.events[1].pk: 1})
+        traffic = DailyTraffic.objects.get(region=EventRegion.OXFORD)
+        self.assertEqual(traffic.page_views, 4)
+        self.assertEqual(traffic.unique_visitors, 2)
+        today = timezone.localdate(timezone=local_timezone())
+        self.assertEqual(unique_visitors(today, today), 2)
+
+    def test_views_count_on_the_local_day(self):
+        # 00:30 on 2 June in London (BST), still 1 June in UTC.
+        with mock.patch("django.utils.timezone.now", return_value=datetime(2030, 6, 1, 23, 30, tzinfo=dt_timezone.utc)):
+            self._view(self.events[0])
+        buffer.flush()
+
+        self.assertEqual(DailyTraffic.objects.get(region=EventRegion.OXFORD).day, date(2030, 6, 2))
+
+    def test_bots_staff_and_misses_are_not_counted(self):
+        self._view(self.events[0], agent="Googlebot/2.1")
+        self.client.get(reverse("oxford:event_detail", kwargs={"slug": "no-such-event"}), HTTP_USER_AGENT=BROWSER)
+        staff = User.objects.create_user("mod", password="pw", is_staff=True)
+        self.client.force_login(staff)
+        self._view(self.events[0])
+
+        self.assertEqual(buffer.flush(), 0)
+
+    def test_signed_in_views_are_counted_without_a_beacon(self):
+        self.client.force_login(User.objects.create_user("fan", password="pw"))
+        response = self._view(self.events[0])
+
+        self.assertNotContains(response, "page-view-beacon")
+        buffer.flush()
+        self.assertEqual(DailyEventViews.objects.get(event_id=self.events[0].pk).views, 1)
+
+    def test_shared_copies_are_counted_by_the_beacon(self):
+        url = reverse("oxford:event_detail", kwargs={"slug": self.events[0].slug})
+        response = self.client.get(url, HTTP_USER_AGENT=BROWSER)
+        self.assertContains(response, "page-view-beacon")
+        self.assertEqual(buffer.flush(), 0)
+
+        beacon = html.unescape(BEACON.search(response.content.decode()).group(1))
+        for _ in range(2):
+            self.assertEqual(self.client.get(beacon, HTTP_USER_AGENT=BROWSER).status_code, 204)
+        buffer.flush()
+
+        self.assertEqual(DailyEventViews.objects.get(event_id=self.events[0].pk).views, 2)
+        self.assertEqual(self.client.get(reverse("analytics:page_view"), {"region": "atlantis"}).status_code, 204)
+        self.assertEqual(buffer.flush(), 0)
+
+    def test_most_viewed_this_week(self):
+        for event, hits in zip(self.events, (2, 5, 1)):
+            for i in range(hits):
+                self._view(event, ip=f"192.0.2.{i}")
+        buffer.flush()
+
+        ranked = most_viewed_events(EventRegion.OXFORD, limit=2)
+
+        self.assertEqual([e.pk for e in ranked], [self.events[1].pk, self.events[0].pk])
+        self.assertEqual(ranked[0].recent_views, 5)
@@ -0,0 +1,101 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.events.cache import bump_region_generation
+from apps.events.models import Event, EventCategory, EventRegion, EventSeries, EventStatus, Venue
+from core.purge import get_purge_backend
+
+
+@override_settings(SHARED_CACHE_PURGE_BACKEND="core.purge.LocalPurgeBackend", THROTTLE_ENABLED=False)
+class SharedCacheTests(TestCase):
+    def setUp(self):
+        self.addCleanup(bump_region_generation)
+        self.purged = get_purge_backend()
+        self.purged.reset()
+
+        self.venue = Venue.objects.create(name="The Bull", is_active=True)
+        self.event = Event.objects.create(
+            region=EventRegion.OXFORD,
+            title="Open Mic Night",
+            venue=self.venue,
+            category=EventCategory.OPEN_MIC,
+            start_at=timezone.now() + timedelta(days=3),
+            status=EventStatus.APPROVED,
+            is_public=True,
+        )
+
+    def _purged_keys(self):
+        return {key for keys in self.purged.purged for key in keys}
+
+    def test_anonymous_detail_is_public_with_surrogate_keys(self):
+        response = self.client.get(reverse("oxford:event_detail", kwargs={"slug": self.event.slug}))
+
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("s-maxage=300", response["Cache-Control"])
+        self.assertIn("stale-while-revalidate=60", response["Cache-Control"])
+        keys = f"event-{self.event.pk} region-oxford venue-{self.venue.pk}"
+        self.assertEqual(response["Surrogate-Key"], keys)
+        self.assertEqual(response["Cache-Tag"], keys.replace(" ", ","))
+
+    def test_listing_and_landing_carry_region_keys(self):
+        response = self.client.get(reverse("westoxon:upcoming_events"))
+        self.assertEqual(response["Surrogate-Key"], "region-westoxon")
+
+        response = self.client.get(reverse("landing:home"))
+        self.assertEqual(response["Surrogate-Key"].split(), sorted(f"region-{r}" for r in EventRegion.values))
+
+    def test_signed_in_requests_are_private(self):
+        user = get_user_model().objects.create_user("someone", password="x")
+        self.client.force_login(user)
+
+        response = self.client.get(reverse("oxford:upcoming_events"))
+
+        self.assertIn("private", response["Cache-Control"])
+        self.assertNotIn("public", response["Cache-Control"])
+        self.assertFalse(response.has_header("Surrogate-Key"))
+
+    def test_non_public_routes_are_left_alone(self):
+        response = self.client.get(reverse("oxford:event_detail", kwargs={"slug": "missing"}))
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.has_header("Surrogate-Key"))
+
+    def test_event_change_purges_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.is_public = False
+            self.event.save()
+
+        self.assertEqual(self._purged_keys(), {"region-oxford", f"venue-{self.venue.pk}", f"event-{self.event.pk}"})
+
+    def test_series_review_purges_occurrences(self):
+        series = EventSeries.objects.create(
+            region=EventRegion.OXFORD,
+            title="Weekly Jam",
+            venue=self.venue,
+            first_start_at=timezone.now() + timedelta(days=1),
+        )
+        occurrence = Event.objects.create(
+            region=EventRegion.OXFORD,
+            title="Weekly Jam",
+            venue=self.venue,
+            series=series,
+            start_at=timezone.now() + timedelta(days=1),
+            status=EventStatus.PENDING,
+        )
+        self.purged.reset()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            series.approve(get_user_model().objects.create_user("mod", password="x"))
+
+        self.assertIn(f"event-{occurrence.pk}", self._purged_keys())
+        self.assertIn("region-oxford", self._purged_keys())
+
+    @override_settings(SHARED_CACHE_ENABLED=False)
+    def test_can_be_disabled(self):
+        response = self.client.get(reverse("oxford:upcoming_events"))
+
+        self.assertFalse(response.has_header("Surrogate-Key"))
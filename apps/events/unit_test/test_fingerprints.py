@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.events.dates import local_timezone
+from apps.events.fingerprints import normalise_title
+from apps.events.forms import EventForm
+from apps.events.management.commands.migrate_legacy_events import Command as MigrateLegacyEvents
+from apps.events.models import Event, EventRegion, EventStatus, Venue
+
+
+class EventFingerprintTests(TestCase):
+    def setUp(self):
+        self.venue = Venue.objects.create(name="The Bullingdon")
+        self.start = datetime(2030, 5, 2, 20, 0, tzinfo=local_timezone())
+        self.event = Event.objects.create(
+            region=EventRegion.OXFORD,
+            title="Jazz Night",
+            venue=self.venue,
+            start_at=self.start,
+            status=EventStatus.APPROVED,
+        )
+
+    def _form(self, **overrides):
+        data = {
+            "region": EventRegion.OXFORD,
+            "title": "JAZZ   night!",
+            "venue": self.venue.pk,
+            "category": "music",
+            "start_at": timezone.localtime(self.start).strftime("%Y-%m-%dT%H:%M"),
+            "is_public": True,
+            **overrides,
+        }
+        return EventForm(data)
+
+    def test_normalise_title_ignores_case_accents_and_punctuation(self):
+        self.assertEqual(normalise_title("  Café — JAZZ_night! "), "cafe jazz night")
+
+    def test_save_sets_fingerprint_and_minute_granularity(self):
+        twin = Event(region=EventRegion.OXFORD, title="jazz night.", venue=self.venue, start_at=self.start + timedelta(seconds=30))
+        self.assertEqual(twin.compute_fingerprint(), self.event.fingerprint)
+        self.assertEqual(len(self.event.fingerprint), 32)
+
+    def test_submission_form_rejects_live_duplicate(self):
+        form = self._form()
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.errors.as_data()["__all__"][0].code, "duplicate")
+
+        self.assertTrue(self._form(title="Blues Night").is_valid())
+
+    def test_rejected_events_do_not_count_as_duplicates(self):
+        self.event.status = EventStatus.REJECTED
+        self.event.save(update_fields=["status", "updated_at"])
+
+        self.assertTrue(self._form().is_valid())
+        self.assertFalse(Event.live_duplicates([self.event.fingerprint]).exists())
+
+    def test_legacy_rerun_skips_events_in_any_status(self):
+        self.event.status = EventStatus.REJECTED
+        self.event.save(update_fields=["status", "updated_at"])
+
+        _slugs, fingerprints = MigrateLegacyEvents()._existing_events(EventRegion.OXFORD, [], [self.event.fingerprint])
+
+        self.assertEqual(fingerprints, {self.event.fingerprint})
+
+    def test_title_edit_with_update_fields_refreshes_fingerprint(self):
+        old = self.event.fingerprint
+        self.event.title = "Swing Night"
+        self.event.save(update_fields=["title"])
+
+        self.event.refresh_from_db()
+        self.assertNotEqual(self.event.fingerprint, old)
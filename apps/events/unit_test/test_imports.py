@@ -0,0 +1,146 @@
+import io
+import json
+from datetime import datetime
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+
+from apps.events.dates import local_timezone
+from apps.events.imports import ImportFormatError, import_events, row_errors
+from apps.events.models import Event, EventImport, EventImportRow, EventRegion, EventStatus, Venue
+
+
+User = get_user_model()
+
+HEADER = "title,slug,venue,category,start_at,end_at,is_cancelled,cancelled_at,cancellation_note\n"
+
+
+class EventImportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("organiser", password="pw")
+        self.venue = Venue.objects.create(name="The Bullingdon", slug="the-bullingdon")
+        self.batch = EventImport.objects.create(region=EventRegion.OXFORD, uploaded_by=self.user)
+
+    def _run(self, body: str, fmt: str = "csv") -> dict[int, str]:
+        import_events(self.batch, io.StringIO(body), fmt)
+        return dict(row_errors(self.batch))
+
+    def test_valid_rows_become_pending_events(self):
+        errors = self._run(
+            HEADER
+            + "Jazz Night,,the-bullingdon,music,2031-05-01 20:00,2031-05-01 23:00,,,\n"
+            + "Jazz Night,,the-bullingdon,music,2031-05-08 20:00,,yes,,Band unwell\n"
+        )
+        self.assertEqual(errors, {})
+        self.assertEqual((self.batch.total_rows, self.batch.imported_rows, self.batch.failed_rows), (2, 2, 0))
+
+        first, second = Event.objects.order_by("start_at")
+        self.assertEqual(first.slug, "jazz-night-2031-05-01")
+        self.assertEqual(first.status, EventStatus.PENDING)
+        self.assertEqual(first.submitted_by, self.user)
+        self.assertEqual(first.start_at, datetime(2031, 5, 1, 20, 0, tzinfo=local_timezone()))
+        self.assertEqual(first.fingerprint, first.compute_fingerprint())
+        self.assertIsNone(first.cancelled_at)
+        self.assertTrue(second.is_cancelled)
+        self.assertIsNotNone(second.cancelled_at)
+
+    def test_form_rules_are_reported_per_row(self):
+        Event.objects.create(
+            region=EventRegion.OXFORD,
+            title="Taken",
+            slug="taken",
+            venue=self.venue,
+            start_at=datetime(2031, 1, 1, 12, 0, tzinfo=local_timezone()),
+        )
+        errors = self._run(
+            HEADER
+            + "Good,,the-bullingdon,,2031-06-01 20:00,,,,\n"
+            + "Nowhere,,no-such-venue,,2031-06-01 20:00,,,,\n"
+            + "Backwards,,the-bullingdon,,2031-06-01 20:00,2031-06-01 19:00,,,\n"
+            + "Bad date,,the-bullingdon,,next tuesday,,,,\n"
+            + "Good,,the-bullingdon,,2031-06-01 20:00,,,,\n"
+            + "Slug clash,taken,the-bullingdon,,2031-06-02 20:00,,,,\n"
+            + "Odd category,,the-bullingdon,opera-ish,2031-06-03 20:00,,,,\n"
+        )
+        self.assertEqual(sorted(errors), [3, 4, 5, 6, 7, 8])
+        self.assertIn("no-such-venue", errors[3])
+        self.assertIn("End time must be after", errors[4])
+        self.assertIn("start_at", errors[5])
+        self.assertIn("earlier row", errors[6])
+        self.assertIn("already in use", errors[7])
+        self.assertIn("category", errors[8])
+        self.assertEqual(self.batch.imported_rows, 1)
+        self.assertTrue(Event.objects.filter(title="Good", category="other").exists())
+
+    def test_live_duplicates_are_rejected(self):
+        self._run(HEADER + "Quiz,,the-bullingdon,,2031-07-01 19:30,,,,\n")
+        second = EventImport.objects.create(region=EventRegion.OXFORD, uploaded_by=self.user)
+        import_events(second, io.StringIO('[{"title": "QUIZ!", "venue": "the-bullingdon", "start_at": "2031-07-01T19:30"}]'), "json")
+        self.assertIn("Already listed", dict(row_errors(second))[1])
+        self.assertEqual(Event.objects.count(), 1)
+
+    def test_missing_header_columns_fail_the_upload(self):
+        with self.assertRaises(ImportFormatError):
+            self._run("name,when\nJazz,2031-05-01\n")
+
+
+@skipUnless(connection.vendor == "postgresql", "COPY and RETURNING run on PostgreSQL")
+class PostgresEventImportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("organiser", password="pw")
+        Venue.objects.create(name="The Bullingdon", slug="the-bullingdon")
+        self.batch = EventImport.objects.create(region=EventRegion.OXFORD, uploaded_by=self.user)
+
+    def test_copy_keeps_text_nulls_and_timestamps(self):
+        description = 'Doors 7pm, "no" under-18s\nBar: £5, cash only \\ cards'
+        records = [
+            {
+                "title": "Jazz, Night",
+                "slug": "jazz",
+                "venue": "the-bullingdon",
+                "start_at": "2031-05-01T20:00",
+                "is_cancelled": "yes",
+                "cancelled_at": "2031-04-30T09:15",
+                "cancellation_note": "",
+                "description": description,
+            },
+            {"title": "No end", "venue": "the-bullingdon", "start_at": "2031-05-02T20:00"},
+        ]
+        import_events(self.batch, io.StringIO(json.dumps(records)), "json")
+
+        first, second = EventImportRow.objects.filter(batch=self.batch).order_by("line")
+        self.assertEqual(first.title, "Jazz, Night")
+        self.assertEqual(first.description, description)
+        self.assertEqual(first.cancellation_note, "")
+        self.assertTrue(first.is_cancelled)
+        self.assertEqual(first.start_at, datetime(2031, 5, 1, 20, 0, tzinfo=local_timezone()))
+        self.assertEqual(first.cancelled_at, datetime(2031, 4, 30, 9, 15, tzinfo=local_timezone()))
+        self.assertIsNone(first.end_at)
+        self.assertFalse(second.is_cancelled)
+        self.assertEqual(second.slug, "no-end-2031-05-02")
+
+    def test_merge_links_rows_to_the_events_it_returned(self):
+        Event.objects.create(
+            region=EventRegion.OXFORD,
+            title="Taken",
+            slug="taken",
+            venue=Venue.objects.get(slug="the-bullingdon"),
+            start_at=datetime(2031, 1, 1, 12, 0, tzinfo=local_timezone()),
+        )
+        import_events(
+            self.batch,
+            io.StringIO(
+                HEADER
+                + "Quiz,,the-bullingdon,,2031-07-01 19:30,,,,\n"
+                + "Slug clash,taken,the-bullingdon,,2031-07-02 19:30,,,,\n"
+            ),
+            "csv",
+        )
+
+        quiz, clash = EventImportRow.objects.filter(batch=self.batch).order_by("line")
+        self.assertEqual(quiz.event, Event.objects.get(slug="quiz-2031-07-01"))
+        self.assertIsNone(clash.event)
+        self.assertIn("already in use", clash.error)
+        self.assertEqual((self.batch.imported_rows, self.batch.failed_rows), (1, 1))
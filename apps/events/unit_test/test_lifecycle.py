@@ -0,0 +1,61 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.events.lifecycle import archive_past_events, expire_stale_pending
+from apps.events.models import ArchivedEvent, Event, EventRegion, EventStatus, Venue
+from apps.moderation.models import EventModerationLog, ModerationAction
+
+
+class EventLifecycleTests(TestCase):
+    def setUp(self):
+        self.venue = Venue.objects.create(name="The Jericho Tavern", is_active=True)
+        self.now = timezone.now()
+
+    def _event(self, title, days, status=EventStatus.APPROVED):
+        return Event.objects.create(
+            region=EventRegion.OXFORD,
+            title=title,
+            venue=self.venue,
+            start_at=self.now + timedelta(days=days),
+            status=status,
+        )
+
+    def test_expire_rejects_stale_pending_in_batches_and_logs(self):
+        stale = [self._event(f"Stale {i}", -1 - i, EventStatus.PENDING) for i in range(3)]
+        fresh = self._event("Still Pending", 2, EventStatus.PENDING)
+
+        self.assertEqual(expire_stale_pending(now=self.now, batch_size=2), 3)
+
+        self.assertEqual(Event.objects.filter(status=EventStatus.REJECTED).count(), 3)
+        fresh.refresh_from_db()
+        self.assertEqual(fresh.status, EventStatus.PENDING)
+        logged = set(
+            EventModerationLog.objects.filter(action=ModerationAction.EXPIRE).values_list("event_id", flat=True)
+        )
+        self.assertEqual(logged, {e.pk for e in stale})
+
+    def test_archive_moves_old_events_and_past_listing_continues_into_archive(self):
+        old = self._event("Old Gig", -400)
+        recent = self._event("Recent Gig", -3)
+
+        archived = archive_past_events(cutoff=self.now - timedelta(days=180), batch_size=1)
+
+        self.assertEqual(archived, {EventRegion.OXFORD: 1})
+        self.assertFalse(Event.objects.filter(pk=old.pk).exists())
+        self.assertTrue(Event.objects.filter(pk=recent.pk).exists())
+        self.assertEqual(ArchivedEvent.objects.get(event_id=old.pk).slug, old.slug)
+
+        url = reverse("oxford:past_events")
+        response = self.client.get(url)
+        self.assertContains(response, "Recent Gig")
+        self.assertContains(response, "scope=archive")
+
+        response = self.client.get(url, {"scope": "archive"})
+        self.assertContains(response, "Old Gig")
+        self.assertNotContains(response, "Recent Gig")
+
+        response = self.client.get(reverse("oxford:event_detail", kwargs={"slug": old.slug}))
+        self.assertContains(response, "Old Gig")
@@ -0,0 +1,95 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.events.models import ArchivedEvent, Event, EventRegion, Venue
+from apps.moderation.history import attach_events
+from apps.moderation.models import EventModerationLog, ModerationAction
+
+
+User = get_user_model()
+
+
+class ModerationHistoryTests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user("mod", password="pw", is_staff=True)
+        self.client.force_login(self.staff)
+        self.venue = Venue.objects.create(name="O2 Academy")
+        self.start = timezone.now() + timedelta(days=3)
+
+    def _event(self, title: str) -> Event:
+        return Event.objects.create(region=EventRegion.OXFORD, title=title, venue=self.venue, start_at=self.start)
+
+    def _log(self, event_id: int, action=ModerationAction.APPROVE, **kwargs):
+        return EventModerationLog.objects.create(
+            region=EventRegion.OXFORD, event_id=event_id, action=action, actor=self.staff, **kwargs
+        )
+
+    def test_attach_events_resolves_live_archived_and_deleted(self):
+        live = self._event("Live")
+        gone = self._event("Gone")
+        ArchivedEvent.objects.create(
+            event_id=gone.pk, region=EventRegion.OXFORD, title="Gone", slug="gone", venue=self.venue,
+            start_at=self.start, status="approved", created_at=timezone.now(),
+        )
+        gone_id = gone.pk
+        gone.delete()
+        logs = [self._log(live.pk), self._log(gone_id), self._log(999_999)]
+
+        with self.assertNumQueries(3):
+            attach_events(EventModerationLog.objects.filter(pk__in=[log.pk for log in logs]).order_by("pk"))
+
+        resolved = attach_events(EventModerationLog.objects.order_by("pk"))
+        self.assertEqual([getattr(log.event, "title", None) for log in resolved], ["Live", "Gone", None])
+
+    def test_log_page_query_count_does_not_grow_with_rows(self):
+        def queries_for(rows: int) -> int:
+            EventModerationLog.objects.all().delete()
+            for i in range(rows):
+                self._log(self._event(f"Gig {rows}-{i}").pk)
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.get(reverse("moderation:log"))
+            self.assertContains(response, f"Gig {rows}-0")
+            return len(captured)
+
+        self.assertEqual(queries_for(2), queries_for(12))
+
+    def test_log_pages_by_cursor_without_counting(self):
+        event = self._event("Paged Gig")
+        now = timezone.now()
+        for minutes in range(3):
+            self._log(event.pk, note=f"note {minutes}", acted_at=now - timedelta(minutes=minutes))
+
+        with mock.patch("apps.moderation.views.LOG_PAGE_SIZE", 2):
+            with CaptureQueriesContext(connection) as captured:
+                first = self.client.get(reverse("moderation:log"))
+            self.assertFalse(any("COUNT(" in q["sql"] for q in captured.captured_queries))
+            self.assertContains(first, "note 0")
+            self.assertContains(first, "note 1")
+            self.assertNotContains(first, "note 2")
+
+            older = self.client.get(reverse("moderation:log"), {"cursor": first.context["page"].next_cursor})
+        self.assertContains(older, "note 2")
+        self.assertNotContains(older, "note 1")
+        self.assertContains(older, "Newest")
+
+    def test_decision_row_shows_timeline_newest_first(self):
+        event = self._event("Resubmitted Ceilidh")
+        self._log(event.pk, ModerationAction.REJECT, note="Wrong venue", acted_at=timezone.now() - timedelta(days=2))
+        self._log(event.pk, ModerationAction.APPROVE, note="Fixed")
+
+        response = self.client.get(reverse("moderation:decision_row:row", args=["oxford", event.pk]))
+
+        self.assertContains(response, "Resubmitted Ceilidh")
+        body = response.content.decode()
+        self.assertLess(body.index("Fixed"), body.index("Wrong venue"))
+
+    def test_decision_row_unknown_event_is_404(self):
+        response = self.client.get(reverse("moderation:decision_row:row", args=["oxford", 424242]))
+        self.assertEqual(response.status_code, 404)
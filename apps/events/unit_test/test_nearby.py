@@ -0,0 +1,70 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.events.geo import covering_cells, geohash_encode, haversine_miles
+from apps.events.models import Event, EventRegion, EventStatus, PostcodeCentroid, Venue
+from apps.events.nearby import venue_distances
+
+
+class NearbyTests(TestCase):
+    def setUp(self):
+        PostcodeCentroid.objects.create(postcode="OX1", latitude=51.7505, longitude=-1.2600)
+        PostcodeCentroid.objects.create(postcode="OX28", latitude=51.7850, longitude=-1.4850)
+        PostcodeCentroid.objects.create(postcode="OX16", latitude=52.0620, longitude=-1.3400)
+
+        self.oxford = Venue.objects.create(name="The Jericho Tavern", postcode="OX1 2AB")
+        self.witney = Venue.objects.create(name="The Fleece", postcode="ox28 6ab")
+        self.banbury = Venue.objects.create(name="Banbury Mill", postcode="OX16 5TE")
+
+    def test_venue_geocodes_from_outward_code_on_save(self):
+        self.assertAlmostEqual(self.witney.latitude, 51.7850)
+        self.assertEqual(self.witney.geohash, geohash_encode(51.7850, -1.4850))
+
+    def test_changed_postcode_regeocodes(self):
+        self.witney.postcode = "OX16 1AA"
+        self.witney.save()
+
+        self.assertAlmostEqual(self.witney.latitude, 52.0620)
+        self.assertEqual(self.witney.geohash, geohash_encode(52.0620, -1.3400))
+
+        self.witney.postcode, self.witney.latitude, self.witney.longitude = "OX1 1AA", 51.0, -1.0
+        self.witney.save()
+        self.assertEqual((self.witney.latitude, self.witney.longitude), (51.0, -1.0))
+
+    def test_covering_cells_contain_every_point_in_radius(self):
+        cells = covering_cells(51.7505, -1.2600, 10)
+        witney_hash = self.witney.geohash
+        self.assertTrue(any(witney_hash.startswith(cell) for cell in cells))
+
+    def test_radius_search_refines_by_haversine(self):
+        distances = venue_distances(51.7505, -1.2600, 10)
+        self.assertIn(self.oxford.pk, distances)
+        self.assertIn(self.witney.pk, distances)
+        self.assertNotIn(self.banbury.pk, distances)
+        self.assertAlmostEqual(distances[self.witney.pk], haversine_miles(51.7505, -1.26, 51.785, -1.485), places=3)
+
+    def test_near_events_view(self):
+        event = Event.objects.create(
+            region=EventRegion.WEST_OXON,
+            title="Witney Folk Night",
+            venue=self.witney,
+            start_at=timezone.now() + timedelta(days=2),
+            status=EventStatus.APPROVED,
+        )
+
+        response = self.client.get(reverse("westoxon:near_events"), {"postcode": "OX1 4AU", "miles": "10"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["events"], [event])
+        self.assertContains(response, "miles")
+
+    def test_load_command_geocodes_existing_venues(self):
+        Venue.objects.filter(pk=self.banbury.pk).update(latitude=None, longitude=None, geohash="")
+        call_command("load_postcode_centroids", stdout=StringIO())
+        self.banbury.refresh_from_db()
+        self.assertIsNotNone(self.banbury.latitude)
+        self.assertTrue(PostcodeCentroid.objects.filter(postcode="OX9").exists())
@@ -0,0 +1,89 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.events.cache import bump_region_generation
+from apps.events.models import Event, EventCategory, EventRegion, EventStatus, Venue
+from apps.events.next_up import NEXT_UP_FEATURED, NEXT_UP_PER_REGION, next_up
+
+
+class NextUpTests(TestCase):
+    def setUp(self):
+        bump_region_generation()
+        self.addCleanup(bump_region_generation)
+
+        self.venue = Venue.objects.create(name="The Bull", is_active=True)
+        self.now = timezone.now()
+
+    def _event(self, title, region, hours, **kwargs):
+        fields = dict(
+            region=region,
+            title=title,
+            venue=self.venue,
+            category=EventCategory.MUSIC,
+            start_at=self.now + timedelta(hours=hours),
+            status=EventStatus.APPROVED,
+            is_public=True,
+        )
+        fields.update(kwargs)
+        return Event.objects.create(**fields)
+
+    def test_next_events_per_region(self):
+        for hours in range(1, NEXT_UP_PER_REGION + 3):
+            self._event(f"Oxford {hours}", EventRegion.OXFORD, hours)
+        west = self._event("Witney Gig", EventRegion.WEST_OXON, 5)
+        self._event("Past", EventRegion.WEST_OXON, -5)
+        self._event("Pending", EventRegion.WEST_OXON, 2, status=EventStatus.PENDING)
+
+        regions = {region: events for region, _label, events in next_up()["regions"]}
+
+        self.assertEqual(
+            [e.title for e in regions[EventRegion.OXFORD]],
+            [f"Oxford {h}" for h in range(1, NEXT_UP_PER_REGION + 1)],
+        )
+        self.assertEqual(regions[EventRegion.WEST_OXON], [west])
+        self.assertEqual(regions[EventRegion.NORTH_OXON], [])
+
+    def test_featured_across_regions(self):
+        for hours in range(1, NEXT_UP_FEATURED + 3):
+            region = EventRegion.OXFORD if hours % 2 else EventRegion.SOUTH_OXON
+            self._event(f"Featured {hours}", region, hours * 24, is_featured=True)
+
+        featured = next_up()["featured"]
+
+        self.assertEqual([e.title for e in featured], [f"Featured {h}" for h in range(1, NEXT_UP_FEATURED + 1)])
+
+    def test_landing_page_is_one_query_then_cached(self):
+        self._event("Open Mic", EventRegion.OXFORD, 3)
+        panto = self._event("Panto", EventRegion.EAST_OXON, 4, is_featured=True)
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse("landing:home"))
+        self.assertContains(response, "Open Mic")
+        self.assertContains(response, reverse("eastoxon:event_detail", kwargs={"slug": panto.slug}))
+        self.assertEqual(len([q for q in captured.captured_queries if "events_event" in q["sql"]]), 1)
+
+        with CaptureQueriesContext(connection) as captured:
+            self.client.get(reverse("landing:home"))
+        self.assertEqual(len([q for q in captured.captured_queries if "events_event" in q["sql"]]), 0)
+
+    def test_cache_key_reads_every_generation_at_once(self):
+        next_up()
+
+        with mock.patch("apps.events.cache.cache", wraps=cache) as wrapped:
+            next_up()
+        wrapped.get_many.assert_called_once()
+        wrapped.get_or_set.assert_not_called()
+
+    def test_listing_change_rebuilds(self):
+        self.assertEqual(next_up()["featured"], [])
+
+        event = self._event("Panto", EventRegion.EAST_OXON, 4, is_featured=True)
+
+        self.assertEqual(next_up()["featured"], [event])
@@ -0,0 +1,130 @@
+import shutil
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.events.cache import bump_region_generation
+from apps.events.models import Event, EventCategory, EventRegion, EventStatus, PendingPrerender, Venue
+from apps.events.prerender import file_for
+
+
+class PrerenderTests(TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        override = override_settings(PRERENDER_ROOT=str(self.root))
+        override.enable()
+        self.addCleanup(override.disable)
+        self.addCleanup(bump_region_generation)
+
+        self.venue = Venue.objects.create(name="The Bull", is_active=True)
+        self.event = Event.objects.create(
+            region=EventRegion.OXFORD,
+            title="Open Mic Night",
+            venue=self.venue,
+            category=EventCategory.OPEN_MIC,
+            start_at=timezone.now() + timedelta(days=3),
+            status=EventStatus.APPROVED,
+            is_public=True,
+        )
+
+    def _file(self, name, **kwargs):
+        return file_for(reverse(name, kwargs=kwargs))
+
+    def test_command_renders_public_pages(self):
+        out = StringIO()
+        call_command("prerender_site", stdout=out)
+
+        detail = self._file("oxford:event_detail", slug=self.event.slug)
+        self.assertIn("Open Mic Night", detail.read_text())
+        self.assertIn("Open Mic Night", self._file("oxford:upcoming_events").read_text())
+        self.assertTrue(self._file("oxford:venue_detail", pk=self.venue.pk).exists())
+        self.assertTrue(self._file("landing:home").exists())
+        self.assertIn("Summary: rendered=", out.getvalue())
+
+    def test_prune_removes_pages_no_longer_listed(self):
+        stale = self.root / "oxford" / "gone" / "index.html"
+        stale.parent.mkdir(parents=True)
+        stale.write_text("old")
+
+        call_command("prerender_site", "--prune", stdout=StringIO())
+
+        self.assertFalse(stale.exists())
+        self.assertTrue(self._file("oxford:event_detail", slug=self.event.slug).exists())
+
+    @override_settings(PRERENDER_ON_SAVE=True)
+    def test_save_queues_affected_pages_for_the_worker(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.title = "Poetry Slam"
+            self.event.save()
+
+        # Nothing is rendered in the saving request.
+        self.assertFalse(any(self.root.iterdir()))
+        detail = reverse("oxford:event_detail", kwargs={"slug": self.event.slug})
+        self.assertTrue(PendingPrerender.objects.filter(path=detail).exists())
+
+        call_command("prerender_site", "--pending", stdout=StringIO())
+
+        self.assertIn("Poetry Slam", self._file("oxford:event_detail", slug=self.event.slug).read_text())
+        self.assertIn("Poetry Slam", self._file("oxford:upcoming_events").read_text())
+        self.assertFalse(self._file("westoxon:upcoming_events").exists())
+        self.assertFalse(PendingPrerender.objects.exists())
+
+    @override_settings(PRERENDER_ON_SAVE=True)
+    def test_repeated_saves_queue_each_page_once(self):
+        for title in ("Poetry Slam", "Poetry Night"):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.event.title = title
+                self.event.save()
+
+        paths = list(PendingPrerender.objects.values_list("path", flat=True))
+        self.assertEqual(len(paths), len(set(paths)))
+
+    @override_settings(PRERENDER_ON_SAVE=True)
+    def test_hidden_event_page_is_removed(self):
+        call_command("prerender_site", stdout=StringIO())
+        detail = self._file("oxford:event_detail", slug=self.event.slug)
+        self.assertTrue(detail.exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.is_public = False
+            self.event.save()
+        call_command("prerender_site", "--pending", stdout=StringIO())
+
+        self.assertFalse(detail.exists())
+        self.assertNotIn("Open Mic Night", self._file("oxford:upcoming_events").read_text())
+
+    def test_listings_refresh_time_dependent_pages_only(self):
+        call_command("prerender_site", "--listings", stdout=StringIO())
+
+        self.assertIn("Open Mic Night", self._file("oxford:upcoming_events").read_text())
+        self.assertTrue(self._file("landing:home").exists())
+        self.assertTrue(self._file("oxford:category_events", category=EventCategory.OPEN_MIC).exists())
+        self.assertTrue(self._file("oxford:venue_detail", pk=self.venue.pk).exists())
+        self.assertFalse(self._file("oxford:event_detail", slug=self.event.slug).exists())
+
+    def test_listings_drop_events_that_have_started(self):
+        call_command("prerender_site", "--listings", stdout=StringIO())
+        Event.objects.filter(pk=self.event.pk).update(start_at=timezone.now() - timedelta(hours=1))
+
+        call_command("prerender_site", "--listings", stdout=StringIO())
+
+        self.assertNotIn("Open Mic Night", self._file("oxford:upcoming_events").read_text())
+
+    def test_save_without_setting_queues_nothing(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.save()
+
+        self.assertFalse(PendingPrerender.objects.exists())
+        self.assertFalse(any(self.root.iterdir()))
+
+    def test_prune_needs_the_full_run(self):
+        with self.assertRaisesMessage(CommandError, "--prune needs the full page list"):
+            call_command("prerender_site", "--listings", "--prune", stdout=StringIO())
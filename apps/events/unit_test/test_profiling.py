@@ -0,0 +1,75 @@
+import tempfile
+import time
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from core.profiling import ProfilingMiddleware, list_profiles, summarise_profile
+
+
+def slow_view(request):
+    time.sleep(0.05)
+    return HttpResponse("ok")
+
+
+def failing_view(request):
+    raise RuntimeError("boom")
+
+
+class ProfilingTests(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        overrides = override_settings(PROFILE_DIR=tmp.name, PROFILE_SAMPLE_INTERVAL=0.001)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+        self.staff = get_user_model().objects.create_user("mod", "mod@example.com", "pw", is_staff=True)
+        self.middleware = ProfilingMiddleware(slow_view)
+
+    def _request(self, user, **extra):
+        request = RequestFactory().get("/oxford/", {"_profile": "1"}, **extra)
+        request.COOKIES[settings.SESSION_COOKIE_NAME] = "x"
+        request.user = user
+        return request
+
+    def test_staff_request_writes_summarisable_profile(self):
+        response = self.middleware(self._request(self.staff))
+
+        name = response["X-Profile-Id"]
+        self.assertEqual([p["name"] for p in list_profiles()], [name])
+        summary = summarise_profile(name)
+        self.assertGreater(summary["total"], 0)
+        self.assertIn(f"{__name__}:slow_view", [frame for frame, _, _ in summary["own"]])
+
+        self.client.force_login(self.staff)
+        page = self.client.get(reverse("moderation:profiles:detail", kwargs={"name": name}))
+        self.assertContains(page, "By component")
+
+    def test_non_staff_requests_never_start_the_sampler(self):
+        user = get_user_model().objects.create_user("visitor", "visitor@example.com", "pw")
+        for who in (AnonymousUser(), user):
+            with mock.patch("core.profiling.SamplingProfiler") as sampler:
+                response = self.middleware(self._request(who))
+            sampler.assert_not_called()
+
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertEqual(list_profiles(), [])
+
+    def test_sampler_stops_when_the_view_raises(self):
+        with mock.patch("core.profiling.SamplingProfiler") as sampler:
+            with self.assertRaisesMessage(RuntimeError, "boom"):
+                ProfilingMiddleware(failing_view)(self._request(self.staff))
+
+        sampler.return_value.start.assert_called_once_with()
+        sampler.return_value.stop.assert_called_once_with()
+
+    def test_unknown_profile_names_404(self):
+        self.client.force_login(self.staff)
+        url = reverse("moderation:profiles:detail", kwargs={"name": "..%2Fsettings.py"})
+        self.assertEqual(self.client.get(url).status_code, 404)
@@ -0,0 +1,54 @@
+import asyncio
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from apps.moderation.queue import views
+from apps.moderation.queue.live import QueueListener
+
+
+class QueueListenerTests(SimpleTestCase):
+    def test_broadcast_fans_out_and_resets_stalled_clients(self):
+        async def scenario():
+            listener = QueueListener()
+            fast, slow = asyncio.Queue(), asyncio.Queue(maxsize=1)
+            listener._subscribers = {fast, slow}
+
+            listener._broadcast({"kind": "submitted", "event_id": 1})
+            listener._broadcast({"kind": "submitted", "event_id": 2})
+
+            self.assertEqual([fast.get_nowait()["event_id"], fast.get_nowait()["event_id"]], [1, 2])
+            self.assertEqual(slow.get_nowait(), {"kind": "reset"})
+
+        asyncio.run(scenario())
+
+    def test_stream_filters_by_region(self):
+        async def scenario():
+            queue = asyncio.Queue()
+            queue.put_nowait({"kind": "decision", "region": "westoxon", "event_id": 1})
+            queue.put_nowait({"kind": "decision", "region": "oxford", "event_id": 2, "action": "approve"})
+
+            fake = mock.Mock(subscribe=mock.AsyncMock(return_value=queue))
+            with mock.patch.object(views, "listener", fake):
+                stream = views._queue_events("oxford")
+                chunks = [await anext(stream), await anext(stream)]
+                await stream.aclose()
+
+            fake.unsubscribe.assert_called_once_with(queue)
+            return chunks
+
+        retry, data = asyncio.run(scenario())
+        self.assertEqual(retry, "retry: 5000\n\n")
+        self.assertIn('"event_id": 2', data)
+
+
+class QueueStreamViewTests(TestCase):
+    def test_requires_staff_and_is_disabled_without_postgres(self):
+        url = reverse("moderation:queue:stream")
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        staff = get_user_model().objects.create_user("mod", "mod@example.com", "pw", is_staff=True)
+        self.client.force_login(staff)
+        self.assertEqual(self.client.get(url).status_code, 204)
@@ -0,0 +1,83 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.events.cache import bump_region_generation
+from apps.events.models import Event, EventCategory, EventRegion, EventStatus, Venue
+from apps.events.related import RELATED_PER_PANEL
+
+
+class RelatedEventsTests(TestCase):
+    def setUp(self):
+        bump_region_generation(EventRegion.OXFORD)
+        self.addCleanup(bump_region_generation, EventRegion.OXFORD)
+
+        self.bull = Venue.objects.create(name="The Bull", town="Oxford", is_active=True)
+        self.wheatsheaf = Venue.objects.create(name="The Wheatsheaf", town="Oxford", is_active=True)
+        self.corn = Venue.objects.create(name="Corn Exchange", town="Witney", is_active=True)
+
+        self.start = (timezone.now() + timedelta(days=5)).replace(hour=19, minute=0)
+        self.event = self._event("Jazz Trio", self.bull, EventCategory.MUSIC, self.start)
+
+    def _event(self, title, venue, category, start_at, **kwargs):
+        fields = dict(
+            region=EventRegion.OXFORD,
+            title=title,
+            venue=venue,
+            category=category,
+            start_at=start_at,
+            status=EventStatus.APPROVED,
+            is_public=True,
+        )
+        fields.update(kwargs)
+        return Event.objects.create(**fields)
+
+    def _detail(self):
+        return self.client.get(reverse("oxford:event_detail", kwargs={"slug": self.event.slug}))
+
+    def test_panels_group_related_events(self):
+        same_venue = self._event("Quiz", self.bull, EventCategory.OTHER, self.start + timedelta(days=2))
+        same_night = self._event("Stand-up", self.wheatsheaf, EventCategory.COMEDY, self.start + timedelta(hours=1))
+        same_category = self._event("Folk Night", self.corn, EventCategory.MUSIC, self.start + timedelta(days=3))
+        other_town = self._event("Panto", self.corn, EventCategory.THEATRE, self.start)
+        self._event("Old Gig", self.bull, EventCategory.MUSIC, timezone.now() - timedelta(days=1))
+        self._event("Pending", self.bull, EventCategory.MUSIC, self.start, status=EventStatus.PENDING)
+
+        related = self._detail().context["related"]
+
+        self.assertEqual(related["venue"], [same_venue])
+        self.assertEqual(related["night"], [same_night])
+        self.assertEqual(related["category"], [same_category])
+        self.assertNotIn(other_town, related["category"])
+
+    def test_each_panel_is_limited(self):
+        for day in range(RELATED_PER_PANEL + 2):
+            self._event(f"Gig {day}", self.corn, EventCategory.MUSIC, self.start + timedelta(days=day + 1))
+
+        related = self._detail().context["related"]
+
+        self.assertEqual(len(related["category"]), RELATED_PER_PANEL)
+        self.assertEqual(related["category"][0].title, "Gig 0")
+
+    def test_cached_panel_leaves_a_single_query(self):
+        self._event("Quiz", self.bull, EventCategory.OTHER, self.start + timedelta(days=2))
+        self._detail()
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self._detail()
+
+        self.assertContains(response, "More at The Bull")
+        # Only the event lookup reaches the events tables (the cache may be database-backed).
+        queries = [q["sql"] for q in captured.captured_queries if '"events_' in q["sql"]]
+        self.assertEqual(len(queries), 1, queries)
+
+    def test_listing_change_recomputes_panel(self):
+        self.assertEqual(self._detail().context["related"]["venue"], [])
+
+        quiz = self._event("Quiz", self.bull, EventCategory.OTHER, self.start + timedelta(days=2))
+
+        self.assertEqual(self._detail().context["related"]["venue"], [quiz])
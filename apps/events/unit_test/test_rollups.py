@@ -0,0 +1,112 @@
+import random
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.events.dates import local_timezone
+from apps.events.models import Event, EventRegion, Venue
+from apps.moderation.models import EventModerationLog, ModerationAction, ModerationRollup, RollupPeriod, RollupWatermark
+from apps.moderation.rollups import decision_summary, roll_up
+from apps.moderation.sketch import RELATIVE_ACCURACY, DurationSketch
+
+
+User = get_user_model()
+
+
+class DurationSketchTests(SimpleTestCase):
+    def test_quantiles_are_within_relative_accuracy_and_merge(self):
+        rng = random.Random(7)
+        values = sorted(rng.expovariate(1 / 7200) + 1 for _ in range(5000))
+        left, right = DurationSketch(), DurationSketch()
+        for i, value in enumerate(values):
+            (left if i % 2 else right).add(value)
+
+        merged = DurationSketch.from_json(left.to_json()).merge(right)
+
+        self.assertEqual(merged.count, len(values))
+        for q in (0.5, 0.9, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            self.assertLessEqual(abs(merged.quantile(q) - exact) / exact, RELATIVE_ACCURACY * 1.01)
+
+    def test_empty_sketch(self):
+        self.assertIsNone(DurationSketch().quantile(0.5))
+
+
+class ModerationRollupTests(TestCase):
+    def setUp(self):
+        self.venue = Venue.objects.create(name="Jericho Tavern")
+        self.event = Event.objects.create(
+            region=EventRegion.OXFORD, title="Folk Club", venue=self.venue, start_at=timezone.now() + timedelta(days=9)
+        )
+        self.submitted = self.event.created_at
+
+    def _log(self, after: timedelta, action=ModerationAction.APPROVE):
+        log = EventModerationLog.objects.create(
+            region=EventRegion.OXFORD, event_id=self.event.pk, action=action, acted_at=self.submitted + after
+        )
+        # Written long enough ago to have settled.
+        EventModerationLog.objects.filter(pk=log.pk).update(created_at=timezone.now() - timedelta(minutes=5))
+        return log
+
+    def test_rollup_is_incremental(self):
+        self._log(timedelta(hours=2))
+        self._log(timedelta(hours=4), ModerationAction.REJECT)
+
+        self.assertEqual(roll_up(), 2)
+        self.assertEqual(roll_up(), 0)
+
+        hourly = ModerationRollup.objects.filter(period=RollupPeriod.HOUR)
+        self.assertEqual(sum(hourly.values_list("count", flat=True)), 2)
+
+        self._log(timedelta(hours=6))
+        self.assertEqual(roll_up(), 1)
+
+        summary = decision_summary(self.submitted - timedelta(days=1))
+        self.assertEqual(summary["counts"], {"approve": 2, "reject": 1})
+        self.assertEqual(summary["decided"], 3)
+        self.assertAlmostEqual(summary["p50"] / 3600, 4, delta=4 * RELATIVE_ACCURACY)
+        self.assertAlmostEqual(summary["max"], 6 * 3600, delta=1)
+        self.assertEqual(RollupWatermark.objects.get().last_log_id, EventModerationLog.objects.latest("pk").pk)
+
+    def test_recent_rows_wait_for_the_next_run(self):
+        EventModerationLog.objects.create(region=EventRegion.OXFORD, event_id=self.event.pk, action=ModerationAction.APPROVE)
+        self.assertEqual(roll_up(), 0)
+        self.assertEqual(roll_up(now=timezone.now() + timedelta(minutes=5)), 1)
+
+    def test_dashboard_reads_only_rollups(self):
+        self._log(timedelta(minutes=90))
+        roll_up()
+        staff = User.objects.create_user("mod", password="pw", is_staff=True)
+        self.client.force_login(staff)
+
+        response = self.client.get(reverse("moderation:dashboard:home"), {"days": 7})
+
+        self.assertContains(response, "Moderation SLA")
+        self.assertContains(response, "1h 3")
+        self.assertFalse(
+            any("moderation_eventmoderationlog" in q or "events_event" in q for q in self._queries(reverse("moderation:dashboard:home")))
+        )
+
+    def test_dashboard_period_starts_at_local_midnight(self):
+        staff = User.objects.create_user("mod", password="pw", is_staff=True)
+        # 00:30 on 2 June in London (BST), still 1 June in UTC.
+        now = datetime(2030, 6, 1, 23, 30, tzinfo=dt_timezone.utc)
+
+        with mock.patch("django.utils.timezone.now", return_value=now):
+            self.client.force_login(staff)
+            with mock.patch("apps.moderation.dashboard.views.daily_series", return_value=[]) as series:
+                self.client.get(reverse("moderation:dashboard:home"), {"days": 7})
+
+        self.assertEqual(series.call_args.args[0], datetime(2030, 5, 27, tzinfo=local_timezone()))
+
+    def _queries(self, url):
+        with CaptureQueriesContext(connection) as captured:
+            self.client.get(url)
+        return [query["sql"] for query in captured]
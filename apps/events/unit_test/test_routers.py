@@ -0,0 +1,74 @@
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from apps.events.models import Event
+from apps.moderation.models import EventModerationLog
+from core.middleware import ReplicaPinMiddleware
+from core.routers import PrimaryReplicaRouter, allow_replica_reads, replica_reads_allowed
+
+
+REPLICA_DATABASES = {**settings.DATABASES, "replica": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}}
+
+
+@mock.patch.object(settings, "DATABASES", REPLICA_DATABASES)
+class PrimaryReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+
+    def test_events_reads_use_replica_when_allowed(self):
+        with allow_replica_reads():
+            self.assertEqual(self.router.db_for_read(Event), "replica")
+
+    def test_events_reads_default_to_primary(self):
+        self.assertEqual(self.router.db_for_read(Event), "default")
+
+    def test_moderation_reads_stay_on_primary(self):
+        with allow_replica_reads():
+            self.assertEqual(self.router.db_for_read(EventModerationLog), "default")
+
+    def test_writes_go_to_primary(self):
+        with allow_replica_reads():
+            self.assertEqual(self.router.db_for_write(Event), "default")
+
+    def test_missing_replica_alias_falls_back_to_primary(self):
+        with mock.patch.object(settings, "DATABASES", {"default": settings.DATABASES["default"]}):
+            with allow_replica_reads():
+                self.assertEqual(self.router.db_for_read(Event), "default")
+
+
+class ReplicaPinMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.seen = None
+
+        def get_response(request):
+            self.seen = replica_reads_allowed()
+            return HttpResponse()
+
+        self.middleware = ReplicaPinMiddleware(get_response)
+
+    def test_anonymous_get_may_use_replica(self):
+        self.middleware(self.factory.get("/oxford/"))
+        self.assertTrue(self.seen)
+
+    def test_post_stays_on_primary_and_sets_pin_cookie(self):
+        response = self.middleware(self.factory.post("/moderation/decision/oxford/1/approve/"))
+        self.assertFalse(self.seen)
+        self.assertIn(settings.REPLICA_PIN_COOKIE, response.cookies)
+
+    def test_pin_cookie_keeps_reads_on_primary(self):
+        request = self.factory.get("/oxford/")
+        request.COOKIES[settings.REPLICA_PIN_COOKIE] = "1"
+        self.middleware(request)
+        self.assertFalse(self.seen)
+
+    def test_staff_session_stays_on_primary(self):
+        request = self.factory.get("/oxford/")
+        request.COOKIES[settings.SESSION_COOKIE_NAME] = "abc"
+        request.user = get_user_model()(is_staff=True)
+        self.middleware(request)
+        self.assertFalse(self.seen)
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.events.dates import local_timezone
+from apps.events.models import Event, EventRegion, EventSeries, EventStatus, RecurrenceFrequency, Venue
+from apps.events.series import materialise_all, occurrence_starts
+from apps.moderation.models import EventModerationLog, ModerationAction
+
+
+User = get_user_model()
+
+
+class EventSeriesTests(TestCase):
+    def setUp(self):
+        self.tz = local_timezone()
+        self.venue = Venue.objects.create(name="The Wheatsheaf")
+        self.now = datetime(2030, 3, 1, 12, 0, tzinfo=self.tz)
+        self.series = EventSeries.objects.create(
+            region=EventRegion.OXFORD,
+            title="Tuesday Open Mic",
+            venue=self.venue,
+            first_start_at=datetime(2030, 3, 5, 20, 0, tzinfo=self.tz),
+            duration=timedelta(hours=3),
+        )
+
+    def test_weekly_occurrences_keep_wall_clock_time_across_dst(self):
+        starts = list(occurrence_starts(self.series, datetime(2030, 4, 10, tzinfo=self.tz)))
+        self.assertEqual(len(starts), 6)
+        self.assertTrue(all(s.astimezone(self.tz).hour == 20 for s in starts))
+
+    def test_monthly_weekday_rule(self):
+        self.series.frequency = RecurrenceFrequency.MONTHLY_WEEKDAY
+        starts = list(occurrence_starts(self.series, datetime(2030, 6, 30, tzinfo=self.tz)))
+        # First Tuesday of March..June 2030
+        self.assertEqual([s.date().day for s in starts], [5, 2, 7, 4])
+
+    def test_materialise_is_windowed_and_idempotent(self):
+        materialise_all(weeks=4, now=self.now)
+        self.assertEqual(self.series.occurrences.count(), 4)
+
+        materialise_all(weeks=4, now=self.now)
+        self.assertEqual(self.series.occurrences.count(), 4)
+
+        materialise_all(weeks=6, now=self.now)
+        self.assertEqual(self.series.occurrences.count(), 6)
+
+        occurrence = self.series.occurrences.order_by("start_at").first()
+        self.assertEqual(occurrence.status, EventStatus.PENDING)
+        self.assertEqual(occurrence.end_at - occurrence.start_at, timedelta(hours=3))
+        self.assertTrue(occurrence.slug.startswith(self.series.slug))
+
+    def test_taken_slug_gets_a_suffix_instead_of_being_skipped(self):
+        taken = Event.objects.create(
+            region=EventRegion.OXFORD,
+            title="Something else",
+            slug=f"{self.series.slug}-2030-03-12",
+            venue=self.venue,
+            start_at=datetime(2030, 3, 12, 18, 0, tzinfo=self.tz),
+        )
+
+        created = materialise_all(weeks=4, now=self.now)
+
+        self.assertEqual(created, {EventRegion.OXFORD: 4})
+        self.assertEqual(self.series.occurrences.count(), 4)
+        second = self.series.occurrences.get(start_at=datetime(2030, 3, 12, 20, 0, tzinfo=self.tz))
+        self.assertEqual(second.slug, f"{taken.slug}-2")
+
+    def test_series_approval_updates_all_pending_occurrences(self):
+        reviewer = User.objects.create_user(username="mod", password="pass", is_staff=True)
+        materialise_all(weeks=4, now=self.now)
+
+        event_ids = self.series.approve(reviewer, note="Regular night")
+
+        self.assertEqual(len(event_ids), 4)
+        self.assertFalse(Event.objects.filter(series=self.series).exclude(status=EventStatus.APPROVED).exists())
+        self.assertEqual(set(self.series.occurrences.values_list("reviewed_by", flat=True)), {reviewer.pk})
+
+    def test_admin_approval_logs_each_occurrence(self):
+        admin_user = User.objects.create_superuser(username="admin", password="pass", email="admin@example.com")
+        materialise_all(weeks=4, now=self.now)
+        self.client.force_login(admin_user)
+
+        self.client.post(
+            reverse("admin:events_eventseries_changelist"),
+            {"action": "approve_series", "_selected_action": [self.series.pk]},
+        )
+
+        logs = EventModerationLog.objects.filter(action=ModerationAction.APPROVE, actor=admin_user)
+        self.assertEqual(
+            set(logs.values_list("event_id", flat=True)), set(self.series.occurrences.values_list("pk", flat=True))
+        )
+        self.assertTrue(all(note == f"Series #{self.series.pk}" for note in logs.values_list("note", flat=True)))
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+from django.test import TestCase
+
+from apps.events.dates import local_timezone
+from apps.events.models import Event, EventRegion, EventStatus, Venue
+
+
+class SitemapTests(TestCase):
+    def setUp(self):
+        tz = local_timezone()
+        self.venue = Venue.objects.create(name="The Cellar", is_active=True)
+        self.march = Event.objects.create(
+            region=EventRegion.OXFORD,
+            title="March Gig",
+            venue=self.venue,
+            start_at=datetime(2030, 3, 10, 20, 0, tzinfo=tz),
+            status=EventStatus.APPROVED,
+        )
+        # 00:30 local on 1 April is still 31 March in UTC: belongs to April.
+        self.april = Event.objects.create(
+            region=EventRegion.OXFORD,
+            title="April Gig",
+            venue=self.venue,
+            start_at=datetime(2030, 4, 1, 0, 30, tzinfo=tz),
+            status=EventStatus.APPROVED,
+        )
+        Event.objects.create(
+            region=EventRegion.OXFORD,
+            title="Pending Gig",
+            venue=self.venue,
+            start_at=datetime(2030, 3, 11, 20, 0, tzinfo=tz),
+            status=EventStatus.PENDING,
+        )
+
+    def test_index_lists_region_months_and_venues(self):
+        response = self.client.get("/sitemap.xml")
+
+        self.assertEqual(response["Content-Type"], "application/xml")
+        self.assertContains(response, "http://testserver/sitemaps/oxford/2030-3.xml")
+        self.assertContains(response, "http://testserver/sitemaps/oxford/2030-4.xml")
+        self.assertContains(response, "http://testserver/sitemaps/oxford/venues.xml")
+        self.assertNotContains(response, "/sitemaps/westoxon/")
+
+    def test_month_file_lists_public_event_urls_with_lastmod(self):
+        response = self.client.get("/sitemaps/oxford/2030-3.xml")
+
+        self.assertContains(response, f"<loc>http://testserver/oxford/{self.march.slug}/</loc>")
+        self.assertContains(response, "<lastmod>")
+        self.assertNotContains(response, "april-gig")
+        self.assertNotContains(response, "pending-gig")
+
+    def test_month_file_is_rebuilt_after_generation_bump(self):
+        self.client.get("/sitemaps/oxford/2030-4.xml")
+        self.april.title = "Renamed"
+        self.april.slug = "renamed-april-gig"
+        self.april.save()
+
+        response = self.client.get("/sitemaps/oxford/2030-4.xml")
+        self.assertContains(response, "renamed-april-gig")
+
+    def test_unknown_region_or_month_404s(self):
+        self.assertEqual(self.client.get("/sitemaps/nowhere/2030-3.xml").status_code, 404)
+        self.assertEqual(self.client.get("/sitemaps/oxford/2030-13.xml").status_code, 404)
@@ -0,0 +1,177 @@
+import html
+import re
+from datetime import timedelta
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.analytics.buffer import buffer
+from apps.events.models import Event, EventRegion, EventStatus, Venue
+from apps.sponsorship.models import Placement, PlacementDailyStats, Sponsor, SponsorSlot
+from apps.sponsorship.rotation import ROTATION_CACHE_KEY, ROTATION_CACHE_SECONDS, build_rotation, publish_rotation, rotation
+
+
+BROWSER = "Mozilla/5.0 (X11; Linux x86_64) Firefox/140.0"
+
+PLACEHOLDER = re.compile(r'class="sponsor-slot sponsor-slot--[a-z_]+"\s+hx-get="([^"]+)"')
+
+
+class SponsorshipTests(TestCase):
+    def setUp(self):
+        buffer._take()
+        self.addCleanup(buffer._take)
+        self.addCleanup(self._reset_rotation)
+        self.sponsor = Sponsor.objects.create(name="Truck Store")
+        self.footer = Placement.objects.create(
+            sponsor=self.sponsor, slot=SponsorSlot.FOOTER, text="Records on Cowley Road", target_url="https://example.com/?utm_source=oxperform"
+        )
+        self.west_only = Placement.objects.create(
+            sponsor=self.sponsor,
+            slot=SponsorSlot.EVENT_DETAIL,
+            region=EventRegion.WEST_OXON,
+            image_url="https://cdn.example.com/banner.webp",
+            alt_text="Truck Store banner",
+            target_url="https://example.com/west",
+        )
+        publish_rotation()
+
+    def _reset_rotation(self):
+        cache.delete(ROTATION_CACHE_KEY)
+        rotation._table = None
+        rotation._checked_at = 0.0
+
+    def test_rotation_respects_region_dates_and_weight(self):
+        today = timezone.localdate()
+        self.assertEqual(rotation.choose(EventRegion.WEST_OXON, SponsorSlot.EVENT_DETAIL)["id"], self.west_only.pk)
+        self.assertIsNone(rotation.choose(EventRegion.OXFORD, SponsorSlot.EVENT_DETAIL))
+        self.assertEqual(rotation.choose("", SponsorSlot.FOOTER)["id"], self.footer.pk)
+        self.assertIsNone(rotation.choose("", SponsorSlot.FOOTER, today=today - timedelta(days=1)))
+
+        heavy = Placement.objects.create(sponsor=self.sponsor, slot=SponsorSlot.FOOTER, weight=3, target_url="https://example.com/h")
+        publish_rotation()
+        picks = [rotation.choose(EventRegion.OXFORD, SponsorSlot.FOOTER)["id"] for _ in range(40)]
+        self.assertEqual(picks.count(heavy.pk), 30)
+
+    def test_changes_republish_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.footer.is_active = False
+            self.footer.save()
+        self.assertIsNone(rotation.choose(EventRegion.OXFORD, SponsorSlot.FOOTER))
+
+    def _publish_elsewhere(self):
+        # What another worker's republish leaves in the shared cache.
+        self.footer.is_active = False
+        self.footer.save()
+        cache.set(ROTATION_CACHE_KEY, build_rotation(), ROTATION_CACHE_SECONDS)
+        rotation._checked_at -= 60
+
+    def test_other_workers_pick_up_a_republish(self):
+        self._publish_elsewhere()
+
+        self.assertIsNone(rotation.choose(EventRegion.OXFORD, SponsorSlot.FOOTER))
+
+    def test_event_loop_refreshes_in_the_background(self):
+        self._publish_elsewhere()
+
+        async def render_twice():
+            first = rotation.choose(EventRegion.OXFORD, SponsorSlot.FOOTER)
+            await rotation._refresh
+            return first, rotation.choose(EventRegion.OXFORD, SponsorSlot.FOOTER)
+
+        first, second = async_to_sync(render_twice)()
+        self.assertEqual(first["id"], self.footer.pk)
+        self.assertIsNone(second)
+
+    def _event_page(self):
+        venue = Venue.objects.create(name="The Swan")
+        event = Event.objects.create(
+            region=EventRegion.WEST_OXON,
+            title="Barn Dance",
+            venue=venue,
+            start_at=timezone.now() + timedelta(days=2),
+            status=EventStatus.APPROVED,
+        )
+        return reverse("westoxon:event_detail", kwargs={"slug": event.slug})
+
+    def test_shareable_pages_load_sponsors_per_view(self):
+        response = self.client.get(self._event_page(), HTTP_USER_AGENT=BROWSER)
+        self.assertNotContains(response, "Truck Store banner")
+        self.assertEqual(buffer.flush(), 0)
+
+        fragments = [html.unescape(url) for url in PLACEHOLDER.findall(response.content.decode())]
+        self.assertEqual(len(fragments), 2)
+        with CaptureQueriesContext(connection) as captured:
+            body = "".join(self.client.get(url, HTTP_USER_AGENT=BROWSER).content.decode() for url in fragments)
+        self.assertIn("Truck Store banner", body)
+        self.assertIn("Records on Cowley Road", body)
+        self.assertFalse(any("sponsorship_" in query["sql"] for query in captured))
+
+        buffer.flush()
+        impressions = dict(PlacementDailyStats.objects.values_list("placement_id", "impressions"))
+        self.assertEqual(impressions, {self.footer.pk: 1, self.west_only.pk: 1})
+        self.assertEqual(self.client.get(reverse("sponsorship:slot", args=["sidebar"])).status_code, 404)
+
+    def test_signed_in_pages_render_sponsors_inline(self):
+        self.client.force_login(get_user_model().objects.create_user("fan", password="pw"))
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(self._event_page(), HTTP_USER_AGENT=BROWSER)
+        self.assertContains(response, "Truck Store banner")
+        self.assertContains(response, "Records on Cowley Road")
+        self.assertFalse(any("sponsorship_" in query["sql"] for query in captured))
+
+        buffer.flush()
+        impressions = dict(PlacementDailyStats.objects.values_list("placement_id", "impressions"))
+        self.assertEqual(impressions, {self.footer.pk: 1, self.west_only.pk: 1})
+
+    def test_click_redirects_and_is_counted(self):
+        response = self.client.get(reverse("sponsorship:click", args=[self.footer.pk]), HTTP_USER_AGENT=BROWSER)
+        self.assertRedirects(response, self.footer.target_url, fetch_redirect_response=False)
+        self.assertEqual(self.client.get(reverse("sponsorship:click", args=[999])).status_code, 404)
+
+        buffer.flush()
+        self.assertEqual(PlacementDailyStats.objects.get(placement_id=self.footer.pk).clicks, 1)
+
+    def test_placements_not_yet_live_do_not_redirect(self):
+        upcoming = Placement.objects.create(
+            sponsor=self.sponsor,
+            slot=SponsorSlot.FOOTER,
+            starts_on=timezone.localdate() + timedelta(days=3),
+            target_url="https://example.com/soon",
+        )
+        publish_rotation()
+
+        self.assertEqual(self.client.get(reverse("sponsorship:click", args=[upcoming.pk]), HTTP_USER_AGENT=BROWSER).status_code, 404)
+        self.assertEqual(rotation.target_url(upcoming.pk, today=upcoming.starts_on), "https://example.com/soon")
+        self.assertEqual(buffer.flush(), 0)
+
+    def test_home_slot_follows_the_nth_event_card(self):
+        home = Placement.objects.create(sponsor=self.sponsor, slot=SponsorSlot.HOME, text="Vinyl Fair", target_url="https://example.com/home")
+        publish_rotation()
+        venue = Venue.objects.create(name="The Swan")
+        for day in range(1, 6):
+            Event.objects.create(
+                region=EventRegion.OXFORD,
+                title=f"Gig {day}",
+                venue=venue,
+                start_at=timezone.now() + timedelta(days=day),
+                status=EventStatus.APPROVED,
+            )
+
+        with mock.patch("apps.landing.views.HOME_SPONSOR_AFTER_CARDS", 2):
+            body = self.client.get(reverse("landing:home"), HTTP_USER_AGENT=BROWSER).content.decode()
+
+        slot = reverse("sponsorship:slot", args=[SponsorSlot.HOME])
+        self.assertLess(body.index("Gig 2"), body.index(slot))
+        self.assertLess(body.index(slot), body.index("Gig 3"))
+        self.assertEqual(body.count(slot), 1)
+        fragment = self.client.get(slot, HTTP_USER_AGENT=BROWSER)
+        self.assertContains(fragment, "Vinyl Fair")
+        self.assertContains(fragment, reverse("sponsorship:click", args=[home.pk]), count=1)
@@ -0,0 +1,60 @@
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from core.client_identity import get_client_ip
+from core.throttling import atake_token, take_token
+
+
+class ClientIdentityTests(SimpleTestCase):
+    def test_uses_remote_addr_without_trusted_proxies(self):
+        request = RequestFactory().get("/", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="1.2.3.4")
+        with override_settings(TRUSTED_PROXY_COUNT=0):
+            self.assertEqual(get_client_ip(request), "10.0.0.1")
+
+    def test_ignores_client_supplied_forwarded_entries(self):
+        request = RequestFactory().get("/", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="6.6.6.6, 1.2.3.4")
+        with override_settings(TRUSTED_PROXY_COUNT=1):
+            self.assertEqual(get_client_ip(request), "1.2.3.4")
+
+
+class TokenBucketTests(TestCase):
+    def setUp(self):
+        self.addCleanup(cache.delete, "throttle:test")
+
+    def test_bucket_allows_burst_then_refills(self):
+        self.assertEqual([take_token("throttle:test", "2/min", now=0) for _ in range(2)], [0, 0])
+        self.assertAlmostEqual(take_token("throttle:test", "2/min", now=20), 10)
+        self.assertEqual(take_token("throttle:test", "2/min", now=30), 0)
+
+    def test_no_double_burst_across_a_minute_boundary(self):
+        self.assertEqual([take_token("throttle:test", "2/min", now=59) for _ in range(2)], [0, 0])
+        self.assertGreater(take_token("throttle:test", "2/min", now=61), 0)
+
+    def test_async_shares_the_bucket(self):
+        self.assertEqual(take_token("throttle:test", "2/min", now=0), 0)
+        self.assertEqual(async_to_sync(atake_token)("throttle:test", "2/min", now=0), 0)
+        self.assertAlmostEqual(async_to_sync(atake_token)("throttle:test", "2/min", now=15), 15)
+
+
+@override_settings(THROTTLE_RATES={"listing": "2/min", "detail": "2/min", "feed": "2/min"})
+class ThrottleMiddlewareTests(TestCase):
+    def setUp(self):
+        # Buckets live in the shared cache; don't leave other view tests throttled.
+        cache.delete("throttle:listing:127.0.0.1")
+        self.addCleanup(cache.delete, "throttle:listing:127.0.0.1")
+
+    def test_listing_returns_429_with_retry_after(self):
+        for _ in range(2):
+            self.assertEqual(self.client.get("/oxford/past/").status_code, 200)
+
+        response = self.client.get("/oxford/category/music/")
+        self.assertEqual(response.status_code, 429)
+        self.assertIn(int(response["Retry-After"]), range(1, 31))
+
+    def test_staff_sessions_are_exempt(self):
+        staff = get_user_model().objects.create_user("mod", "mod@example.com", "pw", is_staff=True)
+        self.client.force_login(staff)
+        for _ in range(3):
+            self.assertEqual(self.client.get("/oxford/past/").status_code, 200)
@@ -0,0 +1,79 @@
+from datetime import datetime
+from io import StringIO
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+
+from apps.events.dates import local_timezone
+from apps.events.models import Event, EventRegion, EventStatus, Venue
+
+
+class VerifyLegacyMigrationTests(TestCase):
+    def test_refuses_non_postgres_backends(self):
+        if connection.vendor == "postgresql":
+            self.skipTest("checksums run on PostgreSQL")
+        with self.assertRaisesMessage(CommandError, "needs PostgreSQL"):
+            call_command("verify_legacy_migration")
+
+
+@skipUnless(connection.vendor == "postgresql", "checksums run on PostgreSQL")
+class VerifyLegacyChecksumTests(TestCase):
+    def setUp(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE TABLE oxfordcity_event (id serial PRIMARY KEY, slug varchar(255), "
+                "title varchar(255), start_at timestamptz, status varchar(20))"
+            )
+        venue = Venue.objects.create(name="The Bullingdon")
+        self.start = datetime(2030, 5, 2, 20, 0, tzinfo=local_timezone())
+        for slug, title in (("jazz-night", "Jazz Night"), ("folk-club", "Folk Club")):
+            Event.objects.create(
+                region=EventRegion.OXFORD,
+                slug=slug,
+                title=title,
+                venue=venue,
+                start_at=self.start,
+                status=EventStatus.APPROVED,
+            )
+            self._legacy_insert(slug, title, EventStatus.APPROVED)
+
+    def _legacy_insert(self, slug, title, status):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO oxfordcity_event (slug, title, start_at, status) VALUES (%s, %s, %s, %s)",
+                [slug, title, self.start, status],
+            )
+
+    def _verify(self):
+        out = StringIO()
+        call_command("verify_legacy_migration", stdout=out)
+        return out.getvalue()
+
+    def test_matching_rows_pass(self):
+        output = self._verify()
+
+        self.assertIn("Oxford: legacy=2, unified=2, months=1, mismatched=0", output)
+        self.assertIn("All regions match.", output)
+
+    def test_changed_row_is_reported_in_its_month(self):
+        Event.objects.filter(slug="folk-club").update(title="Folk Club (cancelled)")
+
+        out = StringIO()
+        with self.assertRaisesMessage(CommandError, "1 region(s) do not match."):
+            call_command("verify_legacy_migration", stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("mismatched=1", output)
+        self.assertIn("2030-05: legacy=2, unified=2", output)
+        self.assertIn("only in legacy: folk-club | Folk Club |", output)
+        self.assertIn("only in unified: folk-club | Folk Club (cancelled) |", output)
+        self.assertNotIn("jazz-night", output)
+
+    def test_missing_row_is_reported(self):
+        self._legacy_insert("blues-jam", "Blues Jam", EventStatus.APPROVED)
+
+        with self.assertRaisesMessage(CommandError, "do not match"):
+            self._verify()
@@ -1,9 +1,10 @@
-from datetime import timedelta
+from datetime import date, datetime, timedelta, timezone as dt_timezone
 
 from django.test import TestCase
 from django.urls import reverse
 from django.utils import timezone
 
+from apps.events.dates import local_timezone
 from apps.events.models import Event, EventCategory, EventRegion, EventStatus, Venue
 
 
@@ -125,3 +126,130 @@ class EventsViewsTestCase(TestCase):
         response = self.client.get(reverse("oxford:upcoming_events"))
         self.assertEqual(response.status_code, 200)
         self.assertNotIn(west_event, list(response.context["events"]))
+
+    def test_public_views_are_async(self):
+        from asgiref.sync import iscoroutinefunction
+
+        from apps.events import views
+
+        for view in (
+            views.upcoming_events,
+            views.event_detail,
+            views.category_events,
+            views.venue_list,
+            views.venue_detail,
+            views.past_events,
+        ):
+            self.assertTrue(iscoroutinefunction(view), view.__name__)
+
+    def test_venue_detail_lists_upcoming_for_region(self):
+        url = reverse("oxford:venue_detail", kwargs={"pk": self.venue_active.pk})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(self.event_upcoming_ok, response.context["upcoming_events"])
+
+    def test_listing_partial_returns_fragment_only(self):
+        url = reverse("oxford:listing_partial")
+        response = self.client.get(url, HTTP_HX_REQUEST="true")
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, self.event_upcoming_ok.title)
+        self.assertNotContains(response, "<html")
+        self.assertIn("HX-Request", response["Vary"])
+
+    def test_upcoming_events_htmx_request_gets_fragment(self):
+        response = self.client.get(reverse("oxford:upcoming_events"), HTTP_HX_REQUEST="true")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "<html")
+        self.assertIn("HX-Request", response["Vary"])
+
+    def test_listing_cursor_pages_without_overlap(self):
+        now = timezone.now()
+        for i in range(30):
+            Event.objects.create(
+                region=EventRegion.OXFORD,
+                title=f"Bulk {i}",
+                venue=self.venue_active,
+                category=EventCategory.MUSIC,
+                start_at=now + timedelta(days=10, hours=i),
+                status=EventStatus.APPROVED,
+                is_public=True,
+            )
+
+        first = self.client.get(reverse("oxford:upcoming_events"))
+        page = first.context["page"]
+        self.assertTrue(page.has_next)
+
+        second = self.client.get(reverse("oxford:listing_partial"), {"cursor": page.next_cursor})
+        first_ids = {e.pk for e in first.context["events"]}
+        second_ids = {e.pk for e in second.context["events"]}
+        self.assertFalse(first_ids & second_ids)
+        self.assertEqual(len(first_ids | second_ids), 31)
+
+    def test_upcoming_events_filters_by_town_and_featured(self):
+        elsewhere = Venue.objects.create(name="Corn Exchange", town="Witney", is_active=True)
+        self.venue_active.town = "Oxford"
+        self.venue_active.save()
+        featured = Event.objects.create(
+            region=EventRegion.OXFORD,
+            title="Featured Witney Jam",
+            venue=elsewhere,
+            category=EventCategory.MUSIC,
+            start_at=timezone.now() + timedelta(days=6),
+            status=EventStatus.APPROVED,
+            is_public=True,
+            is_featured=True,
+        )
+
+        response = self.client.get(reverse("oxford:upcoming_events"), {"town": "Witney", "featured": "on"})
+        events = list(response.context["events"])
+        self.assertEqual(events, [featured])
+
+    def test_upcoming_events_facets_roll_up_counts(self):
+        self.venue_active.town = "Oxford"
+        self.venue_active.save()
+
+        response = self.client.get(reverse("oxford:upcoming_events"))
+        facets = response.context["facets"]
+
+        self.assertIn(("open_mic", "Open mic", 1), facets["categories"])
+        self.assertEqual(facets["towns"], [("Oxford", 1)])
+        self.assertEqual(sum(n for _, _, n in facets["weeks"]), 1)
+
+    def test_calendar_month_groups_by_london_day(self):
+        # 23:30 UTC on 1 July is 00:30 on 2 July in London (BST).
+        late = Event.objects.create(
+            region=EventRegion.OXFORD,
+            title="Late Session",
+            venue=self.venue_active,
+            category=EventCategory.MUSIC,
+            start_at=datetime(2030, 7, 1, 23, 30, tzinfo=dt_timezone.utc),
+            status=EventStatus.APPROVED,
+            is_public=True,
+        )
+
+        response = self.client.get(reverse("oxford:calendar_month", kwargs={"year": 2030, "month": 7}))
+        self.assertEqual(response.status_code, 200)
+
+        cells = {cell["date"].day: cell for week in response.context["weeks"] for cell in week if cell["in_month"]}
+        self.assertEqual(cells[1]["count"], 0)
+        self.assertEqual(cells[2]["count"], 1)
+        self.assertEqual(cells[2]["events"][0]["slug"], late.slug)
+
+    def test_calendar_month_links_neighbours_and_404s_at_date_limits(self):
+        response = self.client.get(reverse("oxford:calendar_month", kwargs={"year": 2030, "month": 12}))
+        self.assertEqual(response.context["previous_month"], date(2030, 11, 1))
+        self.assertEqual(response.context["next_month"], date(2031, 1, 1))
+
+        for year, month in ((9999, 12), (1, 1)):
+            url = reverse("oxford:calendar_month", kwargs={"year": year, "month": month})
+            self.assertEqual(self.client.get(url).status_code, 404)
+        url = reverse("oxford:calendar_day", kwargs={"year": 9999, "month": 12, "day": 31})
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_calendar_day_fragment_lists_full_day(self):
+        day = self.event_upcoming_ok.start_at.astimezone(local_timezone()).date()
+        url = reverse("oxford:calendar_day", kwargs={"year": day.year, "month": day.month, "day": day.day})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, self.event_upcoming_ok.title)
+        self.assertNotContains(response, "<html")
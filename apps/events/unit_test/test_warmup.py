@@ -0,0 +1,23 @@
+from django.test import TestCase
+
+from apps.events.management.commands.import_times import parse_importtime
+from core.warmup import warm_templates, warm_up
+
+
+class WarmUpTests(TestCase):
+    def test_warm_up_runs_every_step(self):
+        with self.assertNoLogs("core.warmup", level="WARNING"):
+            timings = warm_up()
+        self.assertEqual(set(timings), {"urls", "templates", "databases", "sponsors"})
+
+    def test_all_hot_templates_exist(self):
+        # 5 regions x 4 pages, 2 partial dirs x 2 partials, 6 shared.
+        self.assertEqual(warm_templates(), 30)
+
+    def test_parse_importtime(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   django.utils\n"
+            "import time:      3000 |       3120 | django\n"
+        )
+        self.assertEqual(parse_importtime(stderr), [("django.utils", 120, 120), ("django", 3000, 3120)])
@@ -7,7 +7,12 @@ app_name = "events"
 urlpatterns = [
     path("", views.upcoming_events, name="upcoming_events"),
     path("past/", views.past_events, name="past_events"),
+    path("partial-list/", views.listing_partial, name="listing_partial"),
+    path("calendar/", views.calendar_month, name="calendar"),
+    path("calendar/<int:year>/<int:month>/", views.calendar_month, name="calendar_month"),
+    path("calendar/<int:year>/<int:month>/<int:day>/", views.calendar_day, name="calendar_day"),
     path("category/<slug:category>/", views.category_events, name="category_events"),
+    path("near/", views.near_events, name="near_events"),
     path("venues/", views.venue_list, name="venue_list"),
     path("venues/<int:pk>/", views.venue_detail, name="venue_detail"),
     path("<slug:slug>/", views.event_detail, name="event_detail"),
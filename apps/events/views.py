@@ -1,10 +1,25 @@
-from datetime import timedelta
+from datetime import date, timedelta
+from urllib.parse import urlencode
 
 from django.http import Http404
-from django.shortcuts import get_object_or_404, render
+from django.shortcuts import aget_object_or_404, render
+from django.urls import reverse
 from django.utils import timezone
+from django.views.decorators.cache import cache_control
+from django.views.decorators.vary import vary_on_headers
 
-from .models import Event, EventCategory, EventRegion, EventStatus, Venue
+from apps.pagination.cursor import apaginate
+from core.edge_cache import add_surrogate_keys, event_key, venue_key
+
+from .calendar import amonth_summary, month_grid
+from .dates import local_day_end, local_day_start, local_timezone
+from .facets import aupcoming_facets
+from .forms import EventFilterForm
+from .models import ArchivedEvent, Event, EventCategory, EventRegion, EventStatus, PostcodeCentroid, Venue
+from .nearby import MAX_RADIUS_MILES, avenue_distances
+from .related import arelated_events
+
+PAGE_SIZE = 24
 
 
 NAMESPACE_TO_REGION = {
@@ -23,6 +38,17 @@ NAMESPACE_TO_TEMPLATE_PREFIX = {
     "southoxon": "events/oxfordshire/south",
 }
 
+NAMESPACE_TO_PARTIALS_PREFIX = {
+    "oxford": "events/oxford/partials",
+    "westoxon": "events/oxfordshire/partials",
+    "eastoxon": "events/oxfordshire/partials",
+    "northoxon": "events/oxfordshire/partials",
+    "southoxon": "events/oxfordshire/partials",
+}
+
+# "archive" continues the past listing into ArchivedEvent once the hot table runs out.
+LISTING_SCOPES = {"upcoming", "past", "archive"}
+
 
 def _active_region(request) -> str:
     namespace = request.resolver_match.namespace if request.resolver_match else None
@@ -40,51 +66,280 @@ def _template_prefix(request) -> str:
     return prefix
 
 
-def upcoming_events(request):
-    now = timezone.now()
-    region = _active_region(request)
+def _partials_prefix(request) -> str:
+    namespace = request.resolver_match.namespace if request.resolver_match else None
+    prefix = NAMESPACE_TO_PARTIALS_PREFIX.get(namespace or "")
+    if not prefix:
+        raise Http404("Unknown event region")
+    return prefix
 
-    events = (
-        Event.objects.select_related("venue")
-        .filter(
-            region=region,
-            status=EventStatus.APPROVED,
-            is_public=True,
-            venue__is_active=True,
-            start_at__gte=now,
-        )
-        .order_by("start_at")
-    )
 
-    return render(request, f"{_template_prefix(request)}/upcoming_events.html", {"events": events, "now": now})
+def _is_htmx(request) -> bool:
+    return request.headers.get("HX-Request") == "true"
 
 
-def event_detail(request, slug: str):
-    region = _active_region(request)
+def _public_qs(region: str):
+    return Event.objects.select_related("venue").filter(
+        region=region,
+        status=EventStatus.APPROVED,
+        is_public=True,
+        venue__is_active=True,
+    )
 
-    event = get_object_or_404(
-        Event.objects.select_related("venue"),
+
+def _archive_qs(region: str):
+    return ArchivedEvent.objects.select_related("venue").filter(
         region=region,
-        slug=slug,
         status=EventStatus.APPROVED,
         is_public=True,
         venue__is_active=True,
     )
 
-    return render(request, f"{_template_prefix(request)}/event_detail.html", {"event": event, "now": timezone.now()})
 
+def _listing_qs(region: str, now, *, scope: str = "upcoming", category: str | None = None):
+    if scope == "archive":
+        return _archive_qs(region)
+
+    qs = _public_qs(region)
+    if scope == "past":
+        qs = qs.filter(start_at__lt=now)
+    elif category:
+        # Category pages keep events that have only just started.
+        qs = qs.filter(start_at__gte=now - timedelta(minutes=1))
+    else:
+        qs = qs.filter(start_at__gte=now)
+
+    if category:
+        qs = qs.filter(category=category)
+    return qs
+
+
+async def _listing_context(request, qs, *, scope: str = "upcoming", filters: dict | None = None) -> dict:
+    """
+    One cursor page of a listing, plus what the grid/pagination partials need
+    to ask for the next page with the same filters.
+    """
+    page = await apaginate(qs, request.GET.get("cursor"), PAGE_SIZE, descending=scope != "upcoming")
+
+    params = {"scope": scope, **(filters or {})}
+    next_query = urlencode({**params, "cursor": page.next_cursor}) if page.has_next else ""
+    if scope == "past" and not page.has_next and await _archive_qs(_active_region(request)).aexists():
+        next_query = urlencode({**params, "scope": "archive"})
+    namespace = request.resolver_match.namespace
+
+    return {
+        "events": page.items,
+        "page": page,
+        "next_query": next_query,
+        "partial_url": reverse(f"{namespace}:listing_partial"),
+        "partials_prefix": _partials_prefix(request),
+    }
+
+
+async def _arender(request, template_name: str, context: dict):
+    """
+    Render from an async view.
+
+    The auth context processor reads request.user lazily, which would hit the
+    session/user tables from the event loop. Resolve it up front with the
+    async API so rendering itself never touches the ORM.
+    """
+    request.user = await request.auser()
+    return render(request, template_name, context)
+
+
+async def _render_listing(request, template_name: str, context: dict):
+    """
+    HTMX requests get just the grid + "Load more" fragment; everything else
+    gets the full page.
+    """
+    if _is_htmx(request):
+        template_name = f"{context['partials_prefix']}/_grid.html"
+    return await _arender(request, template_name, context)
+
+
+@vary_on_headers("HX-Request")
+async def upcoming_events(request):
+    now = timezone.now()
+    region = _active_region(request)
+
+    base = _listing_qs(region, now)
+    filter_form = EventFilterForm(request.GET)
+    filters = filter_form.active_filters()
+
+    context = await _listing_context(request, filter_form.filter_queryset(base), filters=filters)
+    context["now"] = now
+
+    if not _is_htmx(request):
+        context.update({"filter_form": filter_form, "facets": await aupcoming_facets(region, base)})
 
-def venue_list(request):
+    return await _render_listing(request, f"{_template_prefix(request)}/upcoming_events.html", context)
+
+
+@cache_control(public=True, max_age=60)
+@vary_on_headers("HX-Request")
+async def listing_partial(request):
+    """
+    HTMX fragment: only the event cards and pagination controls for a filter + cursor.
+    """
+    now = timezone.now()
+    region = _active_region(request)
+
+    scope = request.GET.get("scope") or "upcoming"
+    if scope not in LISTING_SCOPES:
+        raise Http404()
+
+    filter_form = EventFilterForm(request.GET)
+    filters = filter_form.active_filters()
+
+    context = await _listing_context(
+        request,
+        filter_form.filter_queryset(_listing_qs(region, now, scope=scope)),
+        scope=scope,
+        filters=filters,
+    )
+    context["now"] = now
+
+    return await _arender(request, f"{context['partials_prefix']}/_grid.html", context)
+
+
+# Keeps a month's neighbours and its last local midnight within date's range.
+CALENDAR_YEARS = range(date.min.year + 1, date.max.year)
+
+
+def _month_or_404(year: int, month: int) -> date:
+    if year not in CALENDAR_YEARS:
+        raise Http404("Unknown month")
+    try:
+        return date(year, month, 1)
+    except ValueError:
+        raise Http404("Unknown month")
+
+
+async def calendar_month(request, year: int | None = None, month: int | None = None):
+    region = _active_region(request)
+
+    if year is None or month is None:
+        today = timezone.now().astimezone(local_timezone()).date()
+        year, month = today.year, today.month
+    first = _month_or_404(year, month)
+
+    summary = await amonth_summary(region, _public_qs(region), year, month)
+
+    previous_month = date(year - (month == 1), (month - 2) % 12 + 1, 1)
+    next_month = date(year + (month == 12), month % 12 + 1, 1)
+
+    return await _arender(
+        request,
+        f"{_template_prefix(request)}/calendar.html",
+        {
+            "month": first,
+            "weeks": month_grid(year, month, summary),
+            "previous_month": previous_month,
+            "next_month": next_month,
+            "partials_prefix": _partials_prefix(request),
+        },
+    )
+
+
+@cache_control(public=True, max_age=60)
+async def calendar_day(request, year: int, month: int, day: int):
+    """
+    HTMX fragment: the full list for one local day, lazy-loaded from the month grid.
+    """
+    region = _active_region(request)
+    if year not in CALENDAR_YEARS:
+        raise Http404("Unknown day")
+    try:
+        the_day = date(year, month, day)
+    except ValueError:
+        raise Http404("Unknown day")
+
+    events = _public_qs(region).filter(
+        start_at__gte=local_day_start(the_day),
+        start_at__lt=local_day_end(the_day),
+    ).order_by("start_at", "pk")
+
+    return await _arender(
+        request,
+        f"{_partials_prefix(request)}/_day_events.html",
+        {"day": the_day, "events": [e async for e in events], "partials_prefix": _partials_prefix(request)},
+    )
+
+
+async def near_events(request):
+    """
+    Upcoming events in this region within ``miles`` of a postcode.
+    """
+    now = timezone.now()
+    region = _active_region(request)
+
+    postcode = (request.GET.get("postcode") or "").strip()
+    try:
+        miles = min(max(float(request.GET.get("miles") or 10), 0.5), MAX_RADIUS_MILES)
+    except ValueError:
+        miles = 10.0
+
+    events = []
+    centroid = await PostcodeCentroid.alookup(postcode) if postcode else None
+    if centroid:
+        distances = await avenue_distances(centroid.latitude, centroid.longitude, miles, Venue.objects.filter(is_active=True))
+        qs = _listing_qs(region, now).filter(venue_id__in=list(distances)).order_by("start_at", "pk")[:PAGE_SIZE]
+        async for event in qs:
+            event.distance_miles = distances[event.venue_id]
+            events.append(event)
+
+    return await _arender(
+        request,
+        f"{_template_prefix(request)}/near_events.html",
+        {
+            "events": events,
+            "postcode": postcode,
+            "miles": miles,
+            "found_postcode": centroid is not None,
+            "partials_prefix": _partials_prefix(request),
+            "now": now,
+        },
+    )
+
+
+async def event_detail(request, slug: str):
+    region = _active_region(request)
+
+    event = await _public_qs(region).filter(slug=slug).afirst()
+    if event is None:
+        # Archived events keep their detail page; newest wins if a slug was reused.
+        event = await _archive_qs(region).filter(slug=slug).order_by("-start_at").afirst()
+    if event is None:
+        raise Http404("No Event matches the given query.")
+
+    # Counted by apps.analytics against the original Event pk, archived or not.
+    request.analytics_event_id = getattr(event, "event_id", event.pk)
+    add_surrogate_keys(request, event_key(request.analytics_event_id), venue_key(event.venue_id))
+
+    return await _arender(
+        request,
+        f"{_template_prefix(request)}/event_detail.html",
+        {"event": event, "related": await arelated_events(event, region), "now": timezone.now()},
+    )
+
+
+async def venue_list(request):
     region = _active_region(request)
 
     venues = Venue.objects.filter(is_active=True, events__region=region).distinct().order_by("name")
 
-    return render(request, f"{_template_prefix(request)}/venue_list.html", {"venues": venues})
+    return await _arender(
+        request,
+        f"{_template_prefix(request)}/venue_list.html",
+        {"venues": [v async for v in venues]},
+    )
 
 
-def venue_detail(request, pk: int):
+async def venue_detail(request, pk: int):
     region = _active_region(request)
-    venue = get_object_or_404(Venue, pk=pk, is_active=True)
+    venue = await aget_object_or_404(Venue, pk=pk, is_active=True)
+    add_surrogate_keys(request, venue_key(venue.pk))
 
     upcoming = (
         Event.objects.filter(
@@ -97,14 +352,15 @@ def venue_detail(request, pk: int):
         .order_by("start_at")
     )
 
-    return render(
+    return await _arender(
         request,
         f"{_template_prefix(request)}/venue_detail.html",
-        {"venue": venue, "upcoming_events": upcoming, "now": timezone.now()},
+        {"venue": venue, "upcoming_events": [e async for e in upcoming], "now": timezone.now()},
     )
 
 
-def category_events(request, category: str):
+@vary_on_headers("HX-Request")
+async def category_events(request, category: str):
     valid_values = {c.value for c in EventCategory}
     if category not in valid_values:
         raise Http404()
@@ -112,40 +368,22 @@ def category_events(request, category: str):
     now = timezone.now()
     region = _active_region(request)
 
-    events = (
-        Event.objects.select_related("venue")
-        .filter(
-            region=region,
-            category=category,
-            status=EventStatus.APPROVED,
-            is_public=True,
-            venue__is_active=True,
-            start_at__gte=now - timedelta(minutes=1),
-        )
-        .order_by("start_at")
+    context = await _listing_context(
+        request, _listing_qs(region, now, category=category), filters={"category": category}
     )
+    context.update({"category": category, "now": now})
 
-    return render(
-        request,
-        f"{_template_prefix(request)}/category_events.html",
-        {"events": events, "category": category, "now": now},
-    )
+    return await _render_listing(request, f"{_template_prefix(request)}/category_events.html", context)
 
 
-def past_events(request):
+@vary_on_headers("HX-Request")
+async def past_events(request):
     now = timezone.now()
     region = _active_region(request)
 
-    events = (
-        Event.objects.select_related("venue")
-        .filter(
-            region=region,
-            status=EventStatus.APPROVED,
-            is_public=True,
-            venue__is_active=True,
-            start_at__lt=now,
-        )
-        .order_by("-start_at")
-    )
+    # The no-JS "Load more" link comes back here with scope=archive.
+    scope = "archive" if request.GET.get("scope") == "archive" else "past"
+    context = await _listing_context(request, _listing_qs(region, now, scope=scope), scope=scope)
+    context["now"] = now
 
-    return render(request, f"{_template_prefix(request)}/past_events.html", {"events": events, "now": now})
\ No newline at end of file
+    return await _render_listing(request, f"{_template_prefix(request)}/past_events.html", context)
@@ -1,4 +1,29 @@
 from django.shortcuts import render
 
+from apps.events.next_up import next_up
+
+# The homepage sponsor slot follows this many event cards.
+HOME_SPONSOR_AFTER_CARDS = 3
+
+
+def _sponsor_position(regions, after: int) -> tuple[str, int] | tuple[None, None]:
+    """
+    (region, card number within its list) of the card the sponsor slot follows,
+    or (None, None) if the page has fewer cards and the slot goes at the end.
+    """
+    seen = 0
+    for region, _, events in regions:
+        if seen + len(events) >= after:
+            return region, after - seen
+        seen += len(events)
+    return None, None
+
+
 def home(request):
-    return render(request, "landing/home.html")
+    context = next_up()
+    sponsor_region, sponsor_card = _sponsor_position(context["regions"], HOME_SPONSOR_AFTER_CARDS)
+    return render(
+        request,
+        "landing/home.html",
+        {**context, "sponsor_region": sponsor_region, "sponsor_card": sponsor_card},
+    )
@@ -1,11 +1,14 @@
 from django.contrib import admin
+
+from core.admin_tools import AutocompleteListFilter, LargeTableAdminMixin
 from .models import EventModerationLog
 
 
 @admin.register(EventModerationLog)
-class EventModerationLogAdmin(admin.ModelAdmin):
+class EventModerationLogAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = ("acted_at", "region", "event_id", "action", "actor", "note_short")
-    list_filter = ("region", "action", "acted_at")
+    list_filter = ("region", "action", "acted_at", ("actor", AutocompleteListFilter))
+    list_select_related = ("actor",)
     search_fields = ("event_id", "note", "actor__username", "actor__email")
     ordering = ("-acted_at",)
 
@@ -0,0 +1,25 @@
+"""
+Moderation log rows for series decisions, shared by the decision views and
+the EventSeries admin action.
+"""
+
+from __future__ import annotations
+
+from django.utils import timezone
+
+from .models import EventModerationLog
+
+
+def log_series_action(*, series, event_ids: list[int], action: str, actor, note: str = "") -> None:
+    """
+    One log row per affected occurrence (so per-event history stays complete),
+    written in a single INSERT.
+    """
+    now = timezone.now()
+    note = f"Series #{series.pk}: {note}" if note else f"Series #{series.pk}"
+    EventModerationLog.objects.bulk_create(
+        [
+            EventModerationLog(region=series.region, event_id=event_id, action=action, actor=actor, note=note, acted_at=now)
+            for event_id in event_ids
+        ]
+    )
@@ -1,4 +1,67 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.contrib.admin.views.decorators import staff_member_required
 from django.shortcuts import render
+from django.utils import timezone
+
+from apps.events.dates import local_day_start, local_timezone
+from apps.moderation.models import Region
+from apps.moderation.rollups import daily_series, decision_summary
+
+PERIOD_DAYS = (7, 30, 90)
+
+
+def format_wait(seconds: float | None) -> str:
+    if seconds is None:
+        return "–"
+    minutes = round(seconds / 60)
+    if minutes < 60:
+        return f"{minutes}m"
+    hours, minutes = divmod(minutes, 60)
+    if hours < 48:
+        return f"{hours}h {minutes}m"
+    return f"{hours // 24}d {hours % 24}h"
 
+
+def _formatted(summary: dict) -> dict:
+    return {**summary, **{key: format_wait(summary[key]) for key in ("p50", "p90", "p99", "max")}}
+
+
+@staff_member_required
 def dashboard(request):
-    return render(request, "moderation/dashboard.html")
+    """
+    Moderation SLA: decisions and time-to-decision, read only from the rollups.
+    """
+    try:
+        days = int(request.GET.get("days", PERIOD_DAYS[1]))
+    except ValueError:
+        days = PERIOD_DAYS[1]
+    if days not in PERIOD_DAYS:
+        days = PERIOD_DAYS[1]
+
+    # Local (Europe/London) midnights, matching the daily rollup buckets.
+    today = timezone.localtime(timezone=local_timezone()).date()
+    since = local_day_start(today - timedelta(days=days - 1))
+
+    regions = [
+        {"region": value, "label": label, **_formatted(decision_summary(since, value))}
+        for value, label in Region.choices
+    ]
+    daily = [
+        {**row, "p50": format_wait(row["p50"]), "p90": format_wait(row["p90"])}
+        for row in daily_series(since)
+    ]
+
+    return render(
+        request,
+        "moderation/dashboard.html",
+        {
+            "days": days,
+            "period_days": PERIOD_DAYS,
+            "overall": _formatted(decision_summary(since)),
+            "regions": regions,
+            "daily": daily,
+        },
+    )
@@ -8,7 +8,7 @@ urlpatterns = [
     path("", views.decision_home, name="home"),
 
     # /moderation/decision/<region>/<int:event_id>/
-    path("<slug:region>/<int:event_id>/", views.decision_home, name="row"),
+    path("<slug:region>/<int:event_id>/", views.decision_row, name="row"),
 
     # Actions (POST targets)
     # /moderation/decision/<region>/<int:event_id>/approve/
@@ -20,4 +20,9 @@ urlpatterns = [
     path("<slug:region>/<int:event_id>/unfeature/", views.unfeature_event, name="unfeature"),
     path("<slug:region>/<int:event_id>/hide/", views.hide_event, name="hide"),
     path("<slug:region>/<int:event_id>/unhide/", views.unhide_event, name="unhide"),
+
+    # Series-level decisions apply to every pending occurrence at once.
+    # /moderation/decision/<region>/series/<int:series_id>/approve/
+    path("<slug:region>/series/<int:series_id>/approve/", views.approve_series, name="approve_series"),
+    path("<slug:region>/series/<int:series_id>/reject/", views.reject_series, name="reject_series"),
 ]
@@ -6,8 +6,10 @@ from django.http import Http404, HttpResponseNotAllowed
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
 
+from apps.moderation.audit import log_series_action
+from apps.moderation.history import attach_events, event_history
 from apps.moderation.models import EventModerationLog, Region, ModerationAction
-from apps.events.models import Event, EventStatus
+from apps.events.models import ArchivedEvent, Event, EventSeries, EventStatus
 
 
 def _validate_region(region: str) -> str:
@@ -61,6 +63,26 @@ def decision_home(request):
     return render(request, "moderation/decision_row/home.html")
 
 
+@staff_member_required
+def decision_row(request, region: str, event_id: int):
+    """
+    One event with its full moderation history, for deciding on it (or on a
+    resubmission of it).
+    """
+    region = _validate_region(region)
+    event = Event.objects.select_related("venue", "submitted_by").filter(region=region, pk=event_id).first()
+    archived = None
+    if event is None:
+        archived = get_object_or_404(ArchivedEvent.objects.select_related("venue"), region=region, event_id=event_id)
+
+    history = attach_events(event_history(event_id), known={event_id: event or archived})
+    return render(
+        request,
+        "moderation/decision_row/row.html",
+        {"region": region, "event": event, "archived": archived, "history": history},
+    )
+
+
 @staff_member_required
 def approve_event(request, region: str, event_id: int):
     not_allowed = _require_post(request)
@@ -220,3 +242,41 @@ def unhide_event(request, region: str, event_id: int):
     _log_action(region=region, event_id=event_id, action=ModerationAction.UNHIDE, actor=request.user)
     messages.success(request, "Event is public again.")
     return redirect(_get_next_url(request))
+
+
+@staff_member_required
+def approve_series(request, region: str, series_id: int):
+    not_allowed = _require_post(request)
+    if not_allowed:
+        return not_allowed
+
+    region = _validate_region(region)
+    series = get_object_or_404(EventSeries, region=region, pk=series_id)
+
+    note = request.POST.get("note", "")
+    event_ids = series.approve(request.user, note)
+
+    log_series_action(series=series, event_ids=event_ids, action=ModerationAction.APPROVE, actor=request.user, note=note)
+    messages.success(request, f"Approved series and {len(event_ids)} occurrence(s).")
+    return redirect(_get_next_url(request))
+
+
+@staff_member_required
+def reject_series(request, region: str, series_id: int):
+    not_allowed = _require_post(request)
+    if not_allowed:
+        return not_allowed
+
+    region = _validate_region(region)
+    series = get_object_or_404(EventSeries, region=region, pk=series_id)
+
+    note = request.POST.get("note", "")
+    if not note:
+        messages.error(request, "Rejection requires a note.")
+        return redirect(_get_next_url(request))
+
+    event_ids = series.reject(request.user, note)
+
+    log_series_action(series=series, event_ids=event_ids, action=ModerationAction.REJECT, actor=request.user, note=note)
+    messages.success(request, f"Rejected series and {len(event_ids)} occurrence(s).")
+    return redirect(_get_next_url(request))
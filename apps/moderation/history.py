@@ -0,0 +1,47 @@
+"""
+Resolving moderation log rows to the events they describe.
+
+EventModerationLog stores (region, event_id) rather than a foreign key, so
+templates must not touch an event per row. attach_events() resolves a whole
+page of log rows with one in_bulk() on Event; ids it does not find (events
+moved to the archive) get a second in_bulk() on ArchivedEvent.event_id.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from django.db.models import QuerySet
+
+from apps.events.models import ArchivedEvent, Event
+
+from .models import EventModerationLog
+
+
+def resolve_events(event_ids: Iterable[int], known: dict | None = None) -> dict[int, Event | ArchivedEvent]:
+    resolved = dict(known or {})
+    missing = set(event_ids) - resolved.keys()
+    if missing:
+        resolved.update(Event.objects.select_related("venue").order_by().in_bulk(missing))
+        missing -= resolved.keys()
+    if missing:
+        resolved.update(ArchivedEvent.objects.select_related("venue").order_by().in_bulk(missing, field_name="event_id"))
+    return resolved
+
+
+def attach_events(logs: Iterable[EventModerationLog], known: dict | None = None) -> list[EventModerationLog]:
+    """
+    Set ``log.event`` (None if the event was deleted) on every row and return them as a list.
+    """
+    logs = list(logs)
+    events = resolve_events((log.event_id for log in logs), known)
+    for log in logs:
+        log.event = events.get(log.event_id)
+    return logs
+
+
+def event_history(event_id: int) -> QuerySet:
+    """
+    Every log row for one event, newest first (served by the (event_id, acted_at) index).
+    """
+    return EventModerationLog.objects.select_related("actor").filter(event_id=event_id).order_by("-acted_at", "-pk")
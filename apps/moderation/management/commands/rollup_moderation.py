@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.moderation.rollups import DEFAULT_BATCH_SIZE, roll_up
+
+
+class Command(BaseCommand):
+    help = "Fold new moderation log rows into the hourly and daily SLA rollups."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Log rows per transaction (default {DEFAULT_BATCH_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        folded = roll_up(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Summary: log rows folded={folded}"))
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-19 00:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('moderation', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventmoderationlog',
+            index=models.Index(fields=['acted_at', 'id'], name='moderation__acted_a_2d6906_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 00:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('moderation', '0002_log_admin_order_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='eventmoderationlog',
+            name='action',
+            field=models.CharField(choices=[('approve', 'Approve'), ('reject', 'Reject'), ('cancel', 'Cancel'), ('uncancel', 'Un-cancel'), ('feature', 'Feature'), ('unfeature', 'Un-feature'), ('hide', 'Hide (make not public)'), ('unhide', 'Un-hide (make public)'), ('expire', 'Expire (start passed while pending)')], max_length=20),
+        ),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 6.0 on 2026-10-19 00:40
+
+from django.conf import settings
+from django.db import migrations
+
+CHANNEL = "moderation_queue"
+
+
+def _trigger_sql(user_table: str) -> list[str]:
+    return [
+        f"""
+        CREATE OR REPLACE FUNCTION moderation_queue_notify_event() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.status = 'pending' THEN
+                PERFORM pg_notify('{CHANNEL}', json_build_object(
+                    'kind', 'submitted',
+                    'event_id', NEW.id,
+                    'region', NEW.region,
+                    'title', left(NEW.title, 200),
+                    'start_at', NEW.start_at
+                )::text);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """,
+        """
+        DROP TRIGGER IF EXISTS moderation_queue_event_insert ON events_event;
+        CREATE TRIGGER moderation_queue_event_insert
+            AFTER INSERT ON events_event
+            FOR EACH ROW EXECUTE FUNCTION moderation_queue_notify_event();
+        """,
+        f"""
+        CREATE OR REPLACE FUNCTION moderation_queue_notify_log() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{CHANNEL}', json_build_object(
+                'kind', 'decision',
+                'event_id', NEW.event_id,
+                'region', NEW.region,
+                'action', NEW.action,
+                'actor', (SELECT username FROM {user_table} WHERE id = NEW.actor_id),
+                'acted_at', NEW.acted_at
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """,
+        """
+        DROP TRIGGER IF EXISTS moderation_queue_log_insert ON moderation_eventmoderationlog;
+        CREATE TRIGGER moderation_queue_log_insert
+            AFTER INSERT ON moderation_eventmoderationlog
+            FOR EACH ROW EXECUTE FUNCTION moderation_queue_notify_log();
+        """,
+    ]
+
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS moderation_queue_event_insert ON events_event;",
+    "DROP FUNCTION IF EXISTS moderation_queue_notify_event();",
+    "DROP TRIGGER IF EXISTS moderation_queue_log_insert ON moderation_eventmoderationlog;",
+    "DROP FUNCTION IF EXISTS moderation_queue_notify_log();",
+]
+
+
+def create_triggers(apps, schema_editor):
+    # LISTEN/NOTIFY is PostgreSQL-only; other backends simply get no live updates.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    user_table = schema_editor.quote_name(apps.get_model(settings.AUTH_USER_MODEL)._meta.db_table)
+    for statement in _trigger_sql(user_table):
+        schema_editor.execute(statement)
+
+
+def drop_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for statement in DROP_SQL:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('moderation', '0003_moderation_action_expire'),
+        ('events', '0008_event_fingerprint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(create_triggers, drop_triggers),
+    ]
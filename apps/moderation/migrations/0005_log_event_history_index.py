@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-19 00:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('moderation', '0004_queue_notify_triggers'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventmoderationlog',
+            index=models.Index(fields=['event_id', 'acted_at'], name='moderation__event_i_79fd45_idx'),
+        ),
+    ]
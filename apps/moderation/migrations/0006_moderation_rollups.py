@@ -0,0 +1,40 @@
+# Generated by Django 6.0 on 2026-10-19 00:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('moderation', '0005_log_event_history_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('last_log_id', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ModerationRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day')], max_length=4)),
+                ('bucket_start', models.DateTimeField()),
+                ('region', models.CharField(choices=[('oxford', 'Oxford'), ('westoxon', 'West Oxfordshire'), ('eastoxon', 'East Oxfordshire'), ('northoxon', 'North Oxfordshire'), ('southoxon', 'South Oxfordshire')], max_length=20)),
+                ('action', models.CharField(choices=[('approve', 'Approve'), ('reject', 'Reject'), ('cancel', 'Cancel'), ('uncancel', 'Un-cancel'), ('feature', 'Feature'), ('unfeature', 'Un-feature'), ('hide', 'Hide (make not public)'), ('unhide', 'Un-hide (make public)'), ('expire', 'Expire (start passed while pending)')], max_length=20)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('wait_seconds_total', models.FloatField(default=0)),
+                ('wait_seconds_max', models.FloatField(default=0)),
+                ('wait_sketch', models.JSONField(default=dict)),
+            ],
+            options={
+                'ordering': ['-bucket_start'],
+                'constraints': [models.UniqueConstraint(fields=('period', 'bucket_start', 'region', 'action'), name='moderation_rollup_bucket_uniq')],
+            },
+        ),
+    ]
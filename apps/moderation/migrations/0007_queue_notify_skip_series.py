@@ -0,0 +1,49 @@
+# Generated by Django 6.0 on 2026-10-19 02:10
+
+from django.db import migrations
+
+CHANNEL = "moderation_queue"
+
+
+def _notify_event_sql(condition: str) -> str:
+    return f"""
+        CREATE OR REPLACE FUNCTION moderation_queue_notify_event() RETURNS trigger AS $$
+        BEGIN
+            IF {condition} THEN
+                PERFORM pg_notify('{CHANNEL}', json_build_object(
+                    'kind', 'submitted',
+                    'event_id', NEW.id,
+                    'region', NEW.region,
+                    'title', left(NEW.title, 200),
+                    'start_at', NEW.start_at
+                )::text);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """
+
+
+def skip_series_occurrences(apps, schema_editor):
+    # The queue hides pending series occurrences (the series is reviewed as a
+    # whole), so inserting them must not push live updates either.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(_notify_event_sql("NEW.status = 'pending' AND NEW.series_id IS NULL"))
+
+
+def notify_all_pending(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(_notify_event_sql("NEW.status = 'pending'"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('moderation', '0006_moderation_rollups'),
+    ]
+
+    operations = [
+        migrations.RunPython(skip_series_occurrences, notify_all_pending),
+    ]
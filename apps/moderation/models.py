@@ -25,6 +25,7 @@ class ModerationAction(models.TextChoices):
     UNFEATURE = "unfeature", "Un-feature"
     HIDE = "hide", "Hide (make not public)"
     UNHIDE = "unhide", "Un-hide (make public)"
+    EXPIRE = "expire", "Expire (start passed while pending)"
 
 class EventModerationLog(TimeStampedModel):
     """
@@ -54,8 +55,58 @@ class EventModerationLog(TimeStampedModel):
         ordering = ["-acted_at"]
         indexes = [
             models.Index(fields=["region", "event_id"]),
+            # Per-event history timeline, newest first.
+            models.Index(fields=["event_id", "acted_at"]),
             models.Index(fields=["action", "acted_at"]),
+            # Admin changelist order (-acted_at, -pk).
+            models.Index(fields=["acted_at", "id"]),
         ]
 
     def __str__(self) -> str:
         return f"{self.region}:{self.event_id} {self.action}"
+
+
+class RollupPeriod(models.TextChoices):
+    HOUR = "hour", "Hour"
+    DAY = "day", "Day"
+
+
+class ModerationRollup(models.Model):
+    """
+    Moderation activity per region, action and hour (or day), maintained
+    incrementally from new log rows by rollups.py. ``wait_sketch`` holds a
+    DurationSketch of time-to-decision (acted_at minus the event's created_at).
+    """
+    period = models.CharField(max_length=4, choices=RollupPeriod.choices)
+    bucket_start = models.DateTimeField()
+    region = models.CharField(max_length=20, choices=Region.choices)
+    action = models.CharField(max_length=20, choices=ModerationAction.choices)
+
+    count = models.PositiveIntegerField(default=0)
+    wait_seconds_total = models.FloatField(default=0)
+    wait_seconds_max = models.FloatField(default=0)
+    wait_sketch = models.JSONField(default=dict)
+
+    class Meta:
+        ordering = ["-bucket_start"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["period", "bucket_start", "region", "action"],
+                name="moderation_rollup_bucket_uniq",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.period} {self.bucket_start:%Y-%m-%d %H:00} {self.region} {self.action}"
+
+
+class RollupWatermark(models.Model):
+    """
+    Highest EventModerationLog id already folded into the rollups.
+    """
+    name = models.CharField(max_length=50, unique=True)
+    last_log_id = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.last_log_id}"
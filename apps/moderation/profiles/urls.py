@@ -0,0 +1,10 @@
+from django.urls import path
+from . import views
+
+app_name = "profiles"
+
+urlpatterns = [
+    path("", views.profile_list, name="home"),
+    path("<str:name>/", views.profile_detail, name="detail"),
+    path("<str:name>/download/", views.profile_download, name="download"),
+]
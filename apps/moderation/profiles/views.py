@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import FileResponse, Http404, HttpRequest, HttpResponse
+from django.shortcuts import render
+
+from core.profiling import PROFILE_NAME_RE, list_profiles, profile_dir, summarise_profile
+
+
+def _profile_name_or_404(name: str) -> str:
+    # Names come from the URL: only ever open files the profiler wrote.
+    if not PROFILE_NAME_RE.match(name) or not (profile_dir() / name).is_file():
+        raise Http404("Unknown profile")
+    return name
+
+
+@staff_member_required
+def profile_list(request: HttpRequest) -> HttpResponse:
+    return render(request, "moderation/profiles/home.html", {"profiles": list_profiles()})
+
+
+@staff_member_required
+def profile_detail(request: HttpRequest, name: str) -> HttpResponse:
+    name = _profile_name_or_404(name)
+    return render(
+        request,
+        "moderation/profiles/detail.html",
+        {"name": name, "summary": summarise_profile(name)},
+    )
+
+
+@staff_member_required
+def profile_download(request: HttpRequest, name: str) -> FileResponse:
+    name = _profile_name_or_404(name)
+    return FileResponse(open(profile_dir() / name, "rb"), as_attachment=True, filename=name, content_type="text/plain")
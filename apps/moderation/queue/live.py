@@ -0,0 +1,118 @@
+"""
+Live moderation queue feed: PostgreSQL LISTEN/NOTIFY fanned out to SSE clients.
+
+Database triggers (migration 0004_queue_notify_triggers) NOTIFY the
+``moderation_queue`` channel when a pending event is inserted and when a
+moderation log row is written, whichever code path did it (forms, admin,
+bulk series approvals, the lifecycle job). Each worker process holds one
+LISTEN connection, whatever the number of moderators connected, and copies
+every notification to each subscriber's queue. Nothing polls the queue
+tables any more.
+
+The LISTEN connection is a plain psycopg2 connection in autocommit mode,
+watched with loop.add_reader(), so waiting for notifications costs no thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "moderation_queue"
+SUBSCRIBER_BUFFER = 100
+
+
+def live_updates_supported() -> bool:
+    return connections["default"].vendor == "postgresql"
+
+
+class QueueListener:
+    """
+    One LISTEN connection per process, opened for the first subscriber and
+    closed after the last one leaves.
+    """
+
+    def __init__(self):
+        self._subscribers: set[asyncio.Queue] = set()
+        self._connection = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_BUFFER)
+        self._subscribers.add(queue)
+        async with self._lock:
+            if self._connection is None:
+                try:
+                    await self._listen()
+                except Exception:
+                    self._subscribers.discard(queue)
+                    raise
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+        if not self._subscribers:
+            self._close()
+
+    @staticmethod
+    def _connect():
+        import psycopg2
+
+        connection = psycopg2.connect(**connections["default"].get_connection_params())
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANNEL}")
+        return connection
+
+    async def _listen(self) -> None:
+        # Connecting blocks; keep it off the event loop.
+        self._connection = await asyncio.to_thread(self._connect)
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self._connection.fileno(), self._on_readable)
+
+    def _close(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            self._loop.remove_reader(self._connection.fileno())
+            self._connection.close()
+        except Exception:
+            logger.exception("moderation queue listener: close failed")
+        self._connection = None
+
+    def _on_readable(self) -> None:
+        try:
+            self._connection.poll()
+        except Exception:
+            # Lost the connection: tell clients to reload; they reconnect and resubscribe.
+            logger.exception("moderation queue listener: connection lost")
+            self._close()
+            self._broadcast({"kind": "reset"})
+            return
+
+        while self._connection.notifies:
+            notify = self._connection.notifies.pop(0)
+            try:
+                payload = json.loads(notify.payload)
+            except ValueError:
+                continue
+            self._broadcast(payload)
+
+    def _broadcast(self, payload: dict) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                # A stalled client misses updates rather than holding memory; it
+                # gets a reset so the page reloads when it catches up.
+                queue.get_nowait()
+                queue.put_nowait({"kind": "reset"})
+
+
+listener = QueueListener()
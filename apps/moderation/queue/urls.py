@@ -5,4 +5,5 @@ app_name = "queue"
 
 urlpatterns = [
     path("", views.queue_home, name="home"),
+    path("stream/", views.queue_stream, name="stream"),
 ]
\ No newline at end of file
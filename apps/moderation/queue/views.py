@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from typing import Optional
 
 from django.contrib.admin.views.decorators import staff_member_required
 from django.db.models import QuerySet
 from django.db.models import Q
-from django.http import Http404
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django.shortcuts import render
 from django.utils import timezone
 
 from apps.moderation.models import EventModerationLog, Region
-from apps.events.models import Event, EventStatus
+from apps.events.models import Event, EventSeries, EventStatus
+
+from .live import listener, live_updates_supported
+
+STREAM_HEARTBEAT_SECONDS = 15
 
 REGIONS: dict[str, str] = {
     Region.OXFORD: "Oxford",
@@ -34,11 +41,20 @@ def _pending_events_qs(region_key: str) -> QuerySet:
     """
     return (
         Event.objects.select_related("venue")
-        .filter(region=region_key, status=EventStatus.PENDING)
+        # Series occurrences are moderated once, via the series.
+        .filter(region=region_key, status=EventStatus.PENDING, series__isnull=True)
         .order_by("start_at")
     )
 
 
+def _pending_series_qs(region_keys: list[str]) -> QuerySet:
+    return (
+        EventSeries.objects.select_related("venue")
+        .filter(region__in=region_keys, status=EventStatus.PENDING)
+        .order_by("first_start_at")
+    )
+
+
 def _apply_filters(qs: QuerySet, q: str | None, category: str | None) -> QuerySet:
     if q:
         qs = qs.filter(Q(title__icontains=q) | Q(venue__name__icontains=q))
@@ -46,6 +62,18 @@ def _apply_filters(qs: QuerySet, q: str | None, category: str | None) -> QuerySe
         qs = qs.filter(category=category)
     return qs
 
+def _flag_duplicates(items: list[dict]) -> None:
+    """
+    Mark queue rows that share a fingerprint with another live event: one IN
+    query for the whole page.
+    """
+    matches: dict[str, list[int]] = {}
+    for fingerprint, pk in Event.live_duplicates(row["fingerprint"] for row in items).values_list("fingerprint", "pk"):
+        matches.setdefault(fingerprint, []).append(pk)
+
+    for row in items:
+        row["duplicate_of"] = [pk for pk in matches.get(row["fingerprint"], []) if pk != row["id"]]
+
 @staff_member_required
 def queue_home(request):
     """
@@ -89,18 +117,27 @@ def queue_home(request):
                     "venue_name": getattr(e.venue, "name", ""),
                     "category": getattr(e, "category", ""),
                     "is_public": getattr(e, "is_public", True),
+                    "fingerprint": e.fingerprint,
                 }
             )
 
+    _flag_duplicates(items)
+
     # Sort combined list by start time (soonest first)
     items.sort(key=lambda x: (x["start_at"] or timezone.now()))
 
+    pending_series = [
+        {"region": s.region, "region_label": REGIONS[s.region], "series": s}
+        for s in _apply_filters(_pending_series_qs(region_keys), q, category)[:200]
+    ]
+
     # Recent moderation actions (useful sidebar)
     recent_logs = EventModerationLog.objects.select_related("actor").all()[:20]
 
     context = {
         "items": items,
         "total": total,
+        "pending_series": pending_series,
         "regions": [(k, label) for k, label in REGIONS.items()],
         "selected_region": region_key or "",
         "q": q or "",
@@ -109,3 +146,40 @@ def queue_home(request):
         "now": timezone.now(),
     }
     return render(request, "moderation/queue/home.html", context)
+
+
+async def _queue_events(region: str | None):
+    queue = await listener.subscribe()
+    try:
+        # Reconnect after 5s if the connection drops.
+        yield "retry: 5000\n\n"
+        while True:
+            try:
+                payload = await asyncio.wait_for(queue.get(), STREAM_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                # Comment line: keeps proxies from closing an idle stream.
+                yield ": keep-alive\n\n"
+                continue
+            if region and payload.get("region") not in (None, region):
+                continue
+            yield f"data: {json.dumps(payload, cls=DjangoJSONEncoder)}\n\n"
+    finally:
+        listener.unsubscribe(queue)
+
+
+@staff_member_required
+async def queue_stream(request):
+    """
+    Server-Sent Events: queue deltas (new pending events, decisions and who
+    made them) as they happen, optionally for one region.
+    """
+    if not live_updates_supported():
+        # 204 tells EventSource not to reconnect.
+        return HttpResponse(status=204)
+
+    region = _parse_region(request.GET.get("region"))
+    response = StreamingHttpResponse(_queue_events(region), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Stop nginx-style proxies buffering the stream.
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -0,0 +1,193 @@
+"""
+Incremental moderation rollups, run by ``manage.py rollup_moderation``.
+
+Each run folds the log rows written since the last watermark (the highest
+EventModerationLog id already counted) into ModerationRollup rows per hour
+and per local day, region and action. Each rollup row carries a
+DurationSketch of time-to-decision, so the staff dashboard reads a few
+hundred rollup rows instead of scanning the log and the events behind it.
+
+Rows younger than SETTLE_SECONDS are left for the next run. Ids are handed
+out before commit, so a slow transaction can commit a lower id after a
+higher one; stopping short of recent rows means the watermark never moves
+past a row that is not visible yet.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.events.dates import local_timezone
+from apps.events.models import ArchivedEvent, Event
+
+from .models import EventModerationLog, ModerationAction, ModerationRollup, RollupPeriod, RollupWatermark
+from .sketch import DurationSketch
+
+WATERMARK_NAME = "moderation_log"
+DEFAULT_BATCH_SIZE = 5000
+SETTLE_SECONDS = 60
+
+# Actions that take an event out of the queue: what time-to-decision is about.
+DECISION_ACTIONS = (ModerationAction.APPROVE, ModerationAction.REJECT, ModerationAction.EXPIRE)
+
+
+@dataclass
+class _Bucket:
+    count: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+    sketch: DurationSketch = field(default_factory=DurationSketch)
+
+    def add(self, wait: float | None) -> None:
+        self.count += 1
+        if wait is None:
+            return
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        self.sketch.add(wait)
+
+
+def bucket_starts(acted_at: datetime) -> dict[str, datetime]:
+    hour = acted_at.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+    day = acted_at.astimezone(local_timezone()).replace(hour=0, minute=0, second=0, microsecond=0)
+    return {RollupPeriod.HOUR: hour, RollupPeriod.DAY: day}
+
+
+def _submitted_at(event_ids: set[int]) -> dict[int, datetime]:
+    created = dict(Event.objects.filter(pk__in=event_ids).values_list("pk", "created_at"))
+    missing = event_ids - created.keys()
+    if missing:
+        created.update(ArchivedEvent.objects.filter(event_id__in=missing).values_list("event_id", "created_at"))
+    return created
+
+
+def _fold(buckets: dict[tuple, _Bucket]) -> None:
+    """
+    Merge in-memory buckets into the rollup table (rows locked for the update).
+    """
+    existing = {
+        (row.period, row.bucket_start, row.region, row.action): row
+        for row in ModerationRollup.objects.select_for_update().filter(
+            bucket_start__in={key[1] for key in buckets},
+            region__in={key[2] for key in buckets},
+        )
+    }
+
+    to_create, to_update = [], []
+    for key, bucket in buckets.items():
+        row = existing.get(key)
+        if row is None:
+            period, bucket_start, region, action = key
+            row = ModerationRollup(period=period, bucket_start=bucket_start, region=region, action=action)
+            to_create.append(row)
+        else:
+            to_update.append(row)
+        row.count += bucket.count
+        row.wait_seconds_total += bucket.wait_total
+        row.wait_seconds_max = max(row.wait_seconds_max, bucket.wait_max)
+        row.wait_sketch = DurationSketch.from_json(row.wait_sketch).merge(bucket.sketch).to_json()
+
+    ModerationRollup.objects.bulk_create(to_create)
+    ModerationRollup.objects.bulk_update(
+        to_update, ["count", "wait_seconds_total", "wait_seconds_max", "wait_sketch"]
+    )
+
+
+def roll_up_batch(now: datetime, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """
+    Fold one batch of new log rows into the rollups. Returns how many were folded.
+    """
+    settled_before = now - timedelta(seconds=SETTLE_SECONDS)
+
+    with transaction.atomic():
+        RollupWatermark.objects.get_or_create(name=WATERMARK_NAME)
+        watermark = RollupWatermark.objects.select_for_update().get(name=WATERMARK_NAME)
+
+        logs = []
+        for log in (
+            EventModerationLog.objects.filter(pk__gt=watermark.last_log_id)
+            .order_by("pk")
+            .values("pk", "region", "event_id", "action", "acted_at", "created_at")[:batch_size]
+        ):
+            if log["created_at"] >= settled_before:
+                break
+            logs.append(log)
+        if not logs:
+            return 0
+
+        submitted = _submitted_at({log["event_id"] for log in logs})
+        buckets: dict[tuple, _Bucket] = {}
+        for log in logs:
+            created_at = submitted.get(log["event_id"])
+            wait = (log["acted_at"] - created_at).total_seconds() if created_at else None
+            for period, start in bucket_starts(log["acted_at"]).items():
+                key = (period, start, log["region"], log["action"])
+                buckets.setdefault(key, _Bucket()).add(max(wait, 0.0) if wait is not None else None)
+
+        _fold(buckets)
+        watermark.last_log_id = logs[-1]["pk"]
+        watermark.save(update_fields=["last_log_id", "updated_at"])
+
+    return len(logs)
+
+
+def roll_up(now: datetime | None = None, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """
+    Fold every settled new log row, one transaction per batch. Returns the total folded.
+    """
+    now = now or timezone.now()
+    total = 0
+    while True:
+        folded = roll_up_batch(now, batch_size)
+        total += folded
+        if folded < batch_size:
+            return total
+
+
+def decision_summary(since: datetime, region: str | None = None) -> dict:
+    """
+    Counts per action and merged wait percentiles from daily rollups since ``since``.
+    """
+    rows = ModerationRollup.objects.filter(period=RollupPeriod.DAY, bucket_start__gte=since)
+    if region:
+        rows = rows.filter(region=region)
+
+    counts: dict[str, int] = {}
+    sketch = DurationSketch()
+    wait_max = 0.0
+    for action, count, wait_sketch, row_max in rows.values_list("action", "count", "wait_sketch", "wait_seconds_max"):
+        counts[action] = counts.get(action, 0) + count
+        if action in DECISION_ACTIONS:
+            sketch.merge(DurationSketch.from_json(wait_sketch))
+            wait_max = max(wait_max, row_max)
+
+    return {
+        "counts": counts,
+        "decided": sum(counts.get(action, 0) for action in DECISION_ACTIONS),
+        "p50": sketch.quantile(0.5),
+        "p90": sketch.quantile(0.9),
+        "p99": sketch.quantile(0.99),
+        "max": wait_max if sketch.count else None,
+    }
+
+
+def daily_series(since: datetime) -> list[dict]:
+    """
+    Per local day since ``since``: decisions and wait percentiles across regions, newest first.
+    """
+    days: dict[datetime, tuple[int, DurationSketch]] = {}
+    rows = ModerationRollup.objects.filter(
+        period=RollupPeriod.DAY, bucket_start__gte=since, action__in=DECISION_ACTIONS
+    ).values_list("bucket_start", "count", "wait_sketch")
+    for day, count, wait_sketch in rows:
+        decided, sketch = days.get(day, (0, DurationSketch()))
+        days[day] = (decided + count, sketch.merge(DurationSketch.from_json(wait_sketch)))
+
+    return [
+        {"day": day, "decided": decided, "p50": sketch.quantile(0.5), "p90": sketch.quantile(0.9)}
+        for day, (decided, sketch) in sorted(days.items(), reverse=True)
+    ]
@@ -0,0 +1,66 @@
+"""
+A small mergeable quantile sketch for durations (a log-bucketed histogram).
+
+Values are counted in buckets whose bounds grow geometrically by GAMMA, so
+any quantile read back is within RELATIVE_ACCURACY of the true value, and
+two sketches merge by adding bucket counts. That is what lets the rollups
+store one sketch per hour and still answer "p90 wait over the last 30 days"
+by merging, without keeping individual waits.
+
+A few hundred buckets cover one second to a year, so the JSON stays small.
+"""
+
+from __future__ import annotations
+
+import math
+
+RELATIVE_ACCURACY = 0.02
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(GAMMA)
+
+
+class DurationSketch:
+    def __init__(self, buckets: dict[int, int] | None = None, zero: int = 0):
+        self.buckets: dict[int, int] = dict(buckets or {})
+        # Waits under a second, including clock skew between rows.
+        self.zero = zero
+
+    @property
+    def count(self) -> int:
+        return self.zero + sum(self.buckets.values())
+
+    def add(self, seconds: float) -> None:
+        if seconds < 1:
+            self.zero += 1
+            return
+        index = math.ceil(math.log(seconds) / _LOG_GAMMA)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: DurationSketch) -> DurationSketch:
+        self.zero += other.zero
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        return self
+
+    def quantile(self, q: float) -> float | None:
+        total = self.count
+        if not total:
+            return None
+        rank = q * (total - 1)
+        seen = self.zero
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                # Midpoint of the bucket (GAMMA^(i-1), GAMMA^i] in relative terms.
+                return 2 * GAMMA**index / (GAMMA + 1)
+        return 2 * GAMMA ** max(self.buckets) / (GAMMA + 1)
+
+    def to_json(self) -> dict:
+        return {"zero": self.zero, "buckets": {str(index): count for index, count in self.buckets.items()}}
+
+    @classmethod
+    def from_json(cls, data: dict | None) -> DurationSketch:
+        data = data or {}
+        return cls({int(index): count for index, count in data.get("buckets", {}).items()}, data.get("zero", 0))
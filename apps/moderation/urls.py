@@ -7,9 +7,15 @@ urlpatterns = [
     path("", views.moderation_home, name="home"),
     path("log/", views.moderation_log, name="log"),
 
+    # SLA dashboard (reads the moderation rollups)
+    path("dashboard/", include(("apps.moderation.dashboard.urls", "dashboard"), namespace="dashboard")),
+
     # Queue app
     path("queue/", include(("apps.moderation.queue.urls", "queue"), namespace="queue")),
 
+    # Request profiles (staff profiling hook)
+    path("profiles/", include(("apps.moderation.profiles.urls", "profiles"), namespace="profiles")),
+
     # Decision row app
     path("decision/", include(("apps.moderation.decision_row.urls", "decision_row"), namespace="decision_row")),
 ]
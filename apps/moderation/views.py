@@ -8,10 +8,14 @@ from django.utils import timezone
 from django.views.decorators.http import require_http_methods
 
 from .forms import ModerationDecisionForm
+from .history import attach_events
 from .models import EventModerationLog, ModerationAction, Region
 from apps.events.models import Event, EventStatus
+from apps.pagination.cursor import paginate
 
 
+LOG_PAGE_SIZE = 100
+
 REGION_LABELS: dict[str, str] = {
     Region.OXFORD: "Oxford",
     Region.WEST_OXON: "West Oxfordshire",
@@ -153,6 +157,7 @@ def moderation_queue(request: HttpRequest) -> HttpResponse:
                 region=region_key,
                 status=EventStatus.PENDING,
                 venue__is_active=True,
+                series__isnull=True,
             )
             .order_by("start_at")
         )
@@ -182,7 +187,10 @@ def moderation_queue(request: HttpRequest) -> HttpResponse:
 @staff_member_required
 def moderation_log(request: HttpRequest) -> HttpResponse:
     """
-    Simple audit log page.
+    Audit log, newest first, with each row's event title and venue.
     """
-    logs = EventModerationLog.objects.select_related("actor").all()[:250]
-    return render(request, "moderation/log.html", {"logs": logs})
+    # Keyset pages on the (acted_at, id) index: no COUNT(*) over the whole log.
+    cursor = request.GET.get("cursor")
+    page = paginate(EventModerationLog.objects.select_related("actor"), cursor, LOG_PAGE_SIZE, field="acted_at", descending=True)
+    logs = attach_events(page.items)
+    return render(request, "moderation/log.html", {"logs": logs, "page": page, "is_first_page": not cursor})
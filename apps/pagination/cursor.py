@@ -0,0 +1,81 @@
+"""
+Keyset ("cursor") pagination for event listings.
+
+OFFSET pagination gets slower the deeper you page and shifts when events are
+added mid-scroll. Instead we page on (start_at, pk): the cursor encodes the
+last row of the previous page, and the next page is a single indexed range
+scan from there.
+"""
+
+from __future__ import annotations
+
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db.models import Q, QuerySet
+
+
+@dataclass(frozen=True)
+class CursorPage:
+    items: list
+    next_cursor: str | None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(value: datetime, pk: int) -> str:
+    raw = f"{value.isoformat()}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> tuple[datetime, int] | None:
+    """
+    Returns None for a missing or malformed cursor (treated as the first page).
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, pk = base64.urlsafe_b64decode(padded.encode()).decode().rsplit("|", 1)
+        return datetime.fromisoformat(value), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def _after_cursor(qs: QuerySet, cursor: str | None, field: str, descending: bool) -> QuerySet:
+    position = decode_cursor(cursor)
+    if position is None:
+        return qs
+
+    value, pk = position
+    op = "lt" if descending else "gt"
+    return qs.filter(Q(**{f"{field}__{op}": value}) | Q(**{field: value, f"pk__{op}": pk}))
+
+
+def _ordered(qs: QuerySet, field: str, descending: bool) -> QuerySet:
+    if descending:
+        return qs.order_by(f"-{field}", "-pk")
+    return qs.order_by(field, "pk")
+
+
+def _page_from_rows(rows: list, per_page: int, field: str) -> CursorPage:
+    if len(rows) <= per_page:
+        return CursorPage(items=rows, next_cursor=None)
+
+    rows = rows[:per_page]
+    last = rows[-1]
+    return CursorPage(items=rows, next_cursor=encode_cursor(getattr(last, field), last.pk))
+
+
+def paginate(qs: QuerySet, cursor: str | None, per_page: int, *, field: str = "start_at", descending: bool = False) -> CursorPage:
+    qs = _ordered(_after_cursor(qs, cursor, field, descending), field, descending)
+    # Fetch one extra row to know whether there is a next page without a COUNT(*).
+    return _page_from_rows(list(qs[: per_page + 1]), per_page, field)
+
+
+async def apaginate(qs: QuerySet, cursor: str | None, per_page: int, *, field: str = "start_at", descending: bool = False) -> CursorPage:
+    qs = _ordered(_after_cursor(qs, cursor, field, descending), field, descending)
+    return _page_from_rows([row async for row in qs[: per_page + 1]], per_page, field)
@@ -0,0 +1,47 @@
+from django.contrib import admin
+
+from .models import Placement, PlacementDailyStats, Sponsor
+
+
+class PlacementInline(admin.StackedInline):
+    model = Placement
+    extra = 0
+
+
+@admin.register(Sponsor)
+class SponsorAdmin(admin.ModelAdmin):
+    list_display = ("name", "website", "contact_email", "is_active")
+    list_filter = ("is_active",)
+    search_fields = ("name",)
+    inlines = (PlacementInline,)
+
+
+@admin.register(Placement)
+class PlacementAdmin(admin.ModelAdmin):
+    list_display = ("sponsor", "slot", "region", "starts_on", "ends_on", "weight", "is_active")
+    list_filter = ("slot", "region", "is_active")
+    list_select_related = ("sponsor",)
+    search_fields = ("sponsor__name",)
+    autocomplete_fields = ("sponsor",)
+
+
+@admin.register(PlacementDailyStats)
+class PlacementDailyStatsAdmin(admin.ModelAdmin):
+    """
+    Filter by placement and month for a sponsor's monthly summary.
+    """
+
+    list_display = ("day", "placement_id", "impressions", "clicks", "click_through_rate")
+    search_fields = ("placement_id",)
+    date_hierarchy = "day"
+
+    def click_through_rate(self, obj):
+        return f"{obj.clicks / obj.impressions:.1%}" if obj.impressions else "–"
+
+    click_through_rate.short_description = "CTR"
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class SponsorshipConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.sponsorship"
+    label = "sponsorship"
+    verbose_name = "Sponsorship"
+
+    def ready(self):
+        from . import signals  # noqa: F401
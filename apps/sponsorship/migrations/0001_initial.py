@@ -0,0 +1,64 @@
+# Generated by Django 6.0 on 2026-10-19 00:47
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Sponsor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('website', models.URLField(blank=True)),
+                ('contact_email', models.EmailField(blank=True, max_length=254)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PlacementDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('placement_id', models.PositiveBigIntegerField()),
+                ('impressions', models.PositiveIntegerField(default=0)),
+                ('clicks', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['-day'],
+                'constraints': [models.UniqueConstraint(fields=('day', 'placement_id'), name='sponsorship_stats_day_placement_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Placement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slot', models.CharField(choices=[('home', 'Homepage (after the event cards)'), ('event_detail', 'Event page sidebar'), ('footer', 'Sitewide footer')], max_length=20)),
+                ('region', models.CharField(blank=True, choices=[('oxford', 'Oxford'), ('westoxon', 'West Oxfordshire'), ('eastoxon', 'East Oxfordshire'), ('northoxon', 'North Oxfordshire'), ('southoxon', 'South Oxfordshire')], help_text='Leave blank to show in every region and on the homepage.', max_length=20)),
+                ('image_url', models.URLField(blank=True, help_text='Static banner (JPG/PNG/WebP).')),
+                ('alt_text', models.CharField(blank=True, max_length=200)),
+                ('text', models.CharField(blank=True, help_text='Sponsored line, used when there is no banner.', max_length=200)),
+                ('target_url', models.URLField(help_text='Click-through URL, with UTM tags.')),
+                ('starts_on', models.DateField(default=django.utils.timezone.localdate)),
+                ('ends_on', models.DateField(blank=True, null=True)),
+                ('weight', models.PositiveSmallIntegerField(default=1)),
+                ('is_active', models.BooleanField(default=True)),
+                ('sponsor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='placements', to='sponsorship.sponsor')),
+            ],
+            options={
+                'ordering': ['slot', 'region', '-starts_on'],
+            },
+        ),
+    ]
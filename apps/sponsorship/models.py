@@ -0,0 +1,80 @@
+from django.db import models
+from django.utils import timezone
+
+from apps.events.models import EventRegion
+
+
+class SponsorSlot(models.TextChoices):
+    HOME = "home", "Homepage (after the event cards)"
+    EVENT_DETAIL = "event_detail", "Event page sidebar"
+    FOOTER = "footer", "Sitewide footer"
+
+
+class Sponsor(models.Model):
+    name = models.CharField(max_length=255)
+    website = models.URLField(blank=True)
+    contact_email = models.EmailField(blank=True)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class Placement(models.Model):
+    """
+    One booked slot: a sponsor's banner (or footer line) in a slot, for one
+    region or county-wide, between two dates. Placements sharing a slot
+    rotate in proportion to ``weight``.
+    """
+
+    sponsor = models.ForeignKey(Sponsor, on_delete=models.CASCADE, related_name="placements")
+    slot = models.CharField(max_length=20, choices=SponsorSlot.choices)
+    region = models.CharField(
+        max_length=20,
+        choices=EventRegion.choices,
+        blank=True,
+        help_text="Leave blank to show in every region and on the homepage.",
+    )
+
+    image_url = models.URLField(blank=True, help_text="Static banner (JPG/PNG/WebP).")
+    alt_text = models.CharField(max_length=200, blank=True)
+    text = models.CharField(max_length=200, blank=True, help_text="Sponsored line, used when there is no banner.")
+    target_url = models.URLField(help_text="Click-through URL, with UTM tags.")
+
+    starts_on = models.DateField(default=timezone.localdate)
+    ends_on = models.DateField(null=True, blank=True)
+    weight = models.PositiveSmallIntegerField(default=1)
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        ordering = ["slot", "region", "-starts_on"]
+
+    def __str__(self) -> str:
+        return f"{self.sponsor} – {self.get_slot_display()}"
+
+
+class PlacementDailyStats(models.Model):
+    """
+    Impressions and clicks per placement and local day, written by the
+    analytics counter buffer's flush.
+    """
+
+    COUNTER_KEY = ("day", "placement_id")
+
+    day = models.DateField()
+    placement_id = models.PositiveBigIntegerField()
+    impressions = models.PositiveIntegerField(default=0)
+    clicks = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-day"]
+        constraints = [
+            models.UniqueConstraint(fields=["day", "placement_id"], name="sponsorship_stats_day_placement_uniq"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.day} placement {self.placement_id}"
@@ -0,0 +1,173 @@
+"""
+Precomputed sponsor rotation.
+
+Every live placement is flattened into one table keyed by "region:slot"
+(region "" for pages outside a region, like the homepage) and stored in the
+shared cache for ROTATION_CACHE_SECONDS. The table is rebuilt and
+republished after any change to a sponsor or placement, and each worker
+keeps a copy in process memory, re-reading the cache at most every
+ROTATION_CHECK_SECONDS, so a change reaches every worker within that.
+Choosing a sponsor while rendering is a dict lookup and a counter: no query,
+and usually no cache round trip either.
+
+Async views render on the event loop, where neither the ORM nor a database
+cache may be used. There a due re-read runs in the background through
+sync_to_async, and the render uses the copy the worker already has (loaded
+at boot by core.warmup).
+
+Date windows are kept in the entries and checked when choosing, so a
+placement starting tomorrow needs no rebuild at midnight.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import threading
+import time
+from datetime import date
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.events.models import EventRegion
+
+from .models import Placement
+
+logger = logging.getLogger(__name__)
+
+# Versioned: bump when the table's shape changes, so workers never read an old layout.
+ROTATION_CACHE_KEY = "sponsorship:rotation:v2"
+ROTATION_CHECK_SECONDS = 30
+# Rebuilt from the database at least this often, even without a change.
+ROTATION_CACHE_SECONDS = 3600
+
+
+def slot_key(region: str, slot: str) -> str:
+    return f"{region}:{slot}"
+
+
+def build_rotation(today: date | None = None) -> dict:
+    today = today or timezone.localdate()
+    placements = (
+        Placement.objects.select_related("sponsor")
+        .filter(is_active=True, sponsor__is_active=True)
+        .exclude(ends_on__lt=today)
+        .order_by("pk")
+    )
+
+    slots: dict[str, list[dict]] = {}
+    targets: dict[int, dict] = {}
+    for placement in placements:
+        entry = {
+            "id": placement.pk,
+            "sponsor": placement.sponsor.name,
+            "image_url": placement.image_url,
+            "alt_text": placement.alt_text or placement.sponsor.name,
+            "text": placement.text,
+            "starts_on": placement.starts_on,
+            "ends_on": placement.ends_on,
+            "weight": max(placement.weight, 1),
+        }
+        # County-wide placements show everywhere, including region-less pages.
+        regions = [placement.region] if placement.region else ["", *EventRegion.values]
+        for region in regions:
+            slots.setdefault(slot_key(region, placement.slot), []).append(entry)
+        targets[placement.pk] = {"url": placement.target_url, "starts_on": placement.starts_on, "ends_on": placement.ends_on}
+
+    return {"built_at": time.time(), "slots": slots, "targets": targets}
+
+
+def publish_rotation() -> dict:
+    table = build_rotation()
+    cache.set(ROTATION_CACHE_KEY, table, timeout=ROTATION_CACHE_SECONDS)
+    rotation.replace(table)
+    return table
+
+
+def load_rotation() -> dict:
+    """
+    The shared table, rebuilt and republished if the cache no longer has it.
+    """
+    table = cache.get(ROTATION_CACHE_KEY)
+    return table if table is not None else publish_rotation()
+
+
+def _is_live(entry: dict, today: date) -> bool:
+    return entry["starts_on"] <= today and (entry["ends_on"] is None or today <= entry["ends_on"])
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class Rotation:
+    def __init__(self):
+        self._table: dict | None = None
+        self._checked_at = 0.0
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._refresh: asyncio.Task | None = None
+
+    def replace(self, table: dict) -> None:
+        with self._lock:
+            self._table = table
+            self._checked_at = time.monotonic()
+
+    def table(self) -> dict | None:
+        if self._checked_at and time.monotonic() - self._checked_at < ROTATION_CHECK_SECONDS:
+            return self._table
+        if _in_event_loop():
+            self._refresh_in_background()
+            return self._table
+        self.replace(load_rotation())
+        return self._table
+
+    def _refresh_in_background(self) -> None:
+        if self._refresh is not None and not self._refresh.done():
+            return
+        # Keep a reference: the loop only holds tasks weakly.
+        self._refresh = asyncio.get_running_loop().create_task(self._arefresh())
+
+    async def _arefresh(self) -> None:
+        try:
+            self.replace(await sync_to_async(load_rotation)())
+        except Exception:
+            logger.exception("sponsorship: failed to refresh the rotation table")
+            # Back off instead of retrying on every render.
+            self._checked_at = time.monotonic()
+
+    def choose(self, region: str, slot: str, today: date | None = None) -> dict | None:
+        table = self.table()
+        if not table:
+            return None
+        today = today or timezone.localdate()
+        live = [entry for entry in table["slots"].get(slot_key(region, slot), ()) if _is_live(entry, today)]
+        if not live:
+            return None
+        # Weighted round robin across this worker's renders.
+        position = next(self._counter) % sum(entry["weight"] for entry in live)
+        for entry in live:
+            position -= entry["weight"]
+            if position < 0:
+                return entry
+        return live[-1]
+
+    def target_url(self, placement_id: int, today: date | None = None) -> str | None:
+        """
+        Where a click on the placement goes, or None unless it is live today.
+        """
+        table = self.table()
+        target = table["targets"].get(placement_id) if table else None
+        if target is None or not _is_live(target, today or timezone.localdate()):
+            return None
+        return target["url"]
+
+
+rotation = Rotation()
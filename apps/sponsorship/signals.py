@@ -0,0 +1,16 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Placement, Sponsor
+from .rotation import publish_rotation
+
+
+@receiver(post_save, sender=Sponsor)
+@receiver(post_delete, sender=Sponsor)
+@receiver(post_save, sender=Placement)
+@receiver(post_delete, sender=Placement)
+def republish_rotation(sender, **kwargs):
+    # After commit, so the rebuilt table sees the change (once per transaction
+    # would be nicer, but sponsors are edited a handful of times a month).
+    transaction.on_commit(publish_rotation)
@@ -0,0 +1,29 @@
+from django import template
+from django.template.loader import render_to_string
+
+from apps.events.views import NAMESPACE_TO_REGION
+from core.edge_cache import is_shareable
+
+from ..rotation import rotation
+from ..tracking import render_slot
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def sponsor_slot(context, slot: str):
+    """
+    Render one sponsor for ``slot`` in the current page's region (or nothing).
+    Counts an impression in the buffer; never queries the database.
+
+    A shareable page (core.edge_cache) gets a placeholder instead, filled
+    from views.slot on every view, so a shared or pre-rendered copy never
+    freezes one sponsor and every impression is still counted.
+    """
+    request = context.get("request")
+    match = getattr(request, "resolver_match", None)
+    region = NAMESPACE_TO_REGION.get(getattr(match, "namespace", None) or "", "")
+
+    if request is not None and is_shareable(request):
+        return render_to_string("sponsorship/_slot_placeholder.html", {"slot": slot, "region": region})
+    return render_slot(request, rotation.choose(region, slot), slot)
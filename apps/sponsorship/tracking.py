@@ -0,0 +1,18 @@
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from apps.analytics.buffer import buffer
+from apps.analytics.tracking import is_bot
+
+from .models import PlacementDailyStats
+
+
+def render_slot(request, entry: dict | None, slot: str) -> str:
+    """
+    The HTML for one chosen sponsor (or nothing), counting the impression.
+    """
+    if entry is None:
+        return ""
+    if request is not None and not is_bot(request.META.get("HTTP_USER_AGENT", "")):
+        buffer.incr(PlacementDailyStats, {"day": timezone.localdate(), "placement_id": entry["id"]}, "impressions")
+    return render_to_string("sponsorship/_slot.html", {"entry": entry, "slot": slot})
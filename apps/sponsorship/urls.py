@@ -0,0 +1,10 @@
+from django.urls import path
+
+from . import views
+
+app_name = "sponsorship"
+
+urlpatterns = [
+    path("sponsor/<int:placement_id>/", views.click, name="click"),
+    path("sponsor/slot/<slug:slot>/", views.slot, name="slot"),
+]
@@ -0,0 +1,37 @@
+from django.http import Http404, HttpResponse
+from django.shortcuts import redirect
+from django.utils import timezone
+from django.views.decorators.cache import never_cache
+
+from apps.analytics.buffer import buffer
+from apps.analytics.tracking import is_bot
+from apps.events.models import EventRegion
+
+from .models import PlacementDailyStats, SponsorSlot
+from .rotation import rotation
+from .tracking import render_slot
+
+
+@never_cache
+def slot(request, slot: str):
+    """
+    One sponsor for a shareable page's placeholder (see the sponsor_slot
+    tag), chosen and counted per view. Empty if the slot has no sponsor.
+    """
+    region = request.GET.get("region", "")
+    if slot not in SponsorSlot.values or region not in ("", *EventRegion.values):
+        raise Http404("No such sponsor slot.")
+    return HttpResponse(render_slot(request, rotation.choose(region, slot), slot))
+
+
+def click(request, placement_id: int):
+    """
+    Count a click and send the visitor on. The target comes from the rotation
+    table, so only live placements redirect and nothing is queried.
+    """
+    target = rotation.target_url(placement_id)
+    if not target:
+        raise Http404("No such sponsor placement.")
+    if not is_bot(request.META.get("HTTP_USER_AGENT", "")):
+        buffer.incr(PlacementDailyStats, {"day": timezone.localdate(), "placement_id": placement_id}, "clicks")
+    return redirect(target)
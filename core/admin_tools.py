@@ -0,0 +1,114 @@
+"""
+Admin helpers for large tables (Event, EventModerationLog).
+
+The stock changelist runs an exact COUNT(*) for the paginator, another for
+"N total" and renders every related row as a filter choice. On million-row
+tables those dominate page load. This module swaps them for:
+
+- EstimatedCountPaginator: planner row estimate (pg_class.reltuples) for
+  unfiltered changelists above a threshold, exact counts otherwise.
+- AutocompleteListFilter: a related-field filter that searches through the
+  admin autocomplete endpoint instead of listing every related object.
+- LargeTableAdminMixin: wires both in and turns off the full result count.
+"""
+
+from __future__ import annotations
+
+from django import forms
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.admin.widgets import AutocompleteSelect
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+DEFAULT_ESTIMATE_THRESHOLD = 100_000
+
+
+def estimated_row_count(qs: QuerySet) -> int | None:
+    """
+    Planner estimate of the table's row count, or None if unavailable.
+    Only meaningful on PostgreSQL, and only after ANALYZE has run.
+    """
+    connection = connections[qs.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [connection.ops.quote_name(qs.model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+
+    # reltuples is -1 for never-analysed tables.
+    if not row or row[0] < 0:
+        return None
+    return row[0]
+
+
+class EstimatedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        qs = self.object_list
+        if isinstance(qs, QuerySet) and not qs.query.where:
+            threshold = getattr(settings, "ADMIN_ESTIMATED_COUNT_THRESHOLD", DEFAULT_ESTIMATE_THRESHOLD)
+            estimate = estimated_row_count(qs)
+            if estimate is not None and estimate >= threshold:
+                return estimate
+        return super().count
+
+
+class AutocompleteListFilter(admin.RelatedFieldListFilter):
+    """
+    Related-field filter backed by the admin autocomplete view.
+
+    Only the currently selected object is loaded; everything else is found by
+    typing. The related model's admin must define search_fields.
+    """
+
+    template = "admin/autocomplete_list_filter.html"
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        self.admin_site = model_admin.admin_site
+        super().__init__(field, request, params, model, model_admin, field_path)
+        # A model choice field gives the widget the lazy choice iterator it expects;
+        # only the selected value is ever fetched from it.
+        self.widget = forms.ModelChoiceField(
+            queryset=field.remote_field.model._default_manager.all(),
+            widget=AutocompleteSelect(field, self.admin_site, attrs={"style": "width: 100%"}),
+        ).widget
+
+    def field_choices(self, field, request, model_admin):
+        if not self.lookup_val:
+            return []
+        return field.get_choices(include_blank=False, limit_choices_to={"pk__in": self.lookup_val})
+
+    def has_output(self):
+        return True
+
+    def choices(self, changelist):
+        # Other active filters/search/ordering, carried through the search form as hidden inputs.
+        own = set(self.expected_parameters())
+        self.preserved_params = [
+            (key, value)
+            for key, values in changelist.filter_params.items()
+            if key not in own
+            for value in values
+        ]
+        return super().choices(changelist)
+
+    @property
+    def widget_html(self):
+        selected = self.lookup_val[-1] if self.lookup_val else None
+        return self.widget.render(self.lookup_kwarg, selected)
+
+    @property
+    def media(self):
+        return self.widget.media
+
+
+class LargeTableAdminMixin:
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from django.conf import settings
+
+
+def get_client_ip(request) -> str:
+    """
+    The client's IP address, as used by both axes lockouts and request throttling.
+
+    Behind TRUSTED_PROXY_COUNT proxies (Heroku's router is one) the client is
+    the entry that many hops from the right of X-Forwarded-For; entries further
+    left are client-supplied and cannot be trusted. With no trusted proxies,
+    REMOTE_ADDR is used as-is.
+    """
+    proxies = settings.TRUSTED_PROXY_COUNT
+    if proxies:
+        forwarded = [ip.strip() for ip in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",") if ip.strip()]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+    return request.META.get("REMOTE_ADDR", "")
@@ -0,0 +1,123 @@
+"""
+Shared-cache (CDN / reverse proxy) policy for the public pages.
+
+Anonymous GETs of the region pages and the landing page get
+``Cache-Control: public, s-maxage=N, stale-while-revalidate=M`` and are
+tagged with surrogate keys, sent both as ``Surrogate-Key`` (space separated,
+Fastly and Varnish) and ``Cache-Tag`` (comma separated, Cloudflare):
+
+    region-<region>   every page of a region (and the landing page)
+    venue-<id>        pages about one venue
+    event-<id>        an event's detail page (the original Event id)
+
+Views add the venue and event keys with ``add_surrogate_keys``; the region
+keys come from the URL namespace. When an event or venue changes, the
+affected keys are purged through core.purge after commit, so the shared
+cache can hold pages for minutes without serving stale listings.
+
+Requests carrying a session cookie, and responses setting a cookie, are
+never marked public.
+
+A page rendered for a request without a session cookie may be served to
+many visitors, from here or from a pre-rendered file (apps.events.prerender),
+so it must not bake in per-view work. ``is_shareable`` says which requests
+those are: their sponsor slots load from an uncached fragment
+(apps.sponsorship) and their page views are counted by a beacon
+(apps.analytics) rather than while rendering.
+"""
+
+from __future__ import annotations
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.cache import patch_cache_control
+
+
+def region_key(region: str) -> str:
+    return f"region-{region}"
+
+
+def venue_key(venue_id: int) -> str:
+    return f"venue-{venue_id}"
+
+
+def event_key(event_id: int) -> str:
+    return f"event-{event_id}"
+
+
+def is_shareable(request) -> bool:
+    """
+    Whether the page rendered for ``request`` may be served to other visitors.
+    """
+    return settings.SESSION_COOKIE_NAME not in request.COOKIES
+
+
+def add_surrogate_keys(request, *keys: str) -> None:
+    request.surrogate_keys = getattr(request, "surrogate_keys", set()) | set(keys)
+
+
+def _namespace_keys(request) -> set[str] | None:
+    """
+    Region keys for a shared-cacheable page, or None if the page is not one.
+    """
+    from apps.events.models import EventRegion
+    from apps.events.views import NAMESPACE_TO_REGION
+
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return None
+    if match.namespace in NAMESPACE_TO_REGION:
+        return {region_key(NAMESPACE_TO_REGION[match.namespace])}
+    if match.namespace == "landing":
+        # The landing page lists every region's next events.
+        return {region_key(region) for region in EventRegion.values}
+    return None
+
+
+class SharedCacheMiddleware:
+    """
+    Applies the shared-cache policy to anonymous GETs of public pages.
+
+    Must sit above SessionMiddleware and CsrfViewMiddleware, so the cookies
+    they set are visible here.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process(request, await self.get_response(request))
+
+    def process(self, request, response):
+        if not settings.SHARED_CACHE_ENABLED or request.method not in ("GET", "HEAD"):
+            return response
+
+        keys = _namespace_keys(request)
+        if keys is None:
+            return response
+        if not is_shareable(request) or response.cookies:
+            patch_cache_control(response, private=True)
+            return response
+        if response.status_code != 200:
+            return response
+
+        patch_cache_control(
+            response,
+            public=True,
+            s_maxage=settings.SHARED_CACHE_MAX_AGE,
+            stale_while_revalidate=settings.SHARED_CACHE_STALE_SECONDS,
+        )
+        keys = sorted(keys | getattr(request, "surrogate_keys", set()))
+        response["Surrogate-Key"] = " ".join(keys)
+        response["Cache-Tag"] = ",".join(keys)
+        return response
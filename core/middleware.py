@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from core.routers import allow_replica_reads
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS", "TRACE"}
+
+
+class ReplicaPinMiddleware:
+    """
+    Read-your-writes for the replica router.
+
+    Replica reads are allowed only for safe requests that are not pinned.
+    A request is pinned to the primary when:
+      - the client wrote something recently (short-lived pin cookie), or
+      - it belongs to a staff session.
+
+    Any successful unsafe request (moderation decisions, form posts) sets the
+    pin cookie, so the redirect that follows sees the fresh row.
+
+    Must sit after AuthenticationMiddleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        pinned = self._is_write(request) or self._has_pin_cookie(request)
+        if not pinned and self._has_session(request):
+            pinned = request.user.is_staff
+
+        with allow_replica_reads(not pinned):
+            response = self.get_response(request)
+        return self._process_response(request, response)
+
+    async def __acall__(self, request):
+        pinned = self._is_write(request) or self._has_pin_cookie(request)
+        if not pinned and self._has_session(request):
+            user = await request.auser()
+            pinned = user.is_staff
+
+        with allow_replica_reads(not pinned):
+            response = await self.get_response(request)
+        return self._process_response(request, response)
+
+    def _is_write(self, request) -> bool:
+        return request.method not in SAFE_METHODS
+
+    def _has_pin_cookie(self, request) -> bool:
+        return settings.REPLICA_PIN_COOKIE in request.COOKIES
+
+    def _has_session(self, request) -> bool:
+        # Anonymous listing traffic has no session cookie; don't load a user for it.
+        return settings.SESSION_COOKIE_NAME in request.COOKIES
+
+    def _process_response(self, request, response):
+        if self._is_write(request) and response.status_code < 400:
+            response.set_cookie(
+                settings.REPLICA_PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
@@ -0,0 +1,231 @@
+"""
+On-demand sampling profiler for single production requests.
+
+A staff user adds ``?_profile=1`` (or an ``X-Profile: 1`` header) to a request.
+For that request only, a background thread samples every thread's stack every
+PROFILE_SAMPLE_INTERVAL seconds and the result is written to PROFILE_DIR in
+collapsed-stack format ("outer;inner;leaf count" per line), which flamegraph
+tools and speedscope read directly. The moderation profiles view lists and
+summarises them.
+
+Sampling rather than cProfile: the request runs at close to normal speed, and
+under ASGI the ORM work happens on executor threads that a per-thread
+deterministic profiler would miss. The flip side is that another request
+running on the same worker at the same time shows up in the samples too.
+
+The middleware sits right after AuthenticationMiddleware and checks that the
+user is staff before sampling starts, so nobody else can switch the sampler
+on. Requests without a session cookie never load a user for the check.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.text import slugify
+
+TRIGGER_PARAM = "_profile"
+TRIGGER_HEADER = "HTTP_X_PROFILE"
+PROFILE_SUFFIX = ".collapsed"
+PROFILE_NAME_RE = re.compile(r"^[0-9T]+-\d+ms-[A-Z]+-[a-z0-9-]*-[0-9a-f]+\.collapsed$")
+
+# Innermost frames of threads that are parked, not working: skipping them keeps
+# idle executor/server threads from drowning out the request.
+IDLE_FRAMES = {
+    ("threading", "Condition.wait"),
+    ("threading", "Event.wait"),
+    ("queue", "Queue.get"),
+    ("selectors", "EpollSelector.select"),
+    ("selectors", "KqueueSelector.select"),
+    ("selectors", "PollSelector.select"),
+    ("selectors", "SelectSelector.select"),
+    ("concurrent.futures.thread", "_worker"),
+}
+
+
+def _frame_name(frame) -> tuple[str, str]:
+    return frame.f_globals.get("__name__", "?"), frame.f_code.co_qualname
+
+
+def _collapse(frame) -> str | None:
+    if _frame_name(frame) in IDLE_FRAMES:
+        return None
+    names = []
+    while frame is not None:
+        module, qualname = _frame_name(frame)
+        names.append(f"{module}:{qualname}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = _collapse(frame)
+                if stack:
+                    self.samples[stack] += 1
+
+
+def profile_dir() -> Path:
+    return Path(settings.PROFILE_DIR)
+
+
+def save_profile(request, samples: Counter, elapsed: float) -> str:
+    started = datetime.now(dt_timezone.utc).strftime("%Y%m%dT%H%M%S")
+    path_slug = slugify(request.path.replace("/", "-"))[:60]
+    name = f"{started}-{round(elapsed * 1000)}ms-{request.method}-{path_slug}-{uuid.uuid4().hex[:6]}{PROFILE_SUFFIX}"
+
+    directory = profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    lines = (f"{stack} {count}\n" for stack, count in samples.most_common())
+    (directory / name).write_text("".join(lines))
+    return name
+
+
+# Module prefix -> component, for the "where did the time go" rollup. A sample
+# counts towards the innermost frame that matches.
+COMPONENTS = (
+    ("django.template", "Templates"),
+    ("django.db", "ORM / database"),
+    ("axes", "axes"),
+    ("whitenoise", "whitenoise"),
+    ("django.contrib.sessions", "Sessions"),
+    ("django.contrib.auth", "Auth"),
+    ("django.core.cache", "Cache"),
+    ("apps.", "App code"),
+    ("core.", "App code"),
+)
+
+
+def _component(stack: list[str]) -> str:
+    for frame in reversed(stack):
+        for prefix, label in COMPONENTS:
+            if frame.startswith(prefix):
+                return label
+    return "Other"
+
+
+def list_profiles(limit: int = 100) -> list[dict]:
+    directory = profile_dir()
+    if not directory.is_dir():
+        return []
+    files = sorted(directory.glob(f"*{PROFILE_SUFFIX}"), reverse=True)[:limit]
+    return [{"name": f.name, "size": f.stat().st_size} for f in files if PROFILE_NAME_RE.match(f.name)]
+
+
+def summarise_profile(name: str, top: int = 20) -> dict:
+    """
+    Totals for one profile: samples per component, hottest leaf functions
+    (self time) and hottest functions anywhere on the stack (inclusive time).
+    """
+    own: Counter[str] = Counter()
+    inclusive: Counter[str] = Counter()
+    components: Counter[str] = Counter()
+    total = 0
+
+    with open(profile_dir() / name) as fh:
+        for line in fh:
+            stack_text, _, count_text = line.rstrip("\n").rpartition(" ")
+            if not stack_text:
+                continue
+            count = int(count_text)
+            stack = stack_text.split(";")
+            total += count
+            own[stack[-1]] += count
+            components[_component(stack)] += count
+            for frame in set(stack):
+                inclusive[frame] += count
+
+    def share(counter):
+        return [(frame, n, 100 * n / (total or 1)) for frame, n in counter.most_common(top)]
+
+    return {
+        "total": total,
+        "components": share(components),
+        "own": share(own),
+        "inclusive": share(inclusive),
+    }
+
+
+class ProfilingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if not (self._requested(request) and request.user.is_staff):
+            return self.get_response(request)
+
+        profiler, started = self._start()
+        try:
+            response = self.get_response(request)
+        finally:
+            # Exceptions propagate (DEBUG_PROPAGATE_EXCEPTIONS); the sampler thread must not.
+            profiler.stop()
+        elapsed = time.perf_counter() - started
+        return self._finish(request, response, profiler, elapsed)
+
+    async def __acall__(self, request):
+        if not (self._requested(request) and (await request.auser()).is_staff):
+            return await self.get_response(request)
+
+        profiler, started = self._start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            # Exceptions propagate (DEBUG_PROPAGATE_EXCEPTIONS); the sampler thread must not.
+            profiler.stop()
+        elapsed = time.perf_counter() - started
+        return self._finish(request, response, profiler, elapsed)
+
+    def _requested(self, request) -> bool:
+        if not settings.PROFILING_ENABLED:
+            return False
+        if settings.SESSION_COOKIE_NAME not in request.COOKIES:
+            return False
+        return request.GET.get(TRIGGER_PARAM) == "1" or request.META.get(TRIGGER_HEADER) == "1"
+
+    def _start(self) -> tuple[SamplingProfiler, float]:
+        profiler = SamplingProfiler(settings.PROFILE_SAMPLE_INTERVAL)
+        started = time.perf_counter()
+        profiler.start()
+        return profiler, started
+
+    def _finish(self, request, response, profiler, elapsed: float):
+        if profiler.samples:
+            name = save_profile(request, profiler.samples, elapsed)
+            response["X-Profile-Id"] = name
+        return response
@@ -0,0 +1,116 @@
+"""
+Purging surrogate keys (core.edge_cache) from the shared cache.
+
+SHARED_CACHE_PURGE_BACKEND names the backend class:
+
+    core.purge.NullPurgeBackend        default: nothing to purge
+    core.purge.LocalPurgeBackend       records purged keys in memory (tests, dev)
+    core.purge.FastlyPurgeBackend      FASTLY_SERVICE_ID, FASTLY_API_TOKEN
+    core.purge.CloudflarePurgeBackend  CLOUDFLARE_ZONE_ID, CLOUDFLARE_API_TOKEN
+
+``purge_after_commit`` is what callers use: keys are collected during the
+transaction and purged once it commits, so the shared cache is never
+refilled from a page rendered before the change was visible. A failed purge
+is logged, not raised; the pages simply live until s-maxage runs out.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import urllib.request
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+PURGE_TIMEOUT_SECONDS = 5
+
+
+class BasePurgeBackend:
+    def purge(self, keys: list[str]) -> None:
+        raise NotImplementedError
+
+
+class NullPurgeBackend(BasePurgeBackend):
+    def purge(self, keys: list[str]) -> None:
+        pass
+
+
+class LocalPurgeBackend(BasePurgeBackend):
+    """
+    Keeps every purge in ``purged`` (one list of keys per call).
+    """
+
+    def __init__(self):
+        self.purged: list[list[str]] = []
+
+    def purge(self, keys: list[str]) -> None:
+        self.purged.append(list(keys))
+
+    def reset(self) -> None:
+        self.purged.clear()
+
+
+def _post(url: str, payload: dict, headers: dict) -> None:
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode(),
+        headers={"Content-Type": "application/json", "Accept": "application/json", **headers},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=PURGE_TIMEOUT_SECONDS):
+        pass
+
+
+class FastlyPurgeBackend(BasePurgeBackend):
+    # Fastly takes at most 256 surrogate keys per batch purge.
+    batch_size = 256
+
+    def purge(self, keys: list[str]) -> None:
+        for start in range(0, len(keys), self.batch_size):
+            _post(
+                f"https://api.fastly.com/service/{settings.FASTLY_SERVICE_ID}/purge",
+                {"surrogate_keys": keys[start : start + self.batch_size]},
+                {"Fastly-Key": settings.FASTLY_API_TOKEN},
+            )
+
+
+class CloudflarePurgeBackend(BasePurgeBackend):
+    # Cloudflare takes at most 30 tags per purge request.
+    batch_size = 30
+
+    def purge(self, keys: list[str]) -> None:
+        for start in range(0, len(keys), self.batch_size):
+            _post(
+                f"https://api.cloudflare.com/client/v4/zones/{settings.CLOUDFLARE_ZONE_ID}/purge_cache",
+                {"tags": keys[start : start + self.batch_size]},
+                {"Authorization": f"Bearer {settings.CLOUDFLARE_API_TOKEN}"},
+            )
+
+
+@lru_cache(maxsize=None)
+def _backend(path: str) -> BasePurgeBackend:
+    return import_string(path)()
+
+
+def get_purge_backend() -> BasePurgeBackend:
+    return _backend(settings.SHARED_CACHE_PURGE_BACKEND)
+
+
+def purge(keys) -> None:
+    keys = sorted(set(keys))
+    if not keys:
+        return
+    try:
+        get_purge_backend().purge(keys)
+    except Exception:
+        logger.exception("purge: failed to purge %d surrogate key(s)", len(keys))
+
+
+def purge_after_commit(keys) -> None:
+    keys = set(keys)
+    transaction.on_commit(lambda: purge(keys))
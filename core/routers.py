@@ -0,0 +1,65 @@
+"""
+Database routing for OxPerform.
+
+Public event listings are read-heavy and tolerate a little replication lag,
+so reads for the events app may go to a replica when one is configured.
+Everything else (moderation, auth, sessions) and every write stays on the
+primary.
+
+Replica reads are opt-in per request: core.middleware.ReplicaPinMiddleware
+enables them for anonymous safe requests only, so management commands,
+shells, staff sessions and anyone who just wrote something always read
+from the primary.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+PRIMARY_DATABASE_ALIAS = "default"
+
+_replica_reads_allowed: ContextVar[bool] = ContextVar("replica_reads_allowed", default=False)
+
+
+def replica_reads_allowed() -> bool:
+    return _replica_reads_allowed.get()
+
+
+@contextmanager
+def allow_replica_reads(allowed: bool = True):
+    """
+    Let reads inside the block go to the replica (or force the primary with allowed=False).
+    ContextVar keeps this correct for both threads and async tasks.
+    """
+    token = _replica_reads_allowed.set(allowed)
+    try:
+        yield
+    finally:
+        _replica_reads_allowed.reset(token)
+
+
+def replica_alias() -> str | None:
+    alias = getattr(settings, "REPLICA_DATABASE_ALIAS", "")
+    return alias if alias and alias in settings.DATABASES else None
+
+
+class PrimaryReplicaRouter:
+    replica_app_labels = {"events"}
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label in self.replica_app_labels and replica_reads_allowed():
+            return replica_alias() or PRIMARY_DATABASE_ALIAS
+        return PRIMARY_DATABASE_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY_DATABASE_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica is a copy of the primary, so objects from either may be related.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY_DATABASE_ALIAS
@@ -64,18 +64,27 @@ INSTALLED_APPS = [
     'axes',
 
     # Utilities
-    'django_extensions',
     # 'whitenoise.runserver_nostatic',
 
     # Custom Apps
     'apps.account',
+    'apps.analytics',
     "apps.events.apps.EventsConfig",
     'apps.landing',
     'apps.moderation',
     'apps.pagination',
+    'apps.sponsorship',
 
 ]
 
+# Dev-only apps: not imported by production workers unless asked for.
+ENABLE_DEV_APPS = config('ENABLE_DEV_APPS', default=DEBUG, cast=bool)
+if ENABLE_DEV_APPS:
+    INSTALLED_APPS += ['django_extensions']
+
+# Per-worker warm-up after boot (core/warmup.py, called from gunicorn.conf.py).
+WARMUP_ON_BOOT = config('WARMUP_ON_BOOT', default=True, cast=bool)
+
 SITE_ID = 1
 
 # Authentication Backends
@@ -88,13 +97,18 @@ AUTHENTICATION_BACKENDS = [
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'core.edge_cache.SharedCacheMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.profiling.ProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'axes.middleware.AxesMiddleware',
+    'core.throttling.ThrottleMiddleware',
+    'apps.analytics.middleware.PageViewMiddleware',
+    'core.middleware.ReplicaPinMiddleware',
 ]
 
 # Templates
@@ -114,18 +128,61 @@ TEMPLATES = [
     },
 ]
 
-# Root & WSGI
+# Root, WSGI & ASGI
 ROOT_URLCONF = 'core.urls'
 WSGI_APPLICATION = 'core.wsgi.application'
+ASGI_APPLICATION = 'core.asgi.application'
 
 # Database
 DATABASE_URL = config('DATABASE_URL', default=None)
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is missing.")
+# Under ASGI each request runs the ORM from a worker thread, so long-lived
+# connections pile up per thread. Set DB_CONN_MAX_AGE=0 when serving with uvicorn.
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=900, cast=int)
 DATABASES = {
-    'default': dj_database_url.parse(DATABASE_URL, conn_max_age=900, ssl_require=True)
+    'default': dj_database_url.parse(DATABASE_URL, conn_max_age=DB_CONN_MAX_AGE, ssl_require=True)
 }
 
+# Cache, shared by every worker: region cache generations, throttle buckets and
+# the sponsor rotation are cross-process state, and a per-process cache would
+# leave each worker with its own copy. Redis when REDIS_URL is set (Heroku
+# Redis sets it); otherwise the database cache table (`manage.py createcachetable`).
+REDIS_URL = config('REDIS_URL', default='')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+            # Culling could drop a region generation key; keep well above the working set.
+            'OPTIONS': {'MAX_ENTRIES': 100_000},
+        }
+    }
+
+# Optional read replica for anonymous event listing reads (see core/routers.py).
+# Locally, point DATABASE_REPLICA_URL at a second database (or the same one)
+# to exercise routing with two aliases.
+REPLICA_DATABASE_ALIAS = 'replica'
+DATABASE_REPLICA_URL = config('DATABASE_REPLICA_URL', default=None)
+if DATABASE_REPLICA_URL:
+    DATABASES[REPLICA_DATABASE_ALIAS] = dj_database_url.parse(
+        DATABASE_REPLICA_URL, conn_max_age=DB_CONN_MAX_AGE, ssl_require=True
+    )
+    DATABASES[REPLICA_DATABASE_ALIAS]['TEST'] = {'MIRROR': 'default'}
+
+DATABASE_ROUTERS = ['core.routers.PrimaryReplicaRouter']
+
+# Read-your-writes: after a write, keep this client on the primary for a while.
+REPLICA_PIN_COOKIE = 'db_primary_pin'
+REPLICA_PIN_SECONDS = config('REPLICA_PIN_SECONDS', default=15, cast=int)
+
 # Password Validators
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},  #noqa
@@ -141,6 +198,13 @@ USE_I18N = True
 USE_L10N = True
 USE_TZ = True
 
+# Wall-clock zone for grouping/filtering events by day or week.
+EVENTS_LOCAL_TIME_ZONE = 'Europe/London'
+
+# Lifecycle job (manage.py event_lifecycle): events that started this long ago
+# move from the hot Event table into ArchivedEvent.
+EVENTS_ARCHIVE_AFTER_DAYS = config('EVENTS_ARCHIVE_AFTER_DAYS', default=180, cast=int)
+
 # Static Files
 STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / "staticfiles"
@@ -151,6 +215,9 @@ STORAGES = {
     },
 }
 
+# Admin: above this many rows, unfiltered changelists use the planner's row estimate.
+ADMIN_ESTIMATED_COUNT_THRESHOLD = 100_000
+
 # Default PK
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -171,6 +238,47 @@ AXES_FAILURE_LIMIT = 5
 AXES_COOLOFF_TIME = 1
 AXES_LOCKOUT_TEMPLATE = 'lockout.html'
 AXES_RESET_ON_SUCCESS = True
+AXES_CLIENT_IP_CALLABLE = 'core.client_identity.get_client_ip'
+
+# Client identity: proxies in front of the app that append to X-Forwarded-For
+# (Heroku's router is one). Shared by axes and request throttling.
+TRUSTED_PROXY_COUNT = config('TRUSTED_PROXY_COUNT', default=1 if IS_HEROKU else 0, cast=int)
+
+# Staff request profiling (core.profiling): ?_profile=1 or X-Profile: 1.
+PROFILING_ENABLED = config('PROFILING_ENABLED', default=True, cast=bool)
+PROFILE_DIR = config('PROFILE_DIR', default=str(BASE_DIR / 'profiles'))
+PROFILE_SAMPLE_INTERVAL = config('PROFILE_SAMPLE_INTERVAL', default=0.005, cast=float)
+
+# Page-view analytics (apps.analytics): counted in process memory, flushed as
+# batched upserts at most this often per worker.
+ANALYTICS_ENABLED = config('ANALYTICS_ENABLED', default=True, cast=bool)
+ANALYTICS_FLUSH_SECONDS = config('ANALYTICS_FLUSH_SECONDS', default=60, cast=int)
+
+# Shared-cache headers for anonymous public pages (core.edge_cache), and the
+# backend that purges surrogate keys when events and venues change (core.purge).
+SHARED_CACHE_ENABLED = config('SHARED_CACHE_ENABLED', default=True, cast=bool)
+SHARED_CACHE_MAX_AGE = config('SHARED_CACHE_MAX_AGE', default=300, cast=int)
+SHARED_CACHE_STALE_SECONDS = config('SHARED_CACHE_STALE_SECONDS', default=60, cast=int)
+SHARED_CACHE_PURGE_BACKEND = config('SHARED_CACHE_PURGE_BACKEND', default='core.purge.NullPurgeBackend')
+FASTLY_SERVICE_ID = config('FASTLY_SERVICE_ID', default='')
+FASTLY_API_TOKEN = config('FASTLY_API_TOKEN', default='')
+CLOUDFLARE_ZONE_ID = config('CLOUDFLARE_ZONE_ID', default='')
+CLOUDFLARE_API_TOKEN = config('CLOUDFLARE_API_TOKEN', default='')
+
+# Static pre-rendering (manage.py prerender_site): public pages are written to
+# PRERENDER_ROOT for a front proxy to serve; with PRERENDER_ON_SAVE, pages
+# showing a saved Event or Venue are queued after commit for
+# `prerender_site --pending` to re-render.
+PRERENDER_ROOT = config('PRERENDER_ROOT', default=str(BASE_DIR / 'prerendered'))
+PRERENDER_ON_SAVE = config('PRERENDER_ON_SAVE', default=False, cast=bool)
+
+# Request throttling (core.throttling): token bucket per client IP and route class.
+THROTTLE_ENABLED = config('THROTTLE_ENABLED', default=True, cast=bool)
+THROTTLE_RATES = {
+    'listing': config('THROTTLE_RATE_LISTING', default='60/min'),
+    'detail': config('THROTTLE_RATE_DETAIL', default='120/min'),
+    'feed': config('THROTTLE_RATE_FEED', default='30/min'),
+}
 
 # Logging (Production)
 if not DEBUG:
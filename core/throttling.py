@@ -0,0 +1,200 @@
+"""
+Token-bucket throttling for public, anonymous-heavy routes.
+
+Each (route class, client IP) pair gets a bucket in the default cache holding
+up to N tokens, refilled continuously at N per period. A request spends one
+token; an empty bucket gets a 429 with Retry-After set to when the next token
+arrives. Bursts up to N are allowed, a sustained loop is held to the rate.
+
+The read-modify-write is atomic on the shared caches CACHES configures: a Lua
+script on Redis, and a row lock (SELECT ... FOR UPDATE) on the cache table
+with DatabaseCache. Other backends (LocMemCache in development) do a plain
+get and set, so two concurrent requests can occasionally spend one token.
+
+The cache must be shared by every worker (see CACHES), or the effective
+limit becomes the rate times the number of workers.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.redis import RedisCache
+from django.db import connections, router, transaction
+from django.http import HttpResponse
+from django.urls import Resolver404, resolve
+
+from core.client_identity import get_client_ip
+
+# URL name -> route class (key into settings.THROTTLE_RATES).
+ROUTE_CLASSES = {
+    "upcoming_events": "listing",
+    "past_events": "listing",
+    "listing_partial": "listing",
+    "category_events": "listing",
+    "calendar": "listing",
+    "calendar_month": "listing",
+    "calendar_day": "listing",
+    "near_events": "listing",
+    "venue_list": "listing",
+    "event_detail": "detail",
+    "venue_detail": "detail",
+    "sitemap_index": "feed",
+    "sitemap_month": "feed",
+    "sitemap_venues": "feed",
+}
+
+PERIODS = {"s": 1, "sec": 1, "m": 60, "min": 60, "h": 3600, "hour": 3600}
+
+
+# KEYS[1] bucket; ARGV capacity, refill per second, now, ttl. Returns the wait as a string
+# (Redis truncates Lua numbers to integers).
+BUCKET_SCRIPT = """
+local capacity, refill, now = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = math.min(capacity, (tonumber(state[1]) or capacity) + math.max(0, now - (tonumber(state[2]) or now)) * refill)
+if tokens < 1 then
+    return tostring((1 - tokens) / refill)
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens - 1, 'updated', now)
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return '0'
+"""
+
+
+def parse_rate(rate: str) -> tuple[int, float]:
+    """
+    "60/min" -> (capacity 60, refill 1.0 tokens per second).
+    """
+    count, _, period = rate.partition("/")
+    capacity = int(count)
+    return capacity, capacity / PERIODS[period]
+
+
+def _spend(cache, key: str, capacity: int, refill: float, now: float, ttl: int) -> float:
+    tokens, updated = cache.get(key) or (capacity, now)
+    tokens = min(capacity, tokens + (now - updated) * refill)
+
+    if tokens < 1:
+        return (1 - tokens) / refill
+    cache.set(key, (tokens - 1, now), timeout=ttl)
+    return 0
+
+
+def _spend_redis(cache: RedisCache, key: str, capacity: int, refill: float, now: float, ttl: int) -> float:
+    key = cache.make_and_validate_key(key)
+    client = cache._cache.get_client(key, write=True)
+    return float(client.register_script(BUCKET_SCRIPT)(keys=[key], args=[capacity, refill, now, ttl]))
+
+
+def _spend_locked(cache: DatabaseCache, key: str, capacity: int, refill: float, now: float, ttl: int) -> float:
+    db = router.db_for_write(cache.cache_model_class)
+    connection = connections[db]
+    with transaction.atomic(using=db):
+        # add() creates the row (or replaces an expired one) so there is something to lock.
+        cache.add(key, (capacity, now), timeout=ttl)
+        if connection.features.has_select_for_update:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT cache_key FROM {connection.ops.quote_name(cache._table)} WHERE cache_key = %s FOR UPDATE",
+                    [cache.make_and_validate_key(key)],
+                )
+        return _spend(cache, key, capacity, refill, now, ttl)
+
+
+def take_token(key: str, rate: str, now: float | None = None) -> float:
+    """
+    Spend a token from the bucket at ``key``.
+
+    Returns 0 if the request may proceed, otherwise the seconds until a token
+    is available.
+    """
+    capacity, refill = parse_rate(rate)
+    now = time.time() if now is None else now
+    # Expire once the bucket would have refilled anyway.
+    ttl = math.ceil(capacity / refill)
+
+    # The backend itself, not the django.core.cache.cache proxy, so isinstance works.
+    backend = caches[DEFAULT_CACHE_ALIAS]
+    if isinstance(backend, RedisCache):
+        return _spend_redis(backend, key, capacity, refill, now, ttl)
+    if isinstance(backend, DatabaseCache):
+        return _spend_locked(backend, key, capacity, refill, now, ttl)
+    return _spend(backend, key, capacity, refill, now, ttl)
+
+
+async def atake_token(key: str, rate: str, now: float | None = None) -> float:
+    # Both shared backends block (a database transaction, a script call).
+    return await sync_to_async(take_token)(key, rate, now)
+
+
+def _route_class(request) -> str | None:
+    try:
+        match = resolve(request.path_info)
+    except Resolver404:
+        return None
+    return ROUTE_CLASSES.get(match.url_name)
+
+
+def _too_many_requests(wait: float) -> HttpResponse:
+    response = HttpResponse("Too many requests. Please slow down.", status=429, content_type="text/plain")
+    response["Retry-After"] = str(max(1, math.ceil(wait)))
+    return response
+
+
+class ThrottleMiddleware:
+    """
+    Applies THROTTLE_RATES to the routes in ROUTE_CLASSES.
+
+    Staff sessions are exempt. Anonymous traffic (no session cookie) never
+    loads a user. Must sit after AuthenticationMiddleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        limit = self._limit(request)
+        if limit and not (self._has_session(request) and request.user.is_staff):
+            wait = take_token(*limit)
+            if wait:
+                return _too_many_requests(wait)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        limit = self._limit(request)
+        if limit:
+            exempt = False
+            if self._has_session(request):
+                user = await request.auser()
+                exempt = user.is_staff
+            if not exempt:
+                wait = await atake_token(*limit)
+                if wait:
+                    return _too_many_requests(wait)
+        return await self.get_response(request)
+
+    def _limit(self, request) -> tuple[str, str] | None:
+        if not settings.THROTTLE_ENABLED:
+            return None
+        route_class = _route_class(request)
+        rate = settings.THROTTLE_RATES.get(route_class) if route_class else None
+        if not rate:
+            return None
+        return f"throttle:{route_class}:{get_client_ip(request)}", rate
+
+    def _has_session(self, request) -> bool:
+        return settings.SESSION_COOKIE_NAME in request.COOKIES
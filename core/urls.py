@@ -22,7 +22,11 @@ events_urlconf = ("apps.events.urls", "events")
 urlpatterns = [
     path('admin/', admin.site.urls),
 
+    path("", include("apps.events.sitemap_urls")),
+
     path("", include(("apps.landing.urls", "landing"), namespace="landing")),
+    path("", include("apps.sponsorship.urls")),
+    path("", include("apps.analytics.urls")),
 
     path("oxford/", include(events_urlconf, namespace="oxford")),
     path("oxfordshire/west/", include(events_urlconf, namespace="westoxon")),
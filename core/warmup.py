@@ -0,0 +1,121 @@
+"""
+Worker warm-up, run once per gunicorn worker after it has loaded the app
+(see post_worker_init in gunicorn.conf.py).
+
+Django builds a lot lazily on the first request that needs it: the URL
+resolver for each of the five region namespaces, compiled templates (held by
+the cached template loader), and the first database connection. Doing that
+up front keeps it off the first requests a new worker serves after a deploy
+or a scale-out.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from django.conf import settings
+from django.db import connections
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+from django.urls import get_resolver, reverse
+
+logger = logging.getLogger(__name__)
+
+# Rendered on nearly every public request, per region template prefix.
+HOT_REGION_TEMPLATES = (
+    "upcoming_events.html",
+    "past_events.html",
+    "category_events.html",
+    "event_detail.html",
+)
+HOT_PARTIALS = ("_grid.html", "_card.html")
+HOT_SHARED_TEMPLATES = (
+    "base.html",
+    "_pagination.html",
+    "_partials/_filters.html",
+    "_partials/_related_events.html",
+    "landing/home.html",
+    "sponsorship/_slot.html",
+)
+
+
+def warm_urls() -> int:
+    from apps.events.views import NAMESPACE_TO_REGION
+
+    resolver = get_resolver()
+    # Populates the resolver's reverse dicts and each included namespace's resolver.
+    for namespace in NAMESPACE_TO_REGION:
+        reverse(f"{namespace}:upcoming_events")
+        resolver.resolve(reverse(f"{namespace}:event_detail", kwargs={"slug": "warm-up"}))
+    return len(NAMESPACE_TO_REGION)
+
+
+def warm_templates() -> int:
+    from apps.events.views import NAMESPACE_TO_PARTIALS_PREFIX, NAMESPACE_TO_TEMPLATE_PREFIX
+
+    names = [f"{prefix}/{name}" for prefix in NAMESPACE_TO_TEMPLATE_PREFIX.values() for name in HOT_REGION_TEMPLATES]
+    names += [f"{prefix}/{name}" for prefix in set(NAMESPACE_TO_PARTIALS_PREFIX.values()) for name in HOT_PARTIALS]
+    names += HOT_SHARED_TEMPLATES
+
+    compiled = 0
+    for name in names:
+        try:
+            get_template(name)
+        except TemplateDoesNotExist:
+            logger.warning("warm-up: template %s not found", name)
+            continue
+        compiled += 1
+    return compiled
+
+
+def warm_databases() -> int:
+    """
+    Connect to each configured database once.
+
+    Resolves DNS, completes the TLS and auth handshake and surfaces bad
+    credentials at boot instead of on a visitor's request. The connection is
+    closed again: it belongs to this (main) thread, and under ASGI requests
+    use the ORM from executor threads, so it would only sit idle.
+    """
+    for alias in connections:
+        connection = connections[alias]
+        connection.ensure_connection()
+        connection.close()
+    return len(connections.settings)
+
+
+def warm_sponsors() -> int:
+    """
+    Load the sponsor rotation table into this worker (building it if the cache lost it).
+    """
+    from apps.sponsorship.rotation import rotation
+
+    table = rotation.table() or {}
+    return len(table.get("slots", {}))
+
+
+def warm_up() -> dict[str, float]:
+    timings = {}
+    steps = (
+        ("urls", warm_urls),
+        ("templates", warm_templates),
+        ("databases", warm_databases),
+        ("sponsors", warm_sponsors),
+    )
+    for name, step in steps:
+        started = time.perf_counter()
+        try:
+            count = step()
+        except Exception:
+            # A failed warm-up must never stop the worker from serving.
+            logger.exception("warm-up: %s failed", name)
+            continue
+        timings[name] = time.perf_counter() - started
+        logger.info("warm-up: %s (%d) in %.0f ms", name, count, timings[name] * 1000)
+    return timings
+
+
+def warm_up_if_enabled() -> None:
+    if settings.WARMUP_ON_BOOT:
+        warm_up()
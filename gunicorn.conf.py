@@ -0,0 +1,44 @@
+"""
+Gunicorn config for serving OxPerform over ASGI.
+
+    gunicorn core.asgi:application -c gunicorn.conf.py
+
+Each worker is a uvicorn event loop, so the async event views can hold many
+slow clients open without tying up a thread each. Tune with env vars.
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get("GUNICORN_BIND", f"0.0.0.0:{os.environ.get('PORT', '8000')}")
+
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+
+# Async workers multiplex connections; keep-alive matters for mobile clients.
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "5"))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+
+# Recycle workers now and then to cap slow leaks.
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", "200"))
+
+accesslog = "-"
+errorlog = "-"
+
+
+def post_worker_init(worker):
+    # Runs in each worker once the app (and so Django) is loaded, before it
+    # accepts connections: build URL resolvers, compile hot templates and
+    # connect to the database now rather than on the first requests.
+    from core.warmup import warm_up_if_enabled
+
+    warm_up_if_enabled()
+
+
+def worker_exit(server, worker):
+    # Write out page views counted since the last flush (apps.analytics.buffer).
+    from apps.analytics.buffer import buffer
+
+    buffer.flush()